@@ -73,6 +73,15 @@ class CreateTestSuiteResponse(BaseModel):
     name: str
     description: str
     visibility: Visibility
+    tests: List[Test] = []
+
+
+class CreateTestSuitesRequest(BaseModel):
+    testSuites: List[CreateTestSuiteRequest]
+
+
+class CreateTestSuitesResponse(BaseModel):
+    testSuites: List[CreateTestSuiteResponse]
 
 
 class TestSuiteListResponse(BaseModel):
@@ -144,6 +153,8 @@ class InitEnvResponse(BaseModel):
     service: "Service"
     environmentUrl: str
     expiresAt: Optional[datetime]
+    status: str
+    impersonateUserId: Optional[str] = None
 
     class Config:
         allow_population_by_field_name = True
@@ -203,6 +214,14 @@ class DeleteEnvResponse(BaseModel):
     status: str
 
 
+class DeleteEnvsRequest(BaseModel):
+    environmentIds: List[str]
+
+
+class DeleteEnvsResponse(BaseModel):
+    environments: List[DeleteEnvResponse]
+
+
 class CreateTemplateFromEnvRequest(BaseModel):
     environmentId: str
     service: "Service"
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from src.platform.api.models import (
     TestItem,
     CreateTestsRequest,
+    CreateTestSuiteRequest,
 )
 from src.platform.api.auth import require_resource_access
 from src.platform.db.schema import (
@@ -79,8 +80,10 @@ def resolve_and_validate_test_items(
     return resolved_schemas
 
 
-def to_bulk_test_items(body: CreateTestsRequest) -> list[dict]:
-    """Normalize CreateTestsRequest into list of dicts for bulk creation."""
+def to_bulk_test_items(
+    body: CreateTestsRequest | CreateTestSuiteRequest,
+) -> list[dict]:
+    """Normalize a request's test items into list of dicts for bulk creation."""
     return [
         {
             "name": item.name,
@@ -89,5 +92,5 @@ def to_bulk_test_items(body: CreateTestsRequest) -> list[dict]:
             "expected_output": item.expected_output,
             "impersonateUserId": item.impersonateUserId,
         }
-        for item in body.tests
+        for item in body.tests or []
     ]
@@ -15,6 +15,8 @@ from src.platform.api.models import (
     Test as TestModel,
     CreateTestSuiteRequest,
     CreateTestSuiteResponse,
+    CreateTestSuitesRequest,
+    CreateTestSuitesResponse,
     StartRunRequest,
     StartRunResponse,
     EndRunRequest,
@@ -23,6 +25,8 @@ from src.platform.api.models import (
     DiffRunRequest,
     DiffRunResponse,
     DeleteEnvResponse,
+    DeleteEnvsRequest,
+    DeleteEnvsResponse,
     TestSuiteSummary,
     TestSuiteDetail,
     TemplateEnvironmentSummary,
@@ -86,7 +90,18 @@ async def list_environment_templates(
         return unauthorized()
     template_manager: TemplateManager = request.app.state.templateManager
 
-    templates = template_manager.list_templates(session, principal_id)
+    service = request.query_params.get("service")
+    name = request.query_params.get("name")
+
+    if service:
+        try:
+            service = Service(service).value
+        except ValueError:
+            return bad_request(f"invalid service: {service}")
+
+    templates = template_manager.list_templates(
+        session, principal_id, service=service, name=name
+    )
 
     response = TemplateEnvironmentListResponse(
         templates=[
@@ -246,13 +261,14 @@ async def create_test_suite(request: Request) -> JSONResponse:
         description=body.description,
         visibility=Visibility(body.visibility),
     )
+    created_tests = []
     if body.tests:
         for t in body.tests:
             try:
                 schema = template_manager.resolve_template_schema(
                     session, principal_id, str(t.environmentTemplate)
                 )
-                core_tests.create_test(
+                test = core_tests.create_test(
                     session,
                     principal_id,
                     test_suite_id=str(suite.id),
@@ -269,11 +285,107 @@ async def create_test_suite(request: Request) -> JSONResponse:
             except PermissionError:
                 logger.warning("Unauthorized test creation in suite")
                 return unauthorized()
+            created_tests.append(test)
+        session.flush()
     response = CreateTestSuiteResponse(
         id=suite.id,
         name=suite.name,
         description=suite.description,
         visibility=Visibility(suite.visibility),
+        tests=[
+            TestModel(
+                id=t.id,
+                name=t.name,
+                prompt=t.prompt,
+                type=t.type,
+                expected_output=t.expected_output,
+                created_at=t.created_at,
+                updated_at=t.updated_at,
+            )
+            for t in created_tests
+        ],
+    )
+    return JSONResponse(
+        response.model_dump(mode="json"), status_code=status.HTTP_201_CREATED
+    )
+
+
+async def create_test_suites(request: Request) -> JSONResponse:
+    """Create several suites and their tests, or none if any suite is invalid."""
+    try:
+        body = await parse_request_body(request, CreateTestSuitesRequest)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    session = request.state.db_session
+    try:
+        principal_id = _principal_id_from_request(request)
+    except PermissionError:
+        return unauthorized()
+    core_tests: CoreTestManager = request.app.state.coreTestManager
+    template_manager: TemplateManager = request.app.state.templateManager
+
+    # Validate every suite before creating any: the middleware commits the
+    # session whenever the handler returns, including on a 400.
+    try:
+        resolved = [
+            resolve_and_validate_test_items(
+                session, principal_id, suite_req.tests, None, template_manager
+            )
+            if suite_req.tests
+            else []
+            for suite_req in body.testSuites
+        ]
+    except ValueError as e:
+        logger.warning(f"Bulk test suite creation failed: {e}")
+        return bad_request(str(e))
+    except PermissionError:
+        logger.warning("Unauthorized bulk test suite creation")
+        return unauthorized()
+
+    created = []
+    for suite_req, resolved_schemas in zip(body.testSuites, resolved):
+        suite = core_tests.create_test_suite(
+            session,
+            principal_id,
+            name=suite_req.name,
+            description=suite_req.description,
+            visibility=Visibility(suite_req.visibility),
+        )
+        created_tests = []
+        if suite_req.tests:
+            created_tests = core_tests.create_tests_bulk(
+                session,
+                principal_id,
+                test_suite_id=str(suite.id),
+                items=to_bulk_test_items(suite_req),
+                resolved_schemas=resolved_schemas,
+            )
+        created.append((suite, created_tests))
+    session.flush()
+
+    response = CreateTestSuitesResponse(
+        testSuites=[
+            CreateTestSuiteResponse(
+                id=suite.id,
+                name=suite.name,
+                description=suite.description,
+                visibility=Visibility(suite.visibility),
+                tests=[
+                    TestModel(
+                        id=t.id,
+                        name=t.name,
+                        prompt=t.prompt,
+                        type=t.type,
+                        expected_output=t.expected_output,
+                        created_at=t.created_at,
+                        updated_at=t.updated_at,
+                    )
+                    for t in created_tests
+                ],
+            )
+            for suite, created_tests in created
+        ]
     )
     return JSONResponse(
         response.model_dump(mode="json"), status_code=status.HTTP_201_CREATED
@@ -429,6 +541,8 @@ async def init_environment(request: Request) -> JSONResponse:
         expiresAt=result.expires_at,
         schemaName=result.schema_name,
         service=Service(service),
+        status=result.status,
+        impersonateUserId=result.impersonate_user_id,
     )
     return JSONResponse(
         response.model_dump(mode="json"), status_code=status.HTTP_201_CREATED
@@ -784,6 +898,57 @@ async def delete_environment(request: Request) -> JSONResponse:
     return JSONResponse(response.model_dump(mode="json"))
 
 
+async def delete_environments(request: Request) -> JSONResponse:
+    try:
+        body = await parse_request_body(request, DeleteEnvsRequest)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    session = request.state.db_session
+    try:
+        principal_id = _principal_id_from_request(request)
+    except PermissionError:
+        return unauthorized()
+
+    env_uuids = []
+    for env_id in body.environmentIds:
+        env_uuid = parse_uuid(env_id)
+        if env_uuid is None:
+            return bad_request(f"invalid environment id: {env_id}")
+        env_uuids.append(env_uuid)
+
+    envs = (
+        session.query(RunTimeEnvironment)
+        .filter(RunTimeEnvironment.id.in_(env_uuids))
+        .all()
+    )
+    found = {env.id for env in envs}
+    missing = [str(env_uuid) for env_uuid in env_uuids if env_uuid not in found]
+    if missing:
+        return not_found(f"environment not found: {', '.join(missing)}")
+
+    try:
+        for env in envs:
+            require_resource_access(principal_id, env.created_by)
+    except PermissionError:
+        logger.warning("Unauthorized environment access in bulk delete")
+        return unauthorized()
+
+    core: CoreIsolationEngine = request.app.state.coreIsolationEngine
+    core.environment_handler.drop_schemas([env.schema for env in envs])
+    core.environment_handler.mark_environments_status(
+        [str(env.id) for env in envs], "deleted"
+    )
+
+    response = DeleteEnvsResponse(
+        environments=[
+            DeleteEnvResponse(environmentId=env_id, status="deleted")
+            for env_id in body.environmentIds
+        ]
+    )
+    return JSONResponse(response.model_dump(mode="json"))
+
+
 async def health_check(request: Request) -> JSONResponse:
     time = datetime.now()
     return JSONResponse(
@@ -799,6 +964,7 @@ routes = [
     Route("/health", health_check, methods=["GET"]),
     Route("/testSuites", list_test_suites, methods=["GET"]),
     Route("/testSuites", create_test_suite, methods=["POST"]),
+    Route("/testSuites/bulk", create_test_suites, methods=["POST"]),
     Route("/testSuites/{suite_id}", get_test_suite, methods=["GET"]),
     Route("/testSuites/{suite_id}/tests", create_tests_in_suite, methods=["POST"]),
     Route("/templates", list_environment_templates, methods=["GET"]),
@@ -814,5 +980,6 @@ routes = [
     Route("/results/{run_id}", get_run_result, methods=["GET"]),
     Route("/diffRun", diff_run, methods=["POST"]),
     Route("/env/{env_id}", delete_environment, methods=["DELETE"]),
+    Route("/deleteEnvs", delete_environments, methods=["POST"]),
     Route("/tests/{test_id}", get_test, methods=["GET"]),
 ]
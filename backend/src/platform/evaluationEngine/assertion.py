@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Literal, Mapping, Sequence
 import re
 
@@ -28,6 +29,13 @@ def _get(row: Mapping[str, Any], key: str) -> Any:
     return cur
 
 
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a `regex` predicate once, instead of going through re's
+    shared cache on every row."""
+    return re.compile(pattern)
+
+
 def _matches_predicate(value: Any, pred: Mapping[str, Any]) -> bool:
     if not pred:
         return True
@@ -91,7 +99,10 @@ def _matches_predicate(value: Any, pred: Mapping[str, Any]) -> bool:
         )
     if op == "regex":
         try:
-            return isinstance(value, str) and re.search(expected, value) is not None
+            return (
+                isinstance(value, str)
+                and _compile_regex(expected).search(value) is not None
+            )
         except re.error:
             return False
     if op == "gt":
@@ -135,11 +146,29 @@ def _row_matches_where(row: Mapping[str, Any], where: Mapping[str, Any]) -> bool
     return True
 
 
+def _rows_by_table(
+    diff: Mapping[str, Sequence[Mapping[str, Any]]],
+) -> dict[Bucket, dict[str, list[Mapping[str, Any]]]]:
+    """Group each diff bucket's rows by `__table__` in a single pass."""
+    grouped: dict[Bucket, dict[str, list[Mapping[str, Any]]]] = {}
+    for bucket in ("inserts", "deletes", "updates"):
+        tables: dict[str, list[Mapping[str, Any]]] = {}
+        for r in diff.get(bucket, []) or []:
+            tables.setdefault(r.get("__table__"), []).append(r)
+        grouped[bucket] = tables
+    return grouped
+
+
 def _changed_keys(
     before: Mapping[str, Any], after: Mapping[str, Any], ignores: set[str]
 ) -> set[str]:
-    keys = set(before.keys()) | set(after.keys())
-    return {k for k in keys if k not in ignores and before.get(k) != after.get(k)}
+    if before.keys() == after.keys():
+        # Update rows normally carry the same columns on both sides.
+        changed = {k for k, v in before.items() if after[k] != v}
+    else:
+        keys = before.keys() | after.keys()
+        changed = {k for k in keys if before.get(k) != after.get(k)}
+    return changed - ignores if ignores else changed
 
 
 class AssertionEngine:
@@ -152,40 +181,30 @@ class AssertionEngine:
         failed_indexes: set[int] = set()
 
         assertions_list = list(self.spec.get("assertions", []))
+        by_table = _rows_by_table(diff)
         for idx, a in enumerate(assertions_list, start=1):
             diff_type: Kind = a["diff_type"]
             entity = a["entity"]
             where = a.get("where", {})
-            ignore = _get_ignore_sets(self.spec, entity, a.get("ignore", []))
 
             if diff_type == "added":
-                rows = [
-                    r
-                    for r in (diff.get("inserts", []) or [])
-                    if r.get("__table__") == entity
-                ]
+                rows = by_table["inserts"].get(entity, [])
                 matched = [r for r in rows if _row_matches_where(r, where)]
                 self._check_count(
                     a, len(matched), failures, failed_indexes, idx, entity, diff_type
                 )
 
             elif diff_type == "removed":
-                rows = [
-                    r
-                    for r in (diff.get("deletes", []) or [])
-                    if r.get("__table__") == entity
-                ]
+                rows = by_table["deletes"].get(entity, [])
                 matched = [r for r in rows if _row_matches_where(r, where)]
                 self._check_count(
                     a, len(matched), failures, failed_indexes, idx, entity, diff_type
                 )
 
             elif diff_type == "changed":
-                updates = [
-                    r
-                    for r in (diff.get("updates", []) or [])
-                    if r.get("__table__") == entity
-                ]
+                updates = by_table["updates"].get(entity, [])
+                # Only field-level change checks consult the ignore lists.
+                ignore = _get_ignore_sets(self.spec, entity, a.get("ignore", []))
                 matched_updates = []
                 for r in updates:
                     before = r.get("before", {})
@@ -239,19 +258,18 @@ class AssertionEngine:
             elif diff_type == "unchanged":
                 ins = [
                     r
-                    for r in (diff.get("inserts", []) or [])
-                    if r.get("__table__") == entity and _row_matches_where(r, where)
+                    for r in by_table["inserts"].get(entity, [])
+                    if _row_matches_where(r, where)
                 ]
                 dels = [
                     r
-                    for r in (diff.get("deletes", []) or [])
-                    if r.get("__table__") == entity and _row_matches_where(r, where)
+                    for r in by_table["deletes"].get(entity, [])
+                    if _row_matches_where(r, where)
                 ]
                 ups = [
                     r
-                    for r in (diff.get("updates", []) or [])
-                    if r.get("__table__") == entity
-                    and (
+                    for r in by_table["updates"].get(entity, [])
+                    if (
                         _row_matches_where(r.get("after", {}), where)
                         or _row_matches_where(r.get("before", {}), where)
                     )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Mapping
 import json
+from functools import lru_cache
 from pathlib import Path
-from jsonschema import validate as jsonschema_validate
+from jsonschema import validators
+from jsonschema.exceptions import best_match
 
 
 SCHEMA_PATH = Path(__file__).with_name("dsl_schema.json")
@@ -14,16 +16,58 @@ def _load_schema(schema_path: str | Path | None = None) -> dict:
     return json.loads(p.read_text(encoding="utf-8"))
 
 
+@lru_cache(maxsize=None)
+def _schema_validator(schema_path: Path):
+    """Load, check and build the validator for a schema file once per process."""
+    schema = _load_schema(schema_path)
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
 def _as_predicate(value: Any) -> dict:
     if isinstance(value, dict):
         return value
     return {"eq": value}
 
 
+# Relative cost of evaluating each predicate operator against one value.
+# Unknown operators sort last.
+_PREDICATE_COST = {
+    "eq": 0,
+    "ne": 0,
+    "not_eq": 0,
+    "exists": 0,
+    "in": 1,
+    "not_in": 1,
+    "gt": 1,
+    "gte": 1,
+    "lt": 1,
+    "lte": 1,
+    "starts_with": 2,
+    "ends_with": 2,
+    "contains": 3,
+    "not_contains": 3,
+    "has_any": 3,
+    "has_all": 3,
+    "i_starts_with": 4,
+    "i_ends_with": 4,
+    "i_contains": 4,
+    "regex": 5,
+}
+
+
+def _predicate_cost(pred: Mapping[str, Any]) -> int:
+    return max((_PREDICATE_COST.get(op, 6) for op in pred), default=0)
+
+
 def _normalize_where(where: Mapping[str, Any] | None) -> dict:
+    """Normalize shorthand values and order fields cheapest-first, so that
+    row matching (which stops at the first failing field) does less work."""
     if not where:
         return {}
-    return {field: _as_predicate(pred) for field, pred in where.items()}
+    preds = {field: _as_predicate(pred) for field, pred in where.items()}
+    return dict(sorted(preds.items(), key=lambda item: _predicate_cost(item[1])))
 
 
 def _normalize_expected_changes(changes: Mapping[str, Any] | None) -> dict:
@@ -45,10 +89,16 @@ def _normalize_expected_changes(changes: Mapping[str, Any] | None) -> dict:
 
 class DSLCompiler:
     def __init__(self, schema_path: str | Path | None = None):
-        self.schema = _load_schema(schema_path)
+        path = Path(schema_path).resolve() if schema_path else SCHEMA_PATH
+        self._validator = _schema_validator(path)
+        self.schema = self._validator.schema
 
     def validate(self, spec: Mapping[str, Any]) -> None:
-        jsonschema_validate(instance=spec, schema=self.schema)
+        # Same error selection as jsonschema.validate, without re-checking
+        # the schema and rebuilding the validator on every call.
+        error = best_match(self._validator.iter_errors(spec))
+        if error is not None:
+            raise error
 
     def normalize(self, spec: Mapping[str, Any]) -> dict:
         normalized: dict[str, Any] = dict(spec)
@@ -1,4 +1,5 @@
 import logging
+import os
 from .session import SessionManager
 from .environment import EnvironmentHandler
 from .models import EnvironmentResponse
@@ -9,15 +10,23 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Pre-cloned schemas kept per template; create_environment claims one with a
+# rename before falling back to a full clone. 0 disables the pool. Only the
+# test suite fills the pool (via prewarm); the API server never tops it up, so
+# leave this at 0 there unless a process sharing the database prewarms.
+WARM_POOL_SIZE = int(os.getenv("AGENTDIFF_WARM_POOL_SIZE", "0"))
+
 
 class CoreIsolationEngine:
     def __init__(
         self,
         sessions: SessionManager,
         environment_handler: EnvironmentHandler,
+        warm_pool_size: int = WARM_POOL_SIZE,
     ):
         self.sessions = sessions
         self.environment_handler = environment_handler
+        self.warm_pool_size = warm_pool_size
 
     def create_environment(
         self,
@@ -36,14 +45,20 @@ class CoreIsolationEngine:
         environment_id = evn_uuid.hex
         environment_schema = f"state_{environment_id}"
 
-        self.environment_handler.create_schema(environment_schema)
-        self.environment_handler.migrate_schema(template_schema, environment_schema)
-        self.environment_handler.seed_data_from_template(
-            template_schema, environment_schema
-        )
+        if not (
+            self.warm_pool_size
+            and self.environment_handler.checkout_warm_schema(
+                template_schema, environment_schema
+            )
+        ):
+            self.environment_handler.create_schema(environment_schema)
+            self.environment_handler.migrate_schema(template_schema, environment_schema)
+            self.environment_handler.seed_data_from_template(
+                template_schema, environment_schema
+            )
 
         expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
-        self.environment_handler.set_runtime_environment(
+        status = self.environment_handler.set_runtime_environment(
             environment_id=environment_id,
             schema=environment_schema,
             expires_at=expires_at,
@@ -60,11 +75,24 @@ class CoreIsolationEngine:
         return EnvironmentResponse(
             environment_id=environment_id,
             schema_name=environment_schema,
+            status=status,
             expires_at=expires_at,
             impersonate_user_id=impersonate_user_id,
             impersonate_email=impersonate_email,
         )
 
+    def prewarm(self, template_schema: str, count: int | None = None) -> list[str]:
+        """
+        Top up the warm pool for `template_schema` to `count` schemas
+        (defaults to warm_pool_size). Returns the names of the clones created.
+        """
+        target = self.warm_pool_size if count is None else count
+        missing = target - self.environment_handler.count_warm_schemas(template_schema)
+        return [
+            self.environment_handler.create_warm_schema(template_schema)
+            for _ in range(missing)
+        ]
+
     def create_template_from_environment(
         self,
         *,
@@ -1,7 +1,8 @@
 import logging
+import os
 from datetime import datetime
 from typing import Iterable
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import MetaData, text
 
@@ -11,10 +12,43 @@ from .session import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Opt-in: reuse reflected template metadata across clones. The cache cannot see
+# templates ALTERed in place (e.g. by a migration), so it is off by default.
+FAST_CLONE = os.getenv("AGENTDIFF_FAST_CLONE") == "1"
+
 
 class EnvironmentHandler:
-    def __init__(self, session_manager: SessionManager):
+    def __init__(self, session_manager: SessionManager, fast_clone: bool = FAST_CLONE):
         self.session_manager = session_manager
+        self.fast_clone = fast_clone
+        self._template_metadata: dict[tuple[str, int], MetaData] = {}
+
+    def _reflect_template(self, template_schema: str) -> MetaData:
+        """
+        Reflect a template schema's tables.
+
+        With fast_clone the result is cached per (schema, namespace oid), so a
+        template that is dropped and re-seeded gets reflected again; in-place
+        DDL on a template is not detected.
+        """
+        engine = self.session_manager.base_engine
+        if not self.fast_clone:
+            meta = MetaData()
+            meta.reflect(bind=engine, schema=template_schema)
+            return meta
+
+        with engine.connect() as conn:
+            oid = conn.execute(
+                text("SELECT oid FROM pg_namespace WHERE nspname = :schema"),
+                {"schema": template_schema},
+            ).scalar()
+        key = (template_schema, oid)
+        meta = self._template_metadata.get(key)
+        if meta is None:
+            meta = MetaData()
+            meta.reflect(bind=engine, schema=template_schema)
+            self._template_metadata[key] = meta
+        return meta
 
     def schema_exists(self, schema: str) -> bool:
         with self.session_manager.base_engine.begin() as conn:
@@ -37,8 +71,7 @@ class EnvironmentHandler:
 
     def migrate_schema(self, template_schema: str, target_schema: str) -> None:
         engine = self.session_manager.base_engine
-        meta = MetaData()
-        meta.reflect(bind=engine, schema=template_schema)
+        meta = self._reflect_template(template_schema)
         translated = engine.execution_options(
             schema_translate_map={template_schema: target_schema}
         )
@@ -100,11 +133,9 @@ class EnvironmentHandler:
         tables_order: list[str] | None = None,
     ) -> None:
         engine = self.session_manager.base_engine
+        meta = self._reflect_template(template_schema)
+        ordered = [t.name for t in meta.sorted_tables]
         with engine.begin() as conn:
-            meta = MetaData()
-            meta.reflect(bind=engine, schema=template_schema)
-            ordered = [t.name for t in meta.sorted_tables]
-
             # Temporarily disable triggers to handle circular foreign key dependencies
             conn.execute(text('SET session_replication_role = replica'))
 
@@ -121,6 +152,79 @@ class EnvironmentHandler:
 
             self._reset_sequences(conn, target_schema, ordered)
 
+    def _warm_tag(self, conn, template_schema: str) -> str | None:
+        """Schema comment identifying clones of the template's current oid."""
+        oid = conn.execute(
+            text("SELECT oid FROM pg_namespace WHERE nspname = :schema"),
+            {"schema": template_schema},
+        ).scalar()
+        if oid is None:
+            return None
+        return f"warm/{template_schema}/{oid}"
+
+    def _list_warm_schemas(self, conn, template_schema: str) -> list[str]:
+        tag = self._warm_tag(conn, template_schema)
+        if tag is None:
+            return []
+        rows = conn.execute(
+            text(
+                """
+                SELECT nspname
+                FROM pg_namespace
+                WHERE nspname LIKE 'warm\\_%'
+                  AND obj_description(oid, 'pg_namespace') = :tag
+                ORDER BY nspname
+                """
+            ),
+            {"tag": tag},
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def count_warm_schemas(self, template_schema: str) -> int:
+        with self.session_manager.base_engine.connect() as conn:
+            return len(self._list_warm_schemas(conn, template_schema))
+
+    def create_warm_schema(self, template_schema: str) -> str:
+        """
+        Clone a template into a spare schema that create_environment can later
+        claim with a rename instead of copying the template again.
+        """
+        warm_schema = f"warm_{uuid4().hex}"
+        self.create_schema(warm_schema)
+        self.migrate_schema(template_schema, warm_schema)
+        self.seed_data_from_template(template_schema, warm_schema)
+        with self.session_manager.base_engine.begin() as conn:
+            tag = self._warm_tag(conn, template_schema)
+            conn.execute(text(f'COMMENT ON SCHEMA "{warm_schema}" IS \'{tag}\''))
+        logger.debug(f"Created warm schema {warm_schema} from {template_schema}")
+        return warm_schema
+
+    def checkout_warm_schema(self, template_schema: str, target_schema: str) -> bool:
+        """
+        Rename a warm clone of `template_schema` to `target_schema`.
+
+        Returns False when the pool is empty. Candidates claimed concurrently
+        by another process fail to rename and are skipped.
+        """
+        engine = self.session_manager.base_engine
+        with engine.connect() as conn:
+            candidates = self._list_warm_schemas(conn, template_schema)
+        for warm_schema in candidates:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            f'ALTER SCHEMA "{warm_schema}" RENAME TO "{target_schema}"'
+                        )
+                    )
+                    conn.execute(text(f'COMMENT ON SCHEMA "{target_schema}" IS NULL'))
+            except Exception as e:
+                logger.debug(f"Warm schema {warm_schema} unavailable: {e}")
+                continue
+            logger.debug(f"Claimed warm schema {warm_schema} as {target_schema}")
+            return True
+        return False
+
     def set_runtime_environment(
         self,
         environment_id: str,
@@ -132,7 +236,7 @@ class EnvironmentHandler:
         template_id: str | None = None,
         impersonate_user_id: str | None = None,
         impersonate_email: str | None = None,
-    ) -> None:
+    ) -> str:
         env_uuid = self._to_uuid(environment_id)
         template_uuid = self._to_uuid(template_id) if template_id else None
         with self.session_manager.with_meta_session() as s:
@@ -151,6 +255,7 @@ class EnvironmentHandler:
             if impersonate_email is not None:
                 rte.impersonate_email = impersonate_email
             s.add(rte)
+            return rte.status
 
     def get_environment(self, environment_id: str) -> RunTimeEnvironment | None:
         env_uuid = self._to_uuid(environment_id)
@@ -213,6 +318,30 @@ class EnvironmentHandler:
             logger.error(f"Failed to drop schema {schema}: {e}")
             raise
 
+    def drop_schemas(self, schemas: list[str]) -> None:
+        if not schemas:
+            return
+        names = ", ".join(f'"{schema}"' for schema in schemas)
+        try:
+            with self.session_manager.base_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {names} CASCADE"))
+            logger.info(f"Dropped schemas {', '.join(schemas)}")
+        except Exception as e:
+            logger.error(f"Failed to drop schemas {', '.join(schemas)}: {e}")
+            raise
+
+    def mark_environments_status(
+        self, environment_ids: list[str], status: str
+    ) -> None:
+        env_uuids = [self._to_uuid(env_id) for env_id in environment_ids]
+        with self.session_manager.with_meta_session() as s:
+            s.query(RunTimeEnvironment).filter(
+                RunTimeEnvironment.id.in_(env_uuids)
+            ).update(
+                {"status": status, "updated_at": datetime.now()},
+                synchronize_session=False,
+            )
+
     def mark_environment_status(self, environment_id: str, status: str) -> None:
         env_uuid = self._to_uuid(environment_id)
         with self.session_manager.with_meta_session() as s:
@@ -24,6 +24,7 @@ class InitEnvResult(BaseModel):
 class EnvironmentResponse(BaseModel):
     environment_id: str
     schema_name: str
+    status: str
     expires_at: datetime
     impersonate_user_id: Optional[str] = None
     impersonate_email: Optional[str] = None
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -26,7 +26,12 @@ class TemplateManager:
             return None
 
     def list_templates(
-        self, session: Session, principal_id: str
+        self,
+        session: Session,
+        principal_id: str,
+        *,
+        service: Optional[str] = None,
+        name: Optional[str] = None,
     ) -> List[TemplateEnvironment]:
         query = session.query(TemplateEnvironment).filter(
             or_(
@@ -35,6 +40,13 @@ class TemplateManager:
             )
         )
 
+        # (service, name) is the prefix of uq_environments_identity
+        if service:
+            query = query.filter(TemplateEnvironment.service == service)
+
+        if name:
+            query = query.filter(TemplateEnvironment.name == name)
+
         all_templates = query.order_by(TemplateEnvironment.created_at.desc()).all()
 
         # Deduplicate by (service, name)
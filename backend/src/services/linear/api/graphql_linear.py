@@ -1,7 +1,216 @@
+from collections import OrderedDict
+from functools import lru_cache
+from uuid import UUID
+
+import orjson
 from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.exceptions import HttpBadRequestError
+from graphql import DocumentNode, GraphQLError, OperationType, parse, validate
+from sqlalchemy import event
+from src.platform.api.responses import ORJSONResponse
 from src.platform.isolationEngine.core import CoreIsolationEngine
 from src.platform.evaluationEngine.core import CoreEvaluationEngine
 
+# Root fields whose results only change when a mutation runs in the same
+# environment, so their responses can be replayed until then.
+CACHEABLE_ROOT_FIELDS = frozenset({"viewer", "teams"})
+RESPONSE_CACHE_SIZE = 1024
+# Environments whose mutation counters are tracked; least recently written
+# environments (usually deleted ones) are forgotten first.
+VERSION_TABLE_SIZE = 1024
+DOCUMENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def parse_document(query: str) -> DocumentNode:
+    """Parse a query string, sharing one AST between identical queries."""
+    return parse(query)
+
+
+def parse_query(context_value, data) -> DocumentNode:
+    """Ariadne query_parser backed by the parse_document cache."""
+    return parse_document(data["query"])
+
+
+def validate_document(
+    schema, document_ast, rules=None, max_errors=None, type_info=None
+):
+    """
+    Ariadne query_validator that validates each document once per schema.
+
+    Documents come from parse_document, so repeated query strings share a node
+    and the validation result is memoized on it. A rebuilt schema is a new key,
+    so results never leak across schema versions.
+    """
+    key = (schema, tuple(rules) if rules else None, max_errors)
+    results = getattr(document_ast, "_validation_results", None)
+    if results is None:
+        results = document_ast._validation_results = {}
+    if key not in results:
+        results[key] = validate(
+            schema,
+            document_ast,
+            rules=rules,
+            max_errors=max_errors,
+            type_info=type_info,
+        )
+    return results[key]
+
+
+def _classify_operation(data):
+    """
+    Return (operation_type, root_field_names) for a GraphQL request payload.
+
+    Returns (None, None) when the operation cannot be determined up front
+    (invalid syntax, ambiguous operation, fragments at the root); execution
+    then takes the normal path and reports any errors itself.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("query"), str):
+        return None, None
+
+    try:
+        document = parse_document(data["query"])
+    except GraphQLError:
+        return None, None
+
+    operation_name = data.get("operationName")
+    operations = [
+        definition
+        for definition in document.definitions
+        if definition.kind == "operation_definition"
+        and (
+            operation_name is None
+            or (definition.name and definition.name.value == operation_name)
+        )
+    ]
+    if len(operations) != 1:
+        return None, None
+
+    operation = operations[0]
+    root_fields = set()
+    for selection in operation.selection_set.selections:
+        if selection.kind != "field":
+            return operation.operation, None
+        root_fields.add(selection.name.value)
+    return operation.operation, root_fields
+
+
+def _environment_key(request) -> str | None:
+    """
+    Canonical environment id for a request.
+
+    The path segment may be a dashed or hex UUID; both must share a version
+    counter and cache entries.
+    """
+    env_id = getattr(request.state, "environment_id", None)
+    if env_id is None:
+        return None
+    try:
+        return UUID(str(env_id)).hex
+    except ValueError:
+        return str(env_id)
+
+
+class LinearGraphQLHTTPHandler(GraphQLHTTPHandler):
+    """
+    HTTP handler that replays responses for idempotent seed-data queries.
+
+    Responses are keyed on environment, impersonated user, query text,
+    operation name and variables. Each environment carries a version counter
+    that a mutation bumps both when it starts and once its session commits,
+    so a read that raced the write is never replayed after the commit.
+
+    The cache and counters live in process memory, so this assumes a single
+    worker process: a mutation served by one uvicorn worker does not
+    invalidate replies cached by another.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._responses: OrderedDict[tuple, tuple] = OrderedDict()
+        self._versions: OrderedDict[str, int] = OrderedDict()
+
+    def _bump_version(self, env_id: str) -> None:
+        self._versions[env_id] = self._versions.get(env_id, 0) + 1
+        self._versions.move_to_end(env_id)
+        if len(self._versions) > VERSION_TABLE_SIZE:
+            evicted, _ = self._versions.popitem(last=False)
+            # Its counter restarts from 0, so drop replies cached under it.
+            for key in [k for k in self._responses if k[0] == evicted]:
+                del self._responses[key]
+
+    async def extract_data_from_json_request(self, request):
+        try:
+            return orjson.loads(await request.body())
+        except orjson.JSONDecodeError as ex:
+            raise HttpBadRequestError("Request body is not a valid JSON") from ex
+
+    async def create_json_response(self, request, result, success):
+        status_code = 200 if success else 400
+        return ORJSONResponse(result, status_code=status_code)
+
+    async def execute_graphql_query(
+        self, request, data, *, context_value=None, query_document=None
+    ):
+        operation_type, root_fields = _classify_operation(data)
+        env_id = _environment_key(request)
+
+        if operation_type == OperationType.MUTATION and env_id:
+            self._bump_version(env_id)
+            # IsolationMiddleware commits after the response is built; bump
+            # again then so reads that ran against pre-commit data are orphaned.
+            session = getattr(request.state, "db_session", None)
+            if session is not None:
+                event.listen(
+                    session,
+                    "after_commit",
+                    lambda _session: self._bump_version(env_id),
+                    once=True,
+                )
+
+        cacheable = (
+            env_id is not None
+            and operation_type == OperationType.QUERY
+            and root_fields
+            and root_fields <= CACHEABLE_ROOT_FIELDS
+        )
+        if not cacheable:
+            return await super().execute_graphql_query(
+                request,
+                data,
+                context_value=context_value,
+                query_document=query_document,
+            )
+
+        version = self._versions.get(env_id, 0)
+        key = (
+            env_id,
+            version,
+            getattr(request.state, "impersonate_user_id", None),
+            data["query"],
+            data.get("operationName"),
+            orjson.dumps(data.get("variables"), option=orjson.OPT_SORT_KEYS),
+        )
+        cached = self._responses.get(key)
+        if cached is not None:
+            self._responses.move_to_end(key)
+            return cached
+
+        success, result = await super().execute_graphql_query(
+            request, data, context_value=context_value, query_document=query_document
+        )
+        # Skip storing if a mutation started while this query was running.
+        if (
+            success
+            and not result.get("errors")
+            and self._versions.get(env_id, 0) == version
+        ):
+            self._responses[key] = (success, result)
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return success, result
+
 
 class LinearGraphQL(GraphQL):
     """
@@ -19,7 +228,13 @@ class LinearGraphQL(GraphQL):
         coreIsolationEngine: CoreIsolationEngine,
         coreEvaluationEngine: CoreEvaluationEngine,
     ):
-        super().__init__(schema, context_value=self._build_context)
+        super().__init__(
+            schema,
+            context_value=self._build_context,
+            query_parser=parse_query,
+            query_validator=validate_document,
+            http_handler=LinearGraphQLHTTPHandler(),
+        )
         self.coreIsolationEngine = coreIsolationEngine
         self.coreEvaluationEngine = coreEvaluationEngine
 
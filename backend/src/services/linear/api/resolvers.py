@@ -1,5 +1,5 @@
 from ariadne import QueryType, MutationType
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import or_, and_, select
 from src.services.linear.database.schema import (
     Issue,
@@ -230,6 +230,47 @@ def apply_pagination(items, after, before, first, last, order_field="createdAt")
     return {"edges": edges, "nodes": items, "pageInfo": page_info}
 
 
+def selected_field_names(info):
+    """
+    Collect the names of every field requested below the current field.
+
+    Walks the selection set (including fragments) so list resolvers can
+    decide which relationships are worth batch-loading up front.
+    """
+    names = set()
+    stack = [node.selection_set for node in info.field_nodes if node.selection_set]
+    while stack:
+        selection_set = stack.pop()
+        for selection in selection_set.selections:
+            if selection.kind == "fragment_spread":
+                fragment = info.fragments.get(selection.name.value)
+                if fragment:
+                    stack.append(fragment.selection_set)
+                continue
+            if selection.kind == "field":
+                names.add(selection.name.value)
+            if selection.selection_set:
+                stack.append(selection.selection_set)
+    return names
+
+
+def issue_load_options(info):
+    """
+    Build eager-load options for the Issue relationships a query selects.
+
+    Resolving `labels` or `team` per issue would otherwise issue one lazy
+    SELECT per row; selectinload batches each relationship into a single
+    IN query for the whole page.
+    """
+    selected = selected_field_names(info)
+    options = []
+    if "labels" in selected:
+        options.append(selectinload(Issue.labels))
+    if "team" in selected:
+        options.append(selectinload(Issue.team))
+    return options
+
+
 # Resolver functions will be added here as queries are implemented
 @query.field("issue")
 def resolve_issue(obj, info, id: str):
@@ -844,7 +885,7 @@ def resolve_searchIssues(
         order_field = "updatedAt"
 
     # Build base query for issues
-    base_query = session.query(Issue)
+    base_query = session.query(Issue).options(*issue_load_options(info))
 
     # Apply search term filter (search in title and description)
     if term:
@@ -1572,7 +1613,7 @@ def resolve_issues(
         order_field = "updatedAt"
 
     # Build base query
-    base_query = session.query(Issue)
+    base_query = session.query(Issue).options(*issue_load_options(info))
 
     # Apply archived filter
     if not includeArchived:
@@ -2392,8 +2433,9 @@ def resolve_team(obj, info, id: str):
     """
     session: Session = info.context["session"]
 
-    # Query for the team by id
-    team = session.query(Team).filter(Team.id == id).first()
+    # Primary-key lookup: served from the session identity map when the
+    # team was already loaded earlier in this request
+    team = session.get(Team, id)
 
     if not team:
         raise Exception(f"Team with id '{id}' not found")
@@ -9580,6 +9622,45 @@ def resolve_issueUpdate(obj, info, **kwargs):
         raise Exception(f"Failed to update issue: {str(e)}")
 
 
+def get_default_state_id(info, team_id: str) -> str:
+    """
+    Return the team's default (Backlog) workflow state id.
+
+    The lookup is memoized on the GraphQL context, so it lives only for the
+    current request: batch mutations creating many issues for the same team
+    hit the database once per team instead of once per issue.
+    """
+    memo = info.context.setdefault("default_state_ids", {})
+    if team_id in memo:
+        return memo[team_id]
+
+    session: Session = info.context["session"]
+
+    # Query for the team's Backlog state (position 1.0)
+    state = (
+        session.query(WorkflowState)
+        .filter(WorkflowState.teamId == team_id)
+        .filter(WorkflowState.position == 1.0)
+        .first()
+    )
+    if not state:
+        # Fallback: get any state for this team (shouldn't happen with auto-creation)
+        state = (
+            session.query(WorkflowState)
+            .filter(WorkflowState.teamId == team_id)
+            .order_by(WorkflowState.position)
+            .first()
+        )
+    if not state:
+        raise Exception(
+            f"No workflow states found for team {team_id}. "
+            "Workflow states should be created automatically when a team is created."
+        )
+
+    memo[team_id] = state.id
+    return state.id
+
+
 @mutation.field("issueCreate")
 def resolve_issueCreate(obj, info, **kwargs):
     """
@@ -9620,30 +9701,7 @@ def resolve_issueCreate(obj, info, **kwargs):
 
         # If stateId is not provided, set it to the team's default Backlog state
         if not state_id:
-            # Query for the team's Backlog state (position 1.0)
-            backlog_state = (
-                session.query(WorkflowState)
-                .filter(WorkflowState.teamId == team_id)
-                .filter(WorkflowState.position == 1.0)
-                .first()
-            )
-            if backlog_state:
-                state_id = backlog_state.id
-            else:
-                # Fallback: get any state for this team (shouldn't happen with auto-creation)
-                fallback_state = (
-                    session.query(WorkflowState)
-                    .filter(WorkflowState.teamId == team_id)
-                    .order_by(WorkflowState.position)
-                    .first()
-                )
-                if fallback_state:
-                    state_id = fallback_state.id
-                else:
-                    raise Exception(
-                        f"No workflow states found for team {team_id}. "
-                        "Workflow states should be created automatically when a team is created."
-                    )
+            state_id = get_default_state_id(info, team_id)
 
         description = input_data.get("description")
         description_data = input_data.get("descriptionData")
@@ -9829,30 +9887,7 @@ def resolve_issueBatchCreate(obj, info, **kwargs):
 
             # If stateId is not provided, set it to the team's default Backlog state
             if not state_id:
-                # Query for the team's Backlog state (position 1.0)
-                backlog_state = (
-                    session.query(WorkflowState)
-                    .filter(WorkflowState.teamId == team_id)
-                    .filter(WorkflowState.position == 1.0)
-                    .first()
-                )
-                if backlog_state:
-                    state_id = backlog_state.id
-                else:
-                    # Fallback: get any state for this team
-                    fallback_state = (
-                        session.query(WorkflowState)
-                        .filter(WorkflowState.teamId == team_id)
-                        .order_by(WorkflowState.position)
-                        .first()
-                    )
-                    if fallback_state:
-                        state_id = fallback_state.id
-                    else:
-                        raise Exception(
-                            f"No workflow states found for team {team_id}. "
-                            "Workflow states should be created automatically when a team is created."
-                        )
+                state_id = get_default_state_id(info, team_id)
 
             description = issue_input.get("description")
             description_data = issue_input.get("descriptionData")
@@ -13,6 +13,7 @@ from starlette.responses import JSONResponse
 from starlette.routing import Route
 from starlette import status
 
+from src.platform.api.responses import ORJSONResponse
 from src.services.slack.database import operations as ops
 from src.services.slack.database.schema import (
     User,
@@ -24,58 +25,60 @@ from src.services.slack.database.schema import (
 from sqlalchemy.sql.elements import ColumnElement as SAColumnElement
 
 
-# Common Slack reactions for MVP
-COMMON_REACTIONS = {
-    # Basic standard emojis
-    "raised_hands",  # thank you
-    "bow",  # thank you
-    "thumbsup",  # agree / got it
-    "clap",  # well done
-    "tada",  # congrats / celebration
-    "dart",  # bullseye / nailed it
-    "joy",  # crying-laughing
-    "+1",  # agree / like
-    "-1",  # disagree
-    "eyes",  # watching / reviewing
-    "heart",  # love it
-    "fire",  # hot / amazing
-    "rocket",  # ship it / launch
-    "check",  # done / confirmed
-    "x",  # no / wrong
-    "wave",  # hello / goodbye
-    "pray",  # hoping / please
-    "thinking",  # considering
-    "shrug",  # I don't know
-    "facepalm",  # oops / mistake
-    "grimacing",  # awkward
-    "sweat_smile",  # nervous laugh
-    "zzz",  # sleeping / boring
-    "coffee",  # need caffeine
-    "pizza",  # food / break
-    # Popular Slack custom emojis
-    "finish_flag",  # done / finished
-    "blob_smiley",  # happy
-    "alert",  # warning
-    "mic-drop",  # nailed it
-    "cool-doge",  # cool
-    "thankyou",  # thanks
-    "party_blob",  # celebration
-    "partyparrot",  # party
-    "this_is_fine",  # chaos
-    "extreme-teamwork",  # collaboration
-    "done",  # completed
-    "loading",  # in progress
-    "huh",  # confused
-    "dumpster-fire",  # disaster
-    "blob-yes",  # yes
-    "blob-no",  # no
-    "blob_help",  # need help
-    "chefs-kiss",  # perfect
-    "troll",  # joking
-    "1000",  # 100% perfect
-    "catjam",  # vibing
-    "keanu-thanks",  # thanks
-}
+# Common Slack reactions for MVP (immutable; checked by hash lookup)
+COMMON_REACTIONS = frozenset(
+    {
+        # Basic standard emojis
+        "raised_hands",  # thank you
+        "bow",  # thank you
+        "thumbsup",  # agree / got it
+        "clap",  # well done
+        "tada",  # congrats / celebration
+        "dart",  # bullseye / nailed it
+        "joy",  # crying-laughing
+        "+1",  # agree / like
+        "-1",  # disagree
+        "eyes",  # watching / reviewing
+        "heart",  # love it
+        "fire",  # hot / amazing
+        "rocket",  # ship it / launch
+        "check",  # done / confirmed
+        "x",  # no / wrong
+        "wave",  # hello / goodbye
+        "pray",  # hoping / please
+        "thinking",  # considering
+        "shrug",  # I don't know
+        "facepalm",  # oops / mistake
+        "grimacing",  # awkward
+        "sweat_smile",  # nervous laugh
+        "zzz",  # sleeping / boring
+        "coffee",  # need caffeine
+        "pizza",  # food / break
+        # Popular Slack custom emojis
+        "finish_flag",  # done / finished
+        "blob_smiley",  # happy
+        "alert",  # warning
+        "mic-drop",  # nailed it
+        "cool-doge",  # cool
+        "thankyou",  # thanks
+        "party_blob",  # celebration
+        "partyparrot",  # party
+        "this_is_fine",  # chaos
+        "extreme-teamwork",  # collaboration
+        "done",  # completed
+        "loading",  # in progress
+        "huh",  # confused
+        "dumpster-fire",  # disaster
+        "blob-yes",  # yes
+        "blob-no",  # no
+        "blob_help",  # need help
+        "chefs-kiss",  # perfect
+        "troll",  # joking
+        "1000",  # 100% perfect
+        "catjam",  # vibing
+        "keanu-thanks",  # thanks
+    }
+)
 
 
 class SlackAPIError(Exception):
@@ -118,7 +121,7 @@ def _principal_user_id(request: Request) -> str:
 def _json_response(
     data: dict[str, Any], status_code: int = status.HTTP_200_OK
 ) -> JSONResponse:
-    return JSONResponse(data, status_code=status_code)
+    return ORJSONResponse(data, status_code=status_code)
 
 
 def _slack_error(
@@ -127,6 +130,16 @@ def _slack_error(
     raise SlackAPIError(code, status_code)
 
 
+def _validate_channel_name(name: str | None) -> None:
+    """Apply Slack's channel naming rules (shared by create and rename)."""
+    if not name:
+        _slack_error("invalid_name_required")
+    if len(name) > 80:
+        _slack_error("invalid_name_maxlength")
+    if not all(c.islower() or c.isdigit() or c in "-_" for c in name):
+        _slack_error("invalid_name_specials")
+
+
 def _resolve_channel_id(channel: str) -> str:
     """Return channel ID as-is (already in string format)"""
     return channel
@@ -306,13 +319,7 @@ async def conversations_create(request: Request) -> JSONResponse:
     name = payload.get("name")
     is_private = payload.get("is_private", False)
 
-    # Validate name
-    if not name:
-        _slack_error("invalid_name_required")
-    if len(name) > 80:
-        _slack_error("invalid_name_maxlength")
-    if not all(c.islower() or c.isdigit() or c in "-_" for c in name):
-        _slack_error("invalid_name_specials")
+    _validate_channel_name(name)
 
     session = _session(request)
     actor_id = _principal_user_id(request)
@@ -1185,14 +1192,7 @@ async def conversations_rename(request: Request) -> JSONResponse:
     # Validate required parameters
     if not channel:
         _slack_error("channel_not_found")
-    if not name:
-        _slack_error("invalid_name_required")
-
-    # Validate name format (same rules as conversations.create)
-    if len(name) > 80:
-        _slack_error("invalid_name_maxlength")
-    if not all(c.islower() or c.isdigit() or c in "-_" for c in name):
-        _slack_error("invalid_name_specials")
+    _validate_channel_name(name)
 
     session = _session(request)
 
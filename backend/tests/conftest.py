@@ -5,12 +5,16 @@ Provides database connections, session managers, and test utilities
 that can be used across all test files.
 """
 
+import contextlib
+import hashlib
 import os
+import sys
+from functools import cache
 from pathlib import Path
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from starlette.testclient import TestClient
 from uuid import uuid4
 
@@ -21,8 +25,49 @@ if env_path.exists():
 from src.platform.isolationEngine.session import SessionManager
 from src.platform.isolationEngine.environment import EnvironmentHandler
 from src.platform.isolationEngine.core import CoreIsolationEngine
+from src.platform.isolationEngine.models import EnvironmentResponse
 from src.platform.evaluationEngine.core import CoreEvaluationEngine
 
+TEST_USER_ID = "dev-user"
+
+# Make the Python SDK importable at collection time so SDK test modules can
+# import agent_diff at module level. Support multiple local SDK path variants
+# mounted by docker-compose, falling back to the checkout next to backend/.
+for _sdk_path in (
+    "/sdk/agent-diff-python",  # current folder name
+    "/sdk/agent_diff_python",  # legacy underscore variant
+):
+    if _sdk_path not in sys.path:
+        sys.path.insert(0, _sdk_path)
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_repo_sdk_path = str(_REPO_ROOT / "sdk" / "agent-diff-python")
+if _repo_sdk_path not in sys.path:
+    sys.path.append(_repo_sdk_path)
+
+
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed (pytest-asyncio>=1.4)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+def _is_xdist_worker() -> bool:
+    """True when running inside a pytest-xdist worker process."""
+    return "PYTEST_XDIST_WORKER" in os.environ
+
+
+def worker_tagged(user_id: str) -> str:
+    """Suffix an impersonation id with the xdist worker, so that worker's
+    cleanup can tell its environments apart from other workers'."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"{user_id}_{worker}" if worker else user_id
+
 
 @pytest.fixture(scope="session")
 def db_url():
@@ -35,8 +80,17 @@ def db_url():
 
 @pytest.fixture(scope="session")
 def db_engine(db_url):
-    """SQLAlchemy engine for the test database."""
-    engine = create_engine(db_url, pool_pre_ping=True)
+    """
+    SQLAlchemy engine for the test database.
+
+    Test data is throwaway, so commits skip the WAL flush; Slack/Linear code
+    still needs real Postgres schemas, which rules out an in-memory SQLite.
+    """
+    engine = create_engine(
+        db_url,
+        pool_pre_ping=True,
+        connect_args={"options": "-c synchronous_commit=off"},
+    )
     yield engine
     engine.dispose()
 
@@ -49,8 +103,13 @@ def session_manager(db_engine):
 
 @pytest.fixture(scope="session")
 def environment_handler(session_manager):
-    """EnvironmentHandler instance for tests."""
-    return EnvironmentHandler(session_manager)
+    """
+    EnvironmentHandler instance for tests.
+
+    Templates are seeded once per run and never altered in place, so clones
+    can safely reuse reflected template metadata.
+    """
+    return EnvironmentHandler(session_manager, fast_clone=True)
 
 
 @pytest.fixture(scope="session")
@@ -67,6 +126,22 @@ def core_evaluation_engine(session_manager):
     return CoreEvaluationEngine(sessions=session_manager)
 
 
+@pytest.fixture(scope="session")
+def slack_template_pool(core_isolation_engine, environment_handler):
+    """
+    Warm pool of slack_default clones, sized by AGENTDIFF_WARM_POOL_SIZE.
+
+    The pool lives in the database, so environments created in-process and by
+    an API server running with the same setting both claim schemas from it
+    with a rename instead of a full clone. A no-op when the size is 0. Other
+    xdist workers share the pool, so teardown drops only the clones this
+    worker created; those already claimed were renamed away and are skipped.
+    """
+    created = core_isolation_engine.prewarm("slack_default")
+    yield
+    environment_handler.drop_schemas(created)
+
+
 @pytest.fixture(scope="function")
 def test_client(session_manager):
     """Starlette TestClient with full application."""
@@ -76,10 +151,67 @@ def test_client(session_manager):
     return TestClient(app)
 
 
+@pytest.fixture
+def count_queries(session_manager):
+    """
+    Context manager that records SQL statements run on the base engine.
+
+    Listeners on the base engine also fire for engines derived from it with
+    execution_options (such as schema-translated environment engines), so
+    in-process API clients are covered. Usage:
+
+        with count_queries() as statements:
+            ...
+        assert len(statements) <= 2
+    """
+    engine = session_manager.base_engine
+
+    @contextlib.contextmanager
+    def _count():
+        statements = []
+
+        def hook(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", hook)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", hook)
+
+    return _count
+
+
+@pytest.fixture(scope="class")
+def _meta_conn(session_manager):
+    """One meta-DB connection shared by every test in a class."""
+    with session_manager.base_engine.connect() as conn:
+        yield conn
+
+
+@pytest.fixture
+def meta_session(_meta_conn):
+    """
+    Per-test ORM session on the class connection, wrapped in a SAVEPOINT.
+
+    Reads see rows the API server has committed (read committed), and any
+    writes made by the test itself are rolled back when it finishes.
+    """
+    from sqlalchemy.orm import Session
+
+    nested = _meta_conn.begin_nested()
+    session = Session(bind=_meta_conn, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        nested.rollback()
+
+
 @pytest.fixture(scope="session")
 def test_user_id():
     """Return a test principal ID for tests (matches dev mode default)."""
-    return "dev-user"
+    return TEST_USER_ID
 
 
 @pytest.fixture(scope="function")
@@ -104,41 +236,198 @@ def created_schemas(db_engine):
                 pass  # Schema might not exist
 
 
+def _state_schemas(engine) -> set[str]:
+    """Return the names of all state_* environment schemas."""
+    with engine.connect() as conn:
+        result = conn.execute(
+            text("SELECT nspname FROM pg_namespace WHERE nspname LIKE 'state_%'")
+        )
+        return {row[0] for row in result}
+
+
+def _drop_schemas(engine, schemas) -> None:
+    """Drop the given schemas in one statement, ignoring ones already gone."""
+    if not schemas:
+        return
+    names = ", ".join(f'"{schema}"' for schema in schemas)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {names} CASCADE"))
+
+
+def _delete_user_templates(engine, owner_id: str) -> None:
+    """Delete templates owned by `owner_id` (created by template tests)."""
+    from sqlalchemy.orm import Session
+
+    from src.platform.db.schema import TemplateEnvironment
+
+    with Session(engine) as s:
+        s.query(TemplateEnvironment).filter(
+            TemplateEnvironment.owner_id == owner_id
+        ).delete()
+        s.commit()
+
+
+def _is_xdist_controller(config) -> bool:
+    """True in the main process of a run distributed with `-n`."""
+    return not _is_xdist_worker() and bool(config.getoption("numprocesses", 0))
+
+
+def pytest_sessionstart(session):
+    """Snapshot state_* schemas before xdist workers start creating their own."""
+    url = os.environ.get("DATABASE_URL")
+    if not url or not _is_xdist_controller(session.config):
+        return
+    engine = create_engine(url)
+    try:
+        session.config._state_schemas_at_start = _state_schemas(engine)
+    finally:
+        engine.dispose()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Clean up after all xdist workers have finished.
+
+    Workers skip per-test schema and template cleanup, because a diff of
+    state_* schemas taken in one worker would also catch schemas that other
+    workers are still using.
+    """
+    _save_scope_durations(session.config)
+    existing = getattr(session.config, "_state_schemas_at_start", None)
+    if existing is None:
+        return
+    engine = create_engine(os.environ["DATABASE_URL"])
+    try:
+        _drop_schemas(engine, _state_schemas(engine) - existing)
+        _delete_user_templates(engine, TEST_USER_ID)
+    finally:
+        engine.dispose()
+
+
+# Durations per module/class from earlier runs, so the slowest scopes are
+# scheduled first and xdist workers finish closer together.
+_DURATIONS_KEY = "agentdiff/scope-durations"
+_scope_durations_run: dict[str, float] = {}
+
+
+def _scope_of(nodeid: str) -> str:
+    """The unit --dist loadscope schedules together: module or class."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate setup, call and teardown time per scope on the controller."""
+    if _is_xdist_worker():
+        return
+    scope = _scope_of(report.nodeid)
+    _scope_durations_run[scope] = _scope_durations_run.get(scope, 0.0) + report.duration
+
+
+def _save_scope_durations(config) -> None:
+    cache = getattr(config, "cache", None)
+    if cache is None or _is_xdist_worker() or not _scope_durations_run:
+        return
+    durations = cache.get(_DURATIONS_KEY, {})
+    durations.update(_scope_durations_run)
+    cache.set(_DURATIONS_KEY, durations)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Order scopes slowest-first by their last recorded duration."""
+    cache = getattr(config, "cache", None)
+    durations = cache.get(_DURATIONS_KEY, {}) if cache is not None else {}
+    if not durations:
+        return
+    module_durations: dict[str, float] = {}
+    for scope, seconds in durations.items():
+        module = scope.split("::")[0]
+        module_durations[module] = module_durations.get(module, 0.0) + seconds
+
+    def key(item):
+        scope = _scope_of(item.nodeid)
+        module = scope.split("::")[0]
+        return (-module_durations.get(module, 0.0), -durations.get(scope, 0.0))
+
+    # Modules stay contiguous so module-scoped fixtures are set up once, and
+    # the stable sort keeps the original order within a scope and among
+    # scopes that have no recorded duration yet.
+    items.sort(key=key)
+
+
 @pytest.fixture(scope="function")
 def cleanup_test_environments(session_manager, created_schemas):
-    """Auto-cleanup fixture that drops all state_* schemas created during test."""
+    """Auto-cleanup fixture that drops the state_* schemas created during test.
+
+    Schemas that existed before the test (such as session-scoped shared
+    environments) are left in place. Under xdist only environments whose
+    impersonation id carries this worker's tag (see worker_tagged) are
+    dropped, since other workers create schemas concurrently; anything else
+    is left to the controller's pytest_sessionfinish.
+    """
+    engine = session_manager.base_engine
+    existing = _state_schemas(engine)
+
     yield
 
-    # Find all state_* schemas
-    with session_manager.base_engine.begin() as conn:
-        result = conn.execute(
-            text("""
-            SELECT schema_name
-            FROM information_schema.schemata
-            WHERE schema_name LIKE 'state_%'
-        """)
+    new_schemas = _state_schemas(engine) - existing
+    if _is_xdist_worker():
+        new_schemas = _worker_schemas(engine, new_schemas)
+    _drop_schemas(engine, new_schemas)
+
+
+def _worker_schemas(engine, schemas) -> set[str]:
+    """Subset of `schemas` backing environments tagged for this xdist worker."""
+    if not schemas:
+        return set()
+    from sqlalchemy.orm import Session
+
+    from src.platform.db.schema import RunTimeEnvironment
+
+    with Session(engine) as s:
+        rows = (
+            s.query(RunTimeEnvironment.schema)
+            .filter(
+                RunTimeEnvironment.schema.in_(schemas),
+                RunTimeEnvironment.impersonate_user_id.like(worker_tagged("%")),
+            )
+            .all()
         )
-        schemas = [row[0] for row in result]
+    return {row[0] for row in rows}
 
-    # Drop them
-    with session_manager.base_engine.begin() as conn:
-        for schema in schemas:
-            try:
-                conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
-            except Exception:
-                pass
 
+def _rollback_session(session_manager, schema: str):
+    """
+    Yield a session on `schema` that is rolled back when the generator ends.
+
+    The session joins an outer connection-level transaction using savepoints,
+    so commits and rollbacks issued by handlers or middleware stay inside the
+    test and the seeded snapshot is restored without re-seeding.
+    """
+    from sqlalchemy.orm import Session
+
+    translated = session_manager.base_engine.execution_options(
+        schema_translate_map={None: schema}
+    )
+    connection = translated.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
 
-@pytest_asyncio.fixture
-async def slack_client(
-    test_user_id, core_isolation_engine, session_manager, environment_handler
-):
-    """Create an AsyncClient for testing Slack API as U01AGENBOT9 (agent1)."""
-    from httpx import AsyncClient, ASGITransport
-    from src.services.slack.api.methods import slack_endpoint
-    from starlette.routing import Route
-    from starlette.applications import Starlette
 
+@pytest.fixture(scope="session")
+def slack_seeded_env(
+    test_user_id, core_isolation_engine, environment_handler, slack_template_pool
+):
+    """Seed one slack_default environment shared by the whole test session."""
     env_result = core_isolation_engine.create_environment(
         template_schema="slack_default",
         ttl_seconds=3600,
@@ -146,31 +435,142 @@ async def slack_client(
         impersonate_user_id="U01AGENBOT9",
         impersonate_email="agent@example.com",
     )
+    yield env_result
+    environment_handler.drop_schema(env_result.schema_name)
+
+
+@pytest.fixture
+def slack_rollback_session(session_manager, slack_seeded_env):
+    """Session on the shared Slack environment that is rolled back after the test."""
+    yield from _rollback_session(session_manager, slack_seeded_env.schema_name)
+
+
+@pytest.fixture
+def slack_scratch_channel(slack_rollback_session) -> str:
+    """
+    Id of a throwaway public channel with the agent as its only member.
+
+    Created on the test's rollback session, so it is visible to slack_client
+    and slack_direct in that test only and disappears with the rollback.
+    """
+    from sqlalchemy import select
+    from src.services.slack.database import operations as ops
+    from src.services.slack.database.schema import UserTeam
+
+    session = slack_rollback_session
+    team_id = session.execute(
+        select(UserTeam.team_id).where(UserTeam.user_id == "U01AGENBOT9")
+    ).scalar_one()
+    channel = ops.create_channel(session, channel_name="test-scratch", team_id=team_id)
+    ops.join_channel(session, channel_id=channel.channel_id, user_id="U01AGENBOT9")
+    session.commit()
+    return channel.channel_id
+
+
+def create_slack_client(session, impersonate_user_id: str, impersonate_email: str):
+    """Build an AsyncClient for the Slack Web API bound to `session`."""
+    from httpx import AsyncClient, ASGITransport
+    from src.services.slack.api.methods import slack_endpoint
+    from starlette.routing import Route
+    from starlette.applications import Starlette
 
     async def add_db_session(request, call_next):
-        with session_manager.with_session_for_environment(
-            env_result.environment_id
-        ) as session:
-            request.state.db_session = session
-            request.state.impersonate_user_id = "U01AGENBOT9"
-            request.state.impersonate_email = "agent@example.com"
+        request.state.db_session = session
+        request.state.impersonate_user_id = impersonate_user_id
+        request.state.impersonate_email = impersonate_email
+        try:
             response = await call_next(request)
-            return response
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return response
 
     routes = [Route("/{endpoint}", slack_endpoint, methods=["GET", "POST"])]
     app = Starlette(routes=routes, middleware=[])
     app.middleware("http")(add_db_session)
 
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+    return AsyncClient(transport=transport, base_url="http://test")
 
-    environment_handler.drop_schema(env_result.schema_name)
+
+def create_direct_slack(session, impersonate_user_id: str, impersonate_email: str):
+    """
+    Return `call(endpoint, payload=None, method="POST") -> (status, data)`
+    that invokes slack_endpoint in-process, without httpx or ASGI middleware.
+
+    GET payloads are sent as query parameters, POST payloads as a JSON body.
+    """
+    import json
+    from urllib.parse import urlencode
+
+    from starlette.requests import Request
+    from src.services.slack.api.methods import slack_endpoint
+
+    async def call(endpoint: str, payload: dict | None = None, method: str = "POST"):
+        body = b""
+        query = b""
+        if payload is not None:
+            if method == "GET":
+                query = urlencode(payload).encode()
+            else:
+                body = json.dumps(payload).encode()
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": f"/{endpoint}",
+            "path_params": {"endpoint": endpoint},
+            "query_string": query,
+            "headers": [(b"content-type", b"application/json")],
+            "state": {
+                "db_session": session,
+                "impersonate_user_id": impersonate_user_id,
+                "impersonate_email": impersonate_email,
+            },
+        }
+        try:
+            response = await slack_endpoint(Request(scope, receive))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return response.status_code, json.loads(response.body)
+
+    return call
+
+
+@pytest.fixture
+def slack_direct(slack_rollback_session):
+    """In-process Slack caller as U01AGENBOT9, for tests that don't need HTTP."""
+    return create_direct_slack(
+        slack_rollback_session,
+        impersonate_user_id="U01AGENBOT9",
+        impersonate_email="agent@example.com",
+    )
+
+
+@pytest_asyncio.fixture
+async def slack_client(slack_rollback_session):
+    """Create an AsyncClient for testing Slack API as U01AGENBOT9 (agent1)."""
+    async with create_slack_client(
+        slack_rollback_session,
+        impersonate_user_id="U01AGENBOT9",
+        impersonate_email="agent@example.com",
+    ) as client:
+        yield client
 
 
 @pytest_asyncio.fixture
 async def slack_client_with_differ(
-    test_user_id, core_isolation_engine, session_manager, environment_handler
+    test_user_id,
+    core_isolation_engine,
+    session_manager,
+    environment_handler,
+    slack_template_pool,
 ):
     """Create AsyncClient and Differ for the same environment."""
     from httpx import AsyncClient, ASGITransport
@@ -265,43 +665,19 @@ async def slack_bench_client_with_differ(
 
 
 @pytest_asyncio.fixture
-async def slack_client_john(
-    test_user_id, core_isolation_engine, session_manager, environment_handler
-):
-    """Create an AsyncClient for testing Slack API as U02JOHNDOE1 (johndoe)."""
-    from httpx import AsyncClient, ASGITransport
-    from src.services.slack.api.methods import slack_endpoint
-    from starlette.routing import Route
-    from starlette.applications import Starlette
-
-    env_result = core_isolation_engine.create_environment(
-        template_schema="slack_default",
-        ttl_seconds=3600,
-        created_by=test_user_id,
+async def slack_client_john(slack_rollback_session):
+    """Create an AsyncClient for testing Slack API as U02JOHNDOE1 (johndoe).
+
+    Shares the test's rollback session with slack_client, so both users see
+    each other's writes within a test.
+    """
+    async with create_slack_client(
+        slack_rollback_session,
         impersonate_user_id="U02JOHNDOE1",
         impersonate_email="john@example.com",
-    )
-
-    async def add_db_session(request, call_next):
-        with session_manager.with_session_for_environment(
-            env_result.environment_id
-        ) as session:
-            request.state.db_session = session
-            request.state.impersonate_user_id = "U02JOHNDOE1"
-            request.state.impersonate_email = "john@example.com"
-            response = await call_next(request)
-            return response
-
-    routes = [Route("/{endpoint}", slack_endpoint, methods=["GET", "POST"])]
-    app = Starlette(routes=routes, middleware=[])
-    app.middleware("http")(add_db_session)
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    ) as client:
         yield client
 
-    environment_handler.drop_schema(env_result.schema_name)
-
 
 def create_test_environment(
     core_isolation_engine: CoreIsolationEngine,
@@ -366,60 +742,105 @@ def test_api_key(test_user_id):
     return "test-api-key"
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def cleanup_test_templates(session_manager, test_user_id):
-    """Auto-cleanup fixture that removes templates created during tests."""
-    from src.platform.db.schema import TemplateEnvironment
+    """Auto-cleanup fixture that removes templates created during the session.
 
+    Under xdist this is deferred to the controller's pytest_sessionfinish.
+    """
     yield
 
-    # Delete all user-owned templates created during test
-    with session_manager.with_meta_session() as s:
-        s.query(TemplateEnvironment).filter(
-            TemplateEnvironment.owner_id == test_user_id
-        ).delete()
-        s.commit()
+    if not _is_xdist_worker():
+        _delete_user_templates(session_manager.base_engine, test_user_id)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def sdk_client(test_api_key, cleanup_test_templates):
-    """AgentDiff SDK client for integration tests."""
-    import sys
+    """AgentDiff SDK client shared by all SDK integration tests."""
+    import requests
+    from requests.adapters import HTTPAdapter
 
-    # Support multiple local SDK path variants mounted by docker-compose
-    sdk_paths = [
-        "/sdk/agent-diff-python",  # current folder name
-        "/sdk/agent_diff_python",  # legacy underscore variant
-    ]
-    for sdk_path in sdk_paths:
-        if sdk_path not in sys.path:
-            sys.path.insert(0, sdk_path)
+    from agent_diff.client import AgentDiff
 
-    import importlib
-
-    AgentDiff = importlib.import_module("agent_diff.client").AgentDiff
+    # Keep-alive pool large enough for every connection the suite opens
+    http = requests.Session()
+    http.mount(
+        "http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+    )
 
     # Use backend service name for inter-container communication
-    return AgentDiff(
+    client = AgentDiff(
         api_key=test_api_key,
         base_url="http://backend:8000",
+        session=http,
     )
+    yield client
+    client.close()
 
 
-@pytest_asyncio.fixture
-async def linear_client(
-    test_user_id,
-    core_isolation_engine,
-    core_evaluation_engine,
-    session_manager,
-    environment_handler,
+@pytest.fixture(scope="session")
+def slack_template_id(sdk_client):
+    """ID of the seeded slack_default template, looked up once per session."""
+    resp = sdk_client.list_templates(service="slack", name="slack_default")
+    assert resp.templates, "No slack_default template found"
+    return resp.templates[0].id
+
+
+@pytest.fixture(scope="session")
+def slack_env(sdk_client, slack_template_pool):
+    """slack_default environment shared by SDK tests that only read from it."""
+    from agent_diff.models import InitEnvRequestBody
+
+    resp = sdk_client.init_env(
+        InitEnvRequestBody.model_construct(
+            templateService="slack",
+            templateName="slack_default",
+            impersonateUserId="U01SHARED",
+            ttlSeconds=3600,
+        )
+    )
+    yield resp
+    sdk_client.delete_env(resp.environmentId)
+
+
+# Files whose contents determine what linear_seeded_env looks like.
+_LINEAR_SEED_INPUTS = (
+    _REPO_ROOT / "examples" / "linear" / "seeds" / "linear_default.json",
+    Path(__file__).resolve().parents[1] / "src/services/linear/database/schema.py",
+)
+
+
+def _seed_cache_key(*paths: Path) -> str:
+    """Hash the files a seeded environment is built from."""
+    digest = hashlib.md5()
+    for path in paths:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope="session")
+def linear_seeded_env(
+    request, test_user_id, core_isolation_engine, environment_handler
 ):
-    """Create an AsyncClient for testing Linear GraphQL API as U01AGENT (agent)."""
-    from httpx import AsyncClient, ASGITransport
-    from src.services.linear.api.graphql_linear import LinearGraphQL
-    from ariadne import load_schema_from_path, make_executable_schema
-    from src.services.linear.api.resolvers import query, mutation, issue_type
-    from starlette.applications import Starlette
+    """Seed one linear_default environment shared by the whole test session.
+
+    With AGENTDIFF_CACHE_SEED=1 (single-process runs only) the environment is
+    kept after the session and recorded in the pytest cache, keyed by the
+    Linear seed data and schema. Later runs reuse it while neither changes
+    and its schema still exists. Tests only touch it through
+    linear_rollback_session, so it stays pristine between runs.
+    """
+    use_cache = os.environ.get("AGENTDIFF_CACHE_SEED") == "1" and not (
+        _is_xdist_worker() or _is_xdist_controller(request.config)
+    )
+    cache_key = "agentdiff/seed/linear/" + _seed_cache_key(*_LINEAR_SEED_INPUTS)
+
+    if use_cache:
+        cached = request.config.cache.get(cache_key, None)
+        if cached and environment_handler.schema_exists(cached["schema_name"]):
+            yield EnvironmentResponse(**cached)
+            return
 
     env_result = core_isolation_engine.create_environment(
         template_schema="linear_default",
@@ -428,84 +849,66 @@ async def linear_client(
         impersonate_user_id="U01AGENT",
         impersonate_email="agent@example.com",
     )
+    if use_cache:
+        request.config.cache.set(cache_key, env_result.model_dump(mode="json"))
+        yield env_result
+        return
 
-    async def add_db_session(request, call_next):
-        with session_manager.with_session_for_environment(
-            env_result.environment_id
-        ) as session:
-            request.state.db_session = session
-            request.state.environment_id = env_result.environment_id
-            request.state.impersonate_user_id = "U01AGENT"
-            request.state.impersonate_email = "agent@example.com"
-            response = await call_next(request)
-            return response
+    yield env_result
+    environment_handler.drop_schema(env_result.schema_name)
 
-    # Create Linear GraphQL schema
-    linear_schema_path = "src/services/linear/api/schema/Linear-API.graphql"
-    linear_type_defs = load_schema_from_path(linear_schema_path)
-    linear_schema = make_executable_schema(
-        linear_type_defs, query, mutation, issue_type
-    )
 
-    linear_graphql = LinearGraphQL(
-        linear_schema,
-        coreIsolationEngine=core_isolation_engine,
-        coreEvaluationEngine=core_evaluation_engine,
-    )
+@pytest.fixture
+def linear_rollback_session(session_manager, linear_seeded_env):
+    """Session on the shared Linear environment that is rolled back after the test."""
+    yield from _rollback_session(session_manager, linear_seeded_env.schema_name)
 
-    app = Starlette()
-    app.middleware("http")(add_db_session)
-    app.mount("/", linear_graphql)
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+@cache
+def _linear_schema():
+    """
+    Build the Linear executable schema once per process.
 
-    environment_handler.drop_schema(env_result.schema_name)
+    Parsing the ~27k-line SDL dominated Linear client setup when it was
+    rebuilt for every test.
+    """
+    from ariadne import load_schema_from_path, make_executable_schema
+    from src.services.linear.api.resolvers import query, mutation, issue_type
 
+    type_defs = load_schema_from_path(
+        "src/services/linear/api/schema/Linear-API.graphql"
+    )
+    return make_executable_schema(type_defs, query, mutation, issue_type)
 
-@pytest_asyncio.fixture
-async def linear_client_john(
-    test_user_id,
-    core_isolation_engine,
-    core_evaluation_engine,
-    session_manager,
-    environment_handler,
+
+def create_linear_client(
+    session,
+    environment_id: str,
+    core_isolation_engine: CoreIsolationEngine,
+    core_evaluation_engine: CoreEvaluationEngine,
+    impersonate_user_id: str,
+    impersonate_email: str,
 ):
-    """Create an AsyncClient for testing Linear GraphQL API as U02JOHN (John Doe)."""
+    """Build an AsyncClient for the Linear GraphQL API bound to `session`."""
     from httpx import AsyncClient, ASGITransport
     from src.services.linear.api.graphql_linear import LinearGraphQL
-    from ariadne import load_schema_from_path, make_executable_schema
-    from src.services.linear.api.resolvers import query, mutation, issue_type
     from starlette.applications import Starlette
 
-    env_result = core_isolation_engine.create_environment(
-        template_schema="linear_default",
-        ttl_seconds=3600,
-        created_by=test_user_id,
-        impersonate_user_id="U02JOHN",
-        impersonate_email="john@example.com",
-    )
-
     async def add_db_session(request, call_next):
-        with session_manager.with_session_for_environment(
-            env_result.environment_id
-        ) as session:
-            request.state.db_session = session
-            request.state.environment_id = env_result.environment_id
-            request.state.impersonate_user_id = "U02JOHN"
-            request.state.impersonate_email = "john@example.com"
+        request.state.db_session = session
+        request.state.environment_id = environment_id
+        request.state.impersonate_user_id = impersonate_user_id
+        request.state.impersonate_email = impersonate_email
+        try:
             response = await call_next(request)
-            return response
-
-    linear_schema_path = "src/services/linear/api/schema/Linear-API.graphql"
-    linear_type_defs = load_schema_from_path(linear_schema_path)
-    linear_schema = make_executable_schema(
-        linear_type_defs, query, mutation, issue_type
-    )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return response
 
     linear_graphql = LinearGraphQL(
-        linear_schema,
+        _linear_schema(),
         coreIsolationEngine=core_isolation_engine,
         coreEvaluationEngine=core_evaluation_engine,
     )
@@ -515,10 +918,45 @@ async def linear_client_john(
     app.mount("/", linear_graphql)
 
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest_asyncio.fixture
+async def linear_client(
+    linear_seeded_env,
+    linear_rollback_session,
+    core_isolation_engine,
+    core_evaluation_engine,
+):
+    """Create an AsyncClient for testing Linear GraphQL API as U01AGENT (agent)."""
+    async with create_linear_client(
+        linear_rollback_session,
+        linear_seeded_env.environment_id,
+        core_isolation_engine,
+        core_evaluation_engine,
+        impersonate_user_id="U01AGENT",
+        impersonate_email="agent@example.com",
+    ) as client:
         yield client
 
-    environment_handler.drop_schema(env_result.schema_name)
+
+@pytest_asyncio.fixture
+async def linear_client_john(
+    linear_seeded_env,
+    linear_rollback_session,
+    core_isolation_engine,
+    core_evaluation_engine,
+):
+    """Create an AsyncClient for testing Linear GraphQL API as U02JOHN (John Doe)."""
+    async with create_linear_client(
+        linear_rollback_session,
+        linear_seeded_env.environment_id,
+        core_isolation_engine,
+        core_evaluation_engine,
+        impersonate_user_id="U02JOHN",
+        impersonate_email="john@example.com",
+    ) as client:
+        yield client
 
 
 @pytest_asyncio.fixture
@@ -532,8 +970,6 @@ async def linear_client_with_differ(
     """Create AsyncClient and Differ for the same Linear environment."""
     from httpx import AsyncClient, ASGITransport
     from src.services.linear.api.graphql_linear import LinearGraphQL
-    from ariadne import load_schema_from_path, make_executable_schema
-    from src.services.linear.api.resolvers import query, mutation, issue_type
     from starlette.applications import Starlette
     from src.platform.evaluationEngine.differ import Differ
 
@@ -556,14 +992,8 @@ async def linear_client_with_differ(
             response = await call_next(request)
             return response
 
-    linear_schema_path = "src/services/linear/api/schema/Linear-API.graphql"
-    linear_type_defs = load_schema_from_path(linear_schema_path)
-    linear_schema = make_executable_schema(
-        linear_type_defs, query, mutation, issue_type
-    )
-
     linear_graphql = LinearGraphQL(
-        linear_schema,
+        _linear_schema(),
         coreIsolationEngine=core_isolation_engine,
         coreEvaluationEngine=core_evaluation_engine,
     )
@@ -268,3 +268,34 @@ def test_drop_schema_cleanup(
             {"schema": schema_name},
         ).scalar()
     assert exists_after is False
+
+
+def test_environment_claims_warm_schema(
+    test_user_id,
+    session_manager,
+    environment_handler,
+    cleanup_test_environments,
+):
+    from src.platform.isolationEngine.core import CoreIsolationEngine
+
+    engine = CoreIsolationEngine(
+        sessions=session_manager,
+        environment_handler=environment_handler,
+        warm_pool_size=1,
+    )
+    warm_schema = environment_handler.create_warm_schema("slack_default")
+    try:
+        result = engine.create_environment(
+            template_schema="slack_default",
+            ttl_seconds=3600,
+            created_by=test_user_id,
+        )
+
+        # Other workers share the pool, so check the clone was claimed rather
+        # than comparing pool sizes
+        assert not environment_handler.schema_exists(warm_schema)
+        with session_manager.with_session_for_schema(result.schema_name) as session:
+            assert session.query(User).count() == 3
+            assert session.query(Message).count() == 3
+    finally:
+        environment_handler.drop_schemas([warm_schema])
@@ -1,5 +1,9 @@
 """Integration tests for Linear GraphQL API."""
 
+import re
+from functools import cache
+
+import orjson
 import pytest
 from httpx import AsyncClient
 
@@ -17,6 +21,51 @@ STATE_IN_PROGRESS = "WS_ENG_IN_PROGRESS"
 STATE_IN_REVIEW = "WS_ENG_IN_REVIEW"
 STATE_DONE = "WS_ENG_DONE"
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@cache
+def _envelope(query: str) -> bytes:
+    """Pre-serialize the static `{"query": ..., "variables":` prefix of a request."""
+    return b'{"query":' + orjson.dumps(query) + b',"variables":'
+
+
+def _body(envelope: bytes, variables: dict | None = None) -> bytes:
+    """Complete a pre-serialized envelope with the per-call variables."""
+    return envelope + orjson.dumps(variables) + b"}"
+
+
+async def _gql(client: AsyncClient, query: str, variables: dict | None = None):
+    """POST a GraphQL operation, check the HTTP status and return its `data`."""
+    response = await client.post(
+        "/graphql", content=_body(_envelope(query), variables), headers=JSON_HEADERS
+    )
+    assert response.status_code == 200, response.text
+    return orjson.loads(response.content)["data"]
+
+
+def _assert_subset(actual: dict, expected: dict):
+    """Assert `actual` matches every key in `expected`, reporting all mismatches."""
+    mismatched = {
+        key: actual.get(key)
+        for key, value in expected.items()
+        if actual.get(key) != value
+    }
+    assert not mismatched, f"expected {expected}, mismatched {mismatched}"
+
+
+CREATE_LABEL_MUTATION = """
+  mutation($input: IssueLabelCreateInput!) {
+    issueLabelCreate(input: $input) {
+      success
+      issueLabel {
+        id
+        name
+      }
+    }
+  }
+"""
+
 
 @pytest.mark.asyncio
 class TestQueryViewer:
@@ -32,14 +81,16 @@ class TestQueryViewer:
             }
           }
         """
-        response = await linear_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        assert data["data"]["viewer"]["id"] == USER_AGENT
-        assert data["data"]["viewer"]["name"] == "AI Agent"
-        assert data["data"]["viewer"]["email"] == "agent@example.com"
-        assert data["data"]["viewer"]["active"] is True
+        data = await _gql(linear_client, query)
+        _assert_subset(
+            data["viewer"],
+            {
+                "id": USER_AGENT,
+                "name": "AI Agent",
+                "email": "agent@example.com",
+                "active": True,
+            },
+        )
 
 
 @pytest.mark.asyncio
@@ -55,27 +106,72 @@ class TestQueryIssues:
                 title
                 team {
                   id
-                  name
                   key
                 }
               }
             }
           }
         """
-        response = await linear_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        issues = data["data"]["issues"]["nodes"]
+        data = await _gql(linear_client, query)
+        issues = data["issues"]["nodes"]
         assert len(issues) >= 1
         # Check seeded issue
-        issue = next((i for i in issues if i["id"] == ISSUE_ENG_001), None)
-        assert issue is not None
+        issues_by_id = {i["id"]: i for i in issues}
+        assert ISSUE_ENG_001 in issues_by_id
+        issue = issues_by_id[ISSUE_ENG_001]
         assert issue["identifier"] == "ENG-1"
         assert "authentication" in issue["title"].lower()
         assert issue["team"]["id"] == TEAM_ENG
         assert issue["team"]["key"] == "ENG"
 
+    async def test_list_issues_batches_team_and_labels(
+        self, linear_client: AsyncClient, count_queries
+    ):
+        """Team and labels load with one query each, not one per issue."""
+        create = """
+          mutation($input: IssueBatchCreateInput!) {
+            issueBatchCreate(input: $input) {
+              success
+            }
+          }
+        """
+        variables = {
+            "input": {
+                "issues": [
+                    {"teamId": TEAM_ENG, "title": "Eager load issue 1"},
+                    {"teamId": TEAM_PROD, "title": "Eager load issue 2"},
+                ]
+            }
+        }
+        data = await _gql(linear_client, create, variables)
+        assert data["issueBatchCreate"]["success"] is True
+
+        query = """
+          query {
+            issues {
+              nodes {
+                id
+                team {
+                  id
+                }
+                labels {
+                  nodes {
+                    id
+                  }
+                }
+              }
+            }
+          }
+        """
+        with count_queries() as statements:
+            data = await _gql(linear_client, query)
+
+        assert len(data["issues"]["nodes"]) >= 3
+        team_loads = [s for s in statements if re.search(r"FROM \S*\bteams\b", s)]
+        label_loads = [s for s in statements if "issue_label_issue_association" in s]
+        assert len(team_loads) <= 1, team_loads
+        assert len(label_loads) <= 1, label_loads
+
     async def test_list_issues_with_team_filter(self, linear_client: AsyncClient):
         """Test filtering issues by team."""
         query = """
@@ -91,13 +187,8 @@ class TestQueryIssues:
           }
         """
         variables = {"filter": {"team": {"id": {"eq": TEAM_ENG}}}}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        issues = data["data"]["issues"]["nodes"]
+        data = await _gql(linear_client, query, variables)
+        issues = data["issues"]["nodes"]
         # All issues should belong to Engineering team
         for issue in issues:
             assert issue["team"]["id"] == TEAM_ENG
@@ -121,17 +212,12 @@ class TestQueryIssues:
           }
         """
         variables = {"first": 1}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        edges = data["data"]["issues"]["edges"]
+        data = await _gql(linear_client, query, variables)
+        edges = data["issues"]["edges"]
         assert len(edges) == 1
         assert "cursor" in edges[0]
         assert "node" in edges[0]
-        assert "pageInfo" in data["data"]["issues"]
+        assert "pageInfo" in data["issues"]
 
 
 @pytest.mark.asyncio
@@ -149,22 +235,51 @@ class TestQueryTeams:
             }
           }
         """
-        response = await linear_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        teams = data["data"]["teams"]["nodes"]
+        data = await _gql(linear_client, query)
+        teams = data["teams"]["nodes"]
         assert len(teams) >= 2
         # Check seeded teams
-        team_ids = [t["id"] for t in teams]
-        assert TEAM_ENG in team_ids
-        assert TEAM_PROD in team_ids
+        teams_by_id = {t["id"]: t for t in teams}
+        assert TEAM_ENG in teams_by_id
+        assert TEAM_PROD in teams_by_id
 
-        eng_team = next((t for t in teams if t["id"] == TEAM_ENG), None)
-        assert eng_team is not None
+        eng_team = teams_by_id[TEAM_ENG]
         assert eng_team["name"] == "Engineering"
         assert eng_team["key"] == "ENG"
 
+    async def test_list_teams_reflects_created_team(self, linear_client: AsyncClient):
+        """Test cached teams response is invalidated by a mutation."""
+        query = """
+          query {
+            teams {
+              nodes {
+                key
+              }
+            }
+          }
+        """
+        data = await _gql(linear_client, query)
+        keys = [t["key"] for t in data["teams"]["nodes"]]
+        assert "CACHE" not in keys
+
+        create_query = """
+          mutation($input: TeamCreateInput!) {
+            teamCreate(input: $input) {
+              success
+            }
+          }
+        """
+        create_data = await _gql(
+            linear_client,
+            create_query,
+            {"input": {"name": "Cache Team", "key": "CACHE"}},
+        )
+        assert create_data["teamCreate"]["success"] is True
+
+        data = await _gql(linear_client, query)
+        keys = [t["key"] for t in data["teams"]["nodes"]]
+        assert "CACHE" in keys
+
     async def test_get_team_by_id(self, linear_client: AsyncClient):
         """Test querying specific team by ID."""
         query = """
@@ -180,19 +295,19 @@ class TestQueryTeams:
           }
         """
         variables = {"id": TEAM_ENG}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
+        data = await _gql(linear_client, query, variables)
+        team = data["team"]
+        _assert_subset(
+            team,
+            {
+                "id": TEAM_ENG,
+                "name": "Engineering",
+                "key": "ENG",
+                "description": "Engineering team",
+                "icon": "🚀",
+                "color": "#3B82F6",
+            },
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        team = data["data"]["team"]
-        assert team["id"] == TEAM_ENG
-        assert team["name"] == "Engineering"
-        assert team["key"] == "ENG"
-        assert team["description"] == "Engineering team"
-        assert team["icon"] == "🚀"
-        assert team["color"] == "#3B82F6"
 
 
 @pytest.mark.asyncio
@@ -203,9 +318,7 @@ class TestQueryWorkflowStates:
           query($filter: WorkflowStateFilter) {
             workflowStates(filter: $filter) {
               nodes {
-                id
                 name
-                type
                 position
                 team {
                   id
@@ -215,13 +328,8 @@ class TestQueryWorkflowStates:
           }
         """
         variables = {"filter": {"team": {"id": {"eq": TEAM_ENG}}}}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        states = data["data"]["workflowStates"]["nodes"]
+        data = await _gql(linear_client, query, variables)
+        states = data["workflowStates"]["nodes"]
         # Should have 8 workflow states for Engineering team
         assert len(states) == 8
 
@@ -275,23 +383,21 @@ class TestIssueCreate:
                 "title": "Test issue from integration test",
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        result = data["data"]["issueCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueCreate"]
         assert result["success"] is True
         issue = result["issue"]
-        assert issue["title"] == "Test issue from integration test"
-        assert issue["team"]["id"] == TEAM_ENG
-        # Should default to Backlog state
-        assert issue["state"]["id"] == STATE_BACKLOG
-        assert issue["state"]["name"] == "Backlog"
-        # Should default to priority 0 (No priority)
-        assert issue["priority"] == 0.0
-        assert issue["priorityLabel"] == "No priority"
+        # Should default to Backlog state and priority 0 (No priority)
+        _assert_subset(
+            issue,
+            {
+                "title": "Test issue from integration test",
+                "team": {"id": TEAM_ENG},
+                "state": {"id": STATE_BACKLOG, "name": "Backlog"},
+                "priority": 0.0,
+                "priorityLabel": "No priority",
+            },
+        )
 
     async def test_create_issue_with_assignee(self, linear_client: AsyncClient):
         """Test creating issue with assignee."""
@@ -317,17 +423,11 @@ class TestIssueCreate:
                 "assigneeId": USER_JOHN,
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        result = data["data"]["issueCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueCreate"]
         assert result["success"] is True
         issue = result["issue"]
-        assert issue["assignee"]["id"] == USER_JOHN
-        assert issue["assignee"]["name"] == "John Doe"
+        _assert_subset(issue["assignee"], {"id": USER_JOHN, "name": "John Doe"})
 
     async def test_create_issue_invalid_team(self, linear_client: AsyncClient):
         """Test creating issue with invalid teamId fails."""
@@ -352,7 +452,7 @@ class TestIssueCreate:
         )
         # GraphQL should return 200 but with errors
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         # Should have errors
         assert "errors" in data
 
@@ -379,17 +479,11 @@ class TestIssueUpdate:
             "id": ISSUE_ENG_001,
             "input": {"stateId": STATE_IN_PROGRESS},
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        result = data["data"]["issueUpdate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueUpdate"]
         assert result["success"] is True
         issue = result["issue"]
-        assert issue["state"]["id"] == STATE_IN_PROGRESS
-        assert issue["state"]["name"] == "In Progress"
+        _assert_subset(issue["state"], {"id": STATE_IN_PROGRESS, "name": "In Progress"})
 
 
 # ==========================================
@@ -413,12 +507,8 @@ class TestSearchIssues:
           }
         """
         variables = {"term": "authentication"}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        issues = data["data"]["searchIssues"]["nodes"]
+        data = await _gql(linear_client, query, variables)
+        issues = data["searchIssues"]["nodes"]
         # Should find at least the "Fix authentication bug in login flow" issue
         assert len(issues) >= 1
         assert any("authentication" in issue["title"].lower() for issue in issues)
@@ -436,12 +526,8 @@ class TestSearchIssues:
           }
         """
         variables = {"term": "NONEXISTENT_SEARCH_TERM_12345"}
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        issues = data["data"]["searchIssues"]["nodes"]
+        data = await _gql(linear_client, query, variables)
+        issues = data["searchIssues"]["nodes"]
         assert len(issues) == 0
 
 
@@ -461,7 +547,6 @@ class TestCommentCreate:
                 }
                 user {
                   id
-                  name
                 }
               }
             }
@@ -473,17 +558,18 @@ class TestCommentCreate:
                 "body": "This is a test comment from integration test",
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["commentCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["commentCreate"]
         assert result["success"] is True
         comment = result["comment"]
-        assert comment["body"] == "This is a test comment from integration test"
-        assert comment["issue"]["id"] == ISSUE_ENG_001
-        assert comment["user"]["id"] == "U01AGENT"
+        _assert_subset(
+            comment,
+            {
+                "body": "This is a test comment from integration test",
+                "issue": {"id": ISSUE_ENG_001},
+                "user": {"id": USER_AGENT},
+            },
+        )
 
     async def test_create_comment_invalid_issue(self, linear_client: AsyncClient):
         """Test creating a comment with invalid issueId fails."""
@@ -507,7 +593,7 @@ class TestCommentCreate:
             "/graphql", json={"query": query, "variables": variables}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "errors" in data
 
 
@@ -533,12 +619,8 @@ class TestTeamCreate:
                 "key": "PRODX",  # avoid collision with seeded PROD team
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["teamCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["teamCreate"]
         assert result["success"] is True
         team = result["team"]
         assert team["name"] == "Product Team"
@@ -566,7 +648,7 @@ class TestTeamCreate:
             "/graphql", json={"query": query, "variables": variables}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "errors" in data
 
 
@@ -579,10 +661,8 @@ class TestIssueBatchCreate:
             issueBatchCreate(input: $input) {
               success
               issues {
-                id
                 title
                 team {
-                  id
                   key
                 }
               }
@@ -598,12 +678,8 @@ class TestIssueBatchCreate:
                 ]
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["issueBatchCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueBatchCreate"]
         assert result["success"] is True
         issues = result["issues"]
         assert len(issues) == 3
@@ -634,19 +710,17 @@ class TestIssueBatchCreate:
                 ]
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["issueBatchCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueBatchCreate"]
         assert result["success"] is True
         issues = result["issues"]
         assert len(issues) == 2
-        assert issues[0]["team"]["key"] == "ENG"
-        assert issues[1]["team"]["key"] == "ENG"
-        assert issues[0]["title"] == "First engineering issue"
-        assert issues[1]["title"] == "Second engineering issue"
+        _assert_subset(
+            issues[0], {"title": "First engineering issue", "team": {"key": "ENG"}}
+        )
+        _assert_subset(
+            issues[1], {"title": "Second engineering issue", "team": {"key": "ENG"}}
+        )
 
 
 # ==========================================
@@ -667,7 +741,6 @@ class TestIssueLabelCreate:
                 name
                 color
                 team {
-                  id
                   key
                 }
               }
@@ -681,17 +754,13 @@ class TestIssueLabelCreate:
                 "teamId": TEAM_ENG,
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["issueLabelCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueLabelCreate"]
         assert result["success"] is True
         label = result["issueLabel"]
-        assert label["name"] == "Bug"
-        assert label["color"] == "#e5484d"
-        assert label["team"]["key"] == "ENG"
+        _assert_subset(
+            label, {"name": "Bug", "color": "#e5484d", "team": {"key": "ENG"}}
+        )
 
     async def test_create_label_without_team(self, linear_client: AsyncClient):
         """Test creating an organization-wide label (no team)."""
@@ -713,12 +782,8 @@ class TestIssueLabelCreate:
                 "color": "#f76808",
             }
         }
-        response = await linear_client.post(
-            "/graphql", json={"query": query, "variables": variables}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        result = data["data"]["issueLabelCreate"]
+        data = await _gql(linear_client, query, variables)
+        result = data["issueLabelCreate"]
         assert result["success"] is True
         label = result["issueLabel"]
         assert label["name"] == "Priority"
@@ -730,17 +795,6 @@ class TestIssueLabels:
     async def test_add_label_to_issue(self, linear_client: AsyncClient):
         """Test adding a label to an issue."""
         # First, create a label
-        create_label_query = """
-          mutation($input: IssueLabelCreateInput!) {
-            issueLabelCreate(input: $input) {
-              success
-              issueLabel {
-                id
-                name
-              }
-            }
-          }
-        """
         create_variables = {
             "input": {
                 "name": "Frontend",
@@ -748,13 +802,8 @@ class TestIssueLabels:
                 "teamId": TEAM_ENG,
             }
         }
-        create_response = await linear_client.post(
-            "/graphql",
-            json={"query": create_label_query, "variables": create_variables},
-        )
-        assert create_response.status_code == 200
-        create_data = create_response.json()
-        label_id = create_data["data"]["issueLabelCreate"]["issueLabel"]["id"]
+        create_data = await _gql(linear_client, CREATE_LABEL_MUTATION, create_variables)
+        label_id = create_data["issueLabelCreate"]["issueLabel"]["id"]
 
         # Now add the label to an issue
         add_label_query = """
@@ -777,60 +826,36 @@ class TestIssueLabels:
             "id": ISSUE_ENG_001,
             "labelId": label_id,
         }
-        add_response = await linear_client.post(
-            "/graphql", json={"query": add_label_query, "variables": add_variables}
-        )
-        assert add_response.status_code == 200
-        add_data = add_response.json()
-        result = add_data["data"]["issueAddLabel"]
+        add_data = await _gql(linear_client, add_label_query, add_variables)
+        result = add_data["issueAddLabel"]
         assert result["success"] is True
         labels = result["issue"]["labels"]["nodes"]
         assert len(labels) >= 1
-        assert any(label["id"] == label_id for label in labels)
-        assert any(label["name"] == "Frontend" for label in labels)
+        labels_by_id = {label["id"]: label for label in labels}
+        assert label_id in labels_by_id
+        assert labels_by_id[label_id]["name"] == "Frontend"
 
     async def test_remove_label_from_issue(self, linear_client: AsyncClient):
         """Test removing a label from an issue."""
         # First, create a label and add it to an issue
-        create_label_query = """
-          mutation($input: IssueLabelCreateInput!) {
-            issueLabelCreate(input: $input) {
-              issueLabel {
-                id
-              }
-            }
-          }
-        """
-        create_response = await linear_client.post(
-            "/graphql",
-            json={
-                "query": create_label_query,
-                "variables": {
-                    "input": {
-                        "name": "Backend",
-                        "color": "#10b981",
-                        "teamId": TEAM_ENG,
-                    }
-                },
-            },
+        create_data = await _gql(
+            linear_client,
+            CREATE_LABEL_MUTATION,
+            {"input": {"name": "Backend", "color": "#10b981", "teamId": TEAM_ENG}},
         )
-        label_id = create_response.json()["data"]["issueLabelCreate"]["issueLabel"][
-            "id"
-        ]
+        label_id = create_data["issueLabelCreate"]["issueLabel"]["id"]
 
         # Add the label
-        await linear_client.post(
-            "/graphql",
-            json={
-                "query": """
-                  mutation($id: String!, $labelId: String!) {
-                    issueAddLabel(id: $id, labelId: $labelId) {
-                      success
-                    }
-                  }
-                """,
-                "variables": {"id": ISSUE_ENG_001, "labelId": label_id},
-            },
+        await _gql(
+            linear_client,
+            """
+              mutation($id: String!, $labelId: String!) {
+                issueAddLabel(id: $id, labelId: $labelId) {
+                  success
+                }
+              }
+            """,
+            {"id": ISSUE_ENG_001, "labelId": label_id},
         )
 
         # Now remove the label
@@ -854,12 +879,8 @@ class TestIssueLabels:
             "id": ISSUE_ENG_001,
             "labelId": label_id,
         }
-        remove_response = await linear_client.post(
-            "/graphql", json={"query": remove_query, "variables": remove_variables}
-        )
-        assert remove_response.status_code == 200
-        remove_data = remove_response.json()
-        result = remove_data["data"]["issueRemoveLabel"]
+        remove_data = await _gql(linear_client, remove_query, remove_variables)
+        result = remove_data["issueRemoveLabel"]
         assert result["success"] is True
         labels = result["issue"]["labels"]["nodes"]
         # Label should be removed
@@ -871,31 +892,12 @@ class TestIssueLabelUpdate:
     async def test_update_label(self, linear_client: AsyncClient):
         """Test updating a label's properties."""
         # First create a label
-        create_query = """
-          mutation($input: IssueLabelCreateInput!) {
-            issueLabelCreate(input: $input) {
-              issueLabel {
-                id
-              }
-            }
-          }
-        """
-        create_response = await linear_client.post(
-            "/graphql",
-            json={
-                "query": create_query,
-                "variables": {
-                    "input": {
-                        "name": "Old Name",
-                        "color": "#000000",
-                        "teamId": TEAM_ENG,
-                    }
-                },
-            },
+        create_data = await _gql(
+            linear_client,
+            CREATE_LABEL_MUTATION,
+            {"input": {"name": "Old Name", "color": "#000000", "teamId": TEAM_ENG}},
         )
-        label_id = create_response.json()["data"]["issueLabelCreate"]["issueLabel"][
-            "id"
-        ]
+        label_id = create_data["issueLabelCreate"]["issueLabel"]["id"]
 
         # Update the label
         update_query = """
@@ -917,12 +919,8 @@ class TestIssueLabelUpdate:
                 "color": "#ffffff",
             },
         }
-        update_response = await linear_client.post(
-            "/graphql", json={"query": update_query, "variables": update_variables}
-        )
-        assert update_response.status_code == 200
-        update_data = update_response.json()
-        result = update_data["data"]["issueLabelUpdate"]
+        update_data = await _gql(linear_client, update_query, update_variables)
+        result = update_data["issueLabelUpdate"]
         assert result["success"] is True
         label = result["issueLabel"]
         assert label["name"] == "New Name"
@@ -934,31 +932,18 @@ class TestIssueLabelDelete:
     async def test_delete_label(self, linear_client: AsyncClient):
         """Test deleting a label."""
         # First create a label
-        create_query = """
-          mutation($input: IssueLabelCreateInput!) {
-            issueLabelCreate(input: $input) {
-              issueLabel {
-                id
-              }
-            }
-          }
-        """
-        create_response = await linear_client.post(
-            "/graphql",
-            json={
-                "query": create_query,
-                "variables": {
-                    "input": {
-                        "name": "Temporary",
-                        "color": "#888888",
-                        "teamId": TEAM_ENG,
-                    }
-                },
+        create_data = await _gql(
+            linear_client,
+            CREATE_LABEL_MUTATION,
+            {
+                "input": {
+                    "name": "Temporary",
+                    "color": "#888888",
+                    "teamId": TEAM_ENG,
+                }
             },
         )
-        label_id = create_response.json()["data"]["issueLabelCreate"]["issueLabel"][
-            "id"
-        ]
+        label_id = create_data["issueLabelCreate"]["issueLabel"]["id"]
 
         # Delete the label
         delete_query = """
@@ -969,10 +954,6 @@ class TestIssueLabelDelete:
           }
         """
         delete_variables = {"id": label_id}
-        delete_response = await linear_client.post(
-            "/graphql", json={"query": delete_query, "variables": delete_variables}
-        )
-        assert delete_response.status_code == 200
-        delete_data = delete_response.json()
-        result = delete_data["data"]["issueLabelDelete"]
+        delete_data = await _gql(linear_client, delete_query, delete_variables)
+        result = delete_data["issueLabelDelete"]
         assert result["success"] is True
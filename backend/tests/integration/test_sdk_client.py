@@ -7,8 +7,22 @@ Tests verify:
 """
 
 import pytest
-from uuid import UUID
-
+import requests
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
+
+from agent_diff.models import (
+    CreateTemplateFromEnvRequest,
+    CreateTestSuiteRequest,
+    CreateTestsRequest,
+    DiffRunRequest,
+    EndRunRequest,
+    InitEnvRequestBody,
+    StartRunRequest,
+    TestItem,
+)
+from sqlalchemy import text
+from src.platform.api.models import InitEnvRequestBody as APIInitEnvRequestBody
 from src.platform.db.schema import (
     TemplateEnvironment,
     TestSuite as DBTestSuite,
@@ -17,6 +31,78 @@ from src.platform.db.schema import (
     RunTimeEnvironment,
     TestRun,
 )
+from src.platform.isolationEngine.templateManager import TemplateManager
+from tests.conftest import worker_tagged
+
+_NOOP_ASSERTION = {
+    "assertions": [
+        {
+            "diff_type": "added",
+            "entity": "messages",
+            "where": {"channel_id": {"eq": "nonexistent"}},
+            "expected_count": 0,
+        }
+    ],
+}
+
+
+def _test_item(
+    name: str,
+    type_: str = "actionEval",
+    prompt: str = "Prompt",
+    environment_template: str = "slack:slack_default",
+):
+    """Build an unvalidated TestItem whose only assertion never matches anything."""
+    return TestItem.model_construct(
+        name=name,
+        prompt=prompt,
+        type=type_,
+        expected_output=_NOOP_ASSERTION,
+        environmentTemplate=environment_template,
+    )
+
+
+def _init_slack(impersonate_user_id: str, ttl_seconds: int = 600, **selector):
+    """Build an InitEnvRequestBody without validation (inputs are literals).
+
+    Defaults to the slack_default template; pass templateId or templateSchema
+    to select it another way.
+    """
+
+    selector = selector or {
+        "templateService": "slack",
+        "templateName": "slack_default",
+    }
+    return InitEnvRequestBody.model_construct(
+        impersonateUserId=worker_tagged(impersonate_user_id),
+        ttlSeconds=ttl_seconds,
+        **selector,
+    )
+
+
+def _load_suite_with_tests(session, suite_id):
+    """Load a suite and its member tests in a single outer-joined query."""
+    rows = (
+        session.query(DBTestSuite, DBTest)
+        .outerjoin(TestMembership, TestMembership.test_suite_id == DBTestSuite.id)
+        .outerjoin(DBTest, DBTest.id == TestMembership.test_id)
+        .filter(DBTestSuite.id == suite_id)
+        .all()
+    )
+    assert rows, f"test suite {suite_id} not found"
+    return rows[0][0], [test for _, test in rows if test is not None]
+
+
+def _load_test_with_template(session, test_id):
+    """Load a test and the template its template_schema resolved to, in one query."""
+    return (
+        session.query(DBTest, TemplateEnvironment)
+        .outerjoin(
+            TemplateEnvironment, TemplateEnvironment.location == DBTest.template_schema
+        )
+        .filter(DBTest.id == test_id)
+        .one()
+    )
 
 
 class TestTemplateOperations:
@@ -42,13 +128,10 @@ class TestTemplateOperations:
             assert tmpl.name is not None
 
     def test_get_template_by_id_success(
-        self, sdk_client, session_manager, cleanup_test_environments
+        self, sdk_client, meta_session, slack_template_id
     ):
         """Get template by ID should return full template detail."""
-        # First, list to get a valid template ID
-        templates = sdk_client.list_templates()
-        assert len(templates.templates) > 0
-        template_id = templates.templates[0].id
+        template_id = slack_template_id
 
         # Fetch detail
         detail = sdk_client.get_template(template_id)
@@ -58,19 +141,12 @@ class TestTemplateOperations:
         assert detail.schemaName is not None
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            tmpl = (
-                s.query(TemplateEnvironment)
-                .filter(TemplateEnvironment.id == template_id)
-                .one()
-            )
-            assert tmpl.location == detail.schemaName
-            assert tmpl.version == detail.version
+        tmpl = meta_session.get(TemplateEnvironment, template_id)
+        assert tmpl.location == detail.schemaName
+        assert tmpl.version == detail.version
 
     def test_get_template_not_found(self, sdk_client):
         """Get template with invalid UUID should raise 404."""
-        from uuid import uuid4
-        import requests
 
         nonexistent_id = uuid4()
         with pytest.raises(requests.HTTPError) as exc_info:
@@ -79,100 +155,51 @@ class TestTemplateOperations:
         assert exc_info.value.response.status_code == 404
 
 
-class TestEnvironmentOperations:
-    """Test SDK environment initialization and lifecycle."""
+@pytest.fixture(scope="module")
+def module_env_ids(sdk_client):
+    """Env IDs created by shared fixtures, bulk-deleted at module teardown."""
+    env_ids = []
+    yield env_ids
+    if env_ids:
+        sdk_client.delete_envs(env_ids)
 
-    def test_init_env_by_template_id(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Init environment by templateId should create runtime environment."""
-        from agent_diff.models import InitEnvRequestBody
 
-        # Get a template ID
-        templates = sdk_client.list_templates()
-        template = next((t for t in templates.templates if t.service == "slack"), None)
-        assert template is not None, "No slack template found"
+@pytest.fixture(scope="class", params=["by_id", "by_service_name", "legacy_schema"])
+def initialized_env(request, sdk_client, slack_template_id, module_env_ids):
+    """Initialize one environment per init mode, shared across the class."""
+    if request.param == "by_id":
+        req = _init_slack("U01TEST1234", templateId=slack_template_id)
+    elif request.param == "by_service_name":
+        req = _init_slack("U01TEST5678")
+    else:
+        req = _init_slack("U01LEGACY99", templateSchema="slack_default")
 
-        # Initialize environment
-        req = InitEnvRequestBody(
-            templateId=template.id,
-            impersonateUserId="U01TEST1234",
-            ttlSeconds=600,
-        )
-        resp = sdk_client.init_env(req)
+    resp = sdk_client.init_env(req)
+    module_env_ids.append(resp.environmentId)
+    return req, resp
 
-        assert resp.environmentId is not None
-        assert resp.service == "slack"
-        assert resp.environmentUrl is not None
-        assert resp.expiresAt is not None
 
-        # Verify in DB
-        with session_manager.with_meta_session() as s:
-            env = (
-                s.query(RunTimeEnvironment)
-                .filter(RunTimeEnvironment.id == resp.environmentId)
-                .one()
-            )
-            assert env.status == "ready"
-            assert env.impersonate_user_id == "U01TEST1234"
-            assert env.schema.startswith("state_")
+class TestEnvironmentOperations:
+    """Test SDK environment initialization and lifecycle."""
 
-    def test_init_env_by_service_and_name(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Init environment by templateService + templateName."""
-        from agent_diff.models import InitEnvRequestBody
-
-        req = InitEnvRequestBody(
-            templateService="slack",
-            templateName="slack_default",
-            impersonateUserId="U01TEST5678",
-            ttlSeconds=600,
-        )
-        resp = sdk_client.init_env(req)
+    def test_init_env_creates_runtime_environment(self, initialized_env):
+        """Init environment by templateId, service + name, or legacy schema."""
+        req, resp = initialized_env
 
         assert resp.environmentId is not None
         assert resp.service == "slack"
+        assert resp.environmentUrl is not None
+        assert resp.schemaName.startswith("state_")
+        if req.templateSchema is not None:
+            assert resp.templateSchema == req.templateSchema
+        if req.templateId is not None:
+            assert resp.expiresAt is not None
 
-        # Verify in DB
-        with session_manager.with_meta_session() as s:
-            env = (
-                s.query(RunTimeEnvironment)
-                .filter(RunTimeEnvironment.id == resp.environmentId)
-                .one()
-            )
-            assert env.status == "ready"
-            assert env.impersonate_user_id == "U01TEST5678"
-
-    def test_init_env_legacy_template_schema(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Init environment by legacy templateSchema."""
-        from agent_diff.models import InitEnvRequestBody
-
-        req = InitEnvRequestBody(
-            templateSchema="slack_default",
-            impersonateUserId="U01LEGACY99",
-            ttlSeconds=600,
-        )
-        resp = sdk_client.init_env(req)
-
-        assert resp.environmentId is not None
-        assert resp.templateSchema == "slack_default"
-
-        # Verify in DB
-        with session_manager.with_meta_session() as s:
-            env = (
-                s.query(RunTimeEnvironment)
-                .filter(RunTimeEnvironment.id == resp.environmentId)
-                .one()
-            )
-            assert env.status == "ready"
+        assert resp.status == "ready"
+        assert resp.impersonateUserId == req.impersonateUserId
 
     def test_init_env_missing_impersonate_fails(self, sdk_client):
         """Init env without impersonation should fail when no testId."""
-        from agent_diff.models import InitEnvRequestBody
-        import requests
 
         req = InitEnvRequestBody(
             templateService="slack",
@@ -185,66 +212,88 @@ class TestEnvironmentOperations:
         assert exc_info.value.response.status_code == 400
 
     def test_delete_env_success(
-        self, sdk_client, session_manager, cleanup_test_environments
+        self, sdk_client, session_manager, meta_session, cleanup_test_environments
     ):
         """Delete environment should mark it deleted and drop schema."""
-        from agent_diff.models import InitEnvRequestBody
-        from sqlalchemy import text
 
         # Create environment
-        req = InitEnvRequestBody(
-            templateService="slack",
-            templateName="slack_default",
-            impersonateUserId="U01DEL1234",
-            ttlSeconds=600,
-        )
+        req = _init_slack("U01DEL1234")
         init_resp = sdk_client.init_env(req)
         env_id = init_resp.environmentId
         schema_name = init_resp.schemaName
 
-        # Verify schema exists
-        with session_manager.base_engine.begin() as conn:
-            exists_before = conn.execute(
-                text(
-                    "SELECT EXISTS (SELECT 1 FROM information_schema.schemata WHERE schema_name = :schema)"
-                ),
-                {"schema": schema_name},
-            ).scalar()
-        assert exists_before is True
-
-        # Delete
-        delete_resp = sdk_client.delete_env(env_id)
-        assert delete_resp.environmentId == env_id
-        assert delete_resp.status == "deleted"
-
-        # Verify schema dropped
-        with session_manager.base_engine.begin() as conn:
-            exists_after = conn.execute(
-                text(
-                    "SELECT EXISTS (SELECT 1 FROM information_schema.schemata WHERE schema_name = :schema)"
-                ),
-                {"schema": schema_name},
-            ).scalar()
-        assert exists_after is False
+        schema_exists = text("SELECT 1 FROM pg_namespace WHERE nspname = :schema")
 
-        # Verify status in DB
-        with session_manager.with_meta_session() as s:
-            env = (
-                s.query(RunTimeEnvironment)
-                .filter(RunTimeEnvironment.id == env_id)
-                .one()
+        with session_manager.base_engine.connect() as conn:
+            # Verify schema exists
+            exists_before = (
+                conn.execute(schema_exists, {"schema": schema_name}).scalar()
+                is not None
+            )
+            assert exists_before is True
+
+            # Delete
+            delete_resp = sdk_client.delete_env(env_id)
+            assert delete_resp.environmentId == env_id
+            assert delete_resp.status == "deleted"
+
+            # Verify schema dropped
+            exists_after = (
+                conn.execute(schema_exists, {"schema": schema_name}).scalar()
+                is not None
             )
-            assert env.status == "deleted"
+            assert exists_after is False
+
+        # Verify status in DB
+        env = meta_session.get(RunTimeEnvironment, UUID(env_id))
+        assert env.status == "deleted"
+
+
+@pytest.fixture(scope="module")
+def module_suites(sdk_client):
+    """Suites that tests only read from, created with one bulk request."""
+    keys_and_requests = {
+        "shared": CreateTestSuiteRequest.model_construct(
+            name="Shared Suite",
+            description="Test",
+            visibility="private",
+            tests=[
+                _test_item("Shared Test", environment_template="slack:slack_default")
+            ],
+        ),
+        "visible": CreateTestSuiteRequest.model_construct(
+            name="Visible Suite", description="Test", visibility="private"
+        ),
+        "expand": CreateTestSuiteRequest.model_construct(
+            name="Suite for Expand Test",
+            description="Test",
+            visibility="private",
+            tests=[_test_item("Expand Test 1", type_="retriEval")],
+        ),
+        "get_test": CreateTestSuiteRequest.model_construct(
+            name="Get Test Suite",
+            description="Test",
+            visibility="private",
+            tests=[_test_item("Get Test 1")],
+        ),
+    }
+    resp = sdk_client.create_test_suites(list(keys_and_requests.values()))
+    return dict(zip(keys_and_requests, resp.testSuites))
+
+
+@pytest.fixture(scope="module")
+def shared_suite(module_suites):
+    """Suite with one noop slack:slack_default test, for tests that only read it."""
+    return module_suites["shared"]
 
 
 class TestSuiteOperations:
     """Test SDK test suite creation and retrieval."""
 
     def test_create_test_suite_without_tests(
-        self, sdk_client, session_manager, test_user_id
+        self, sdk_client, meta_session, test_user_id
     ):
         """Create test suite without tests should persist suite only."""
-        from agent_diff.models import CreateTestSuiteRequest
 
         req = CreateTestSuiteRequest(
             name="My Test Suite",
@@ -257,90 +306,83 @@ class TestSuiteOperations:
         assert resp.name == "My Test Suite"
         assert resp.description == "A test suite for SDK tests"
         assert resp.visibility == "private"
+        assert resp.tests == []
 
-        # Verify in DB
-        with session_manager.with_meta_session() as s:
-            suite = s.query(DBTestSuite).filter(DBTestSuite.id == resp.id).one()
-            assert suite.name == "My Test Suite"
-            assert suite.owner == test_user_id
-            assert suite.visibility == "private"
-
-            # No tests should exist
-            test_count = (
-                s.query(TestMembership)
-                .filter(TestMembership.test_suite_id == suite.id)
-                .count()
-            )
-            assert test_count == 0
+        # Owner and memberships are server-side only
+        suite, tests = _load_suite_with_tests(meta_session, resp.id)
+        assert suite.owner == test_user_id
+        assert tests == []
 
-    def test_create_test_suite_with_tests(
-        self, sdk_client, session_manager, test_user_id
-    ):
+    def test_create_test_suite_with_tests(self, sdk_client, meta_session, test_user_id):
         """Create test suite with embedded tests should persist both."""
-        from agent_diff.models import CreateTestSuiteRequest, TestItem
 
         req = CreateTestSuiteRequest(
             name="Suite with Tests",
             description="Test",
             visibility="public",
-            tests=[
-                TestItem(
-                    name="Test 1",
-                    prompt="Do something",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
+            tests=[_test_item("Test 1", prompt="Do something")],
         )
         resp = sdk_client.create_test_suite(req)
 
         assert isinstance(resp.id, UUID)
-
-        # Verify suite in DB
-        with session_manager.with_meta_session() as s:
-            suite = s.query(DBTestSuite).filter(DBTestSuite.id == resp.id).one()
-            assert suite.name == "Suite with Tests"
-            assert suite.visibility == "public"
-
-            # Verify test created
-            test_count = (
-                s.query(TestMembership)
-                .filter(TestMembership.test_suite_id == suite.id)
-                .count()
+        assert resp.visibility == "public"
+        assert len(resp.tests) == 1
+        assert resp.tests[0].name == "Test 1"
+        assert resp.tests[0].type == "actionEval"
+
+        # Verify the membership row links the created test to the suite
+        suite, tests = _load_suite_with_tests(meta_session, resp.id)
+        assert suite.owner == test_user_id
+        assert [test.id for test in tests] == [resp.tests[0].id]
+
+    def test_create_test_suites_bulk(self, module_suites, meta_session, test_user_id):
+        """Bulk create should persist every suite with its own tests."""
+        for created in module_suites.values():
+            suite, tests = _load_suite_with_tests(meta_session, created.id)
+            assert suite.name == created.name
+            assert suite.owner == test_user_id
+            assert sorted(test.id for test in tests) == sorted(
+                test.id for test in created.tests
             )
-            assert test_count == 1
 
-            # Load the test
-            membership = (
-                s.query(TestMembership)
-                .filter(TestMembership.test_suite_id == suite.id)
-                .first()
-            )
-            test = s.query(DBTest).filter(DBTest.id == membership.test_id).one()
-            assert test.name == "Test 1"
-            assert test.type == "actionEval"
+        assert module_suites["visible"].tests == []
+        assert [t.name for t in module_suites["expand"].tests] == ["Expand Test 1"]
 
-    def test_list_test_suites_returns_visible_suites(self, sdk_client, session_manager):
-        """List test suites should return public suites and user-owned suites."""
-        from agent_diff.models import CreateTestSuiteRequest
+    def test_create_test_suites_bulk_invalid_suite_creates_none(
+        self, sdk_client, meta_session
+    ):
+        """A bad template in a later suite should reject the whole batch."""
+        names = [f"Bulk Valid {uuid4().hex}", f"Bulk Invalid {uuid4().hex}"]
+        reqs = [
+            CreateTestSuiteRequest.model_construct(
+                name=names[0],
+                description="Test",
+                visibility="private",
+                tests=[_test_item("Valid Test")],
+            ),
+            CreateTestSuiteRequest.model_construct(
+                name=names[1],
+                description="Test",
+                visibility="private",
+                tests=[
+                    _test_item(
+                        "Invalid Test", environment_template="slack:does_not_exist"
+                    )
+                ],
+            ),
+        ]
+        with pytest.raises(requests.HTTPError) as exc_info:
+            sdk_client.create_test_suites(reqs)
 
-        # Create a suite
-        req = CreateTestSuiteRequest(
-            name="Visible Suite",
-            description="Test",
-            visibility="private",
+        assert exc_info.value.response.status_code == 400
+        assert (
+            meta_session.query(DBTestSuite).filter(DBTestSuite.name.in_(names)).count()
+            == 0
         )
-        created = sdk_client.create_test_suite(req)
+
+    def test_list_test_suites_returns_visible_suites(self, sdk_client, module_suites):
+        """List test suites should return public suites and user-owned suites."""
+        created = module_suites["visible"]
 
         # List
         resp = sdk_client.list_test_suites()
@@ -349,37 +391,9 @@ class TestSuiteOperations:
         suite_ids = {s.id for s in resp.testSuites}
         assert created.id in suite_ids
 
-    def test_get_test_suite_with_expand(
-        self, sdk_client, session_manager, test_user_id
-    ):
+    def test_get_test_suite_with_expand(self, sdk_client, module_suites):
         """Get test suite with expand=tests should include tests."""
-        from agent_diff.models import CreateTestSuiteRequest, TestItem
-
-        # Create suite with tests
-        req = CreateTestSuiteRequest(
-            name="Suite for Expand Test",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Expand Test 1",
-                    prompt="Prompt",
-                    type="retriEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        created = sdk_client.create_test_suite(req)
+        created = module_suites["expand"]
 
         # Get with expand=tests
         detail = sdk_client.get_test_suite(created.id, expand=True)
@@ -387,6 +401,7 @@ class TestSuiteOperations:
         assert detail.id == created.id
         assert detail.name == "Suite for Expand Test"
         assert len(detail.tests) == 1
+        assert detail.tests[0].id == created.tests[0].id
         assert detail.tests[0].name == "Expand Test 1"
 
         # Get without expand
@@ -399,13 +414,8 @@ class TestSuiteOperations:
 class TestOperations:
     """Test SDK test creation and retrieval."""
 
-    def test_create_tests_batch(self, sdk_client, session_manager, test_user_id):
+    def test_create_tests_batch(self, sdk_client, meta_session, test_user_id):
         """Create multiple tests via batch endpoint."""
-        from agent_diff.models import (
-            CreateTestSuiteRequest,
-            CreateTestsRequest,
-            TestItem,
-        )
 
         # Create suite first
         suite_req = CreateTestSuiteRequest(
@@ -416,38 +426,8 @@ class TestOperations:
         # Create tests in batch
         tests_req = CreateTestsRequest(
             tests=[
-                TestItem(
-                    name="Batch Test 1",
-                    prompt="Prompt 1",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                ),
-                TestItem(
-                    name="Batch Test 2",
-                    prompt="Prompt 2",
-                    type="retriEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                ),
+                _test_item("Batch Test 1", prompt="Prompt 1"),
+                _test_item("Batch Test 2", type_="retriEval", prompt="Prompt 2"),
             ]
         )
         resp = sdk_client.create_tests(suite.id, tests_req)
@@ -457,22 +437,15 @@ class TestOperations:
         assert resp.tests[1].name == "Batch Test 2"
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            test_count = (
-                s.query(TestMembership)
-                .filter(TestMembership.test_suite_id == suite.id)
-                .count()
-            )
-            assert test_count == 2
+        _, tests = _load_suite_with_tests(meta_session, suite.id)
+        assert len(tests) == 2
 
-            # Verify both tests exist
-            for test_resp in resp.tests:
-                test = s.query(DBTest).filter(DBTest.id == test_resp.id).one()
-                assert test.name in ["Batch Test 1", "Batch Test 2"]
+        # Verify both tests exist
+        assert {test.id for test in tests} == {t.id for t in resp.tests}
+        assert {test.name for test in tests} == {"Batch Test 1", "Batch Test 2"}
 
-    def test_create_test_single(self, sdk_client, session_manager, test_user_id):
+    def test_create_test_single(self, sdk_client, meta_session, test_user_id):
         """Create single test (convenience wrapper)."""
-        from agent_diff.models import CreateTestSuiteRequest
 
         # Create suite
         suite_req = CreateTestSuiteRequest(
@@ -504,50 +477,20 @@ class TestOperations:
         assert test.type == "compositeEval"
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            db_test = s.query(DBTest).filter(DBTest.id == test.id).one()
-            assert db_test.name == "Single Test"
-
-            membership = (
-                s.query(TestMembership)
-                .filter(TestMembership.test_id == test.id)
-                .first()
-            )
-            assert membership.test_suite_id == suite.id
+        db_test, membership = (
+            meta_session.query(DBTest, TestMembership)
+            .join(TestMembership, TestMembership.test_id == DBTest.id)
+            .filter(DBTest.id == test.id)
+            .one()
+        )
+        assert db_test.name == "Single Test"
+        assert membership.test_suite_id == suite.id
 
-    def test_get_test_success(self, sdk_client, session_manager):
+    def test_get_test_success(self, sdk_client, module_suites):
         """Get test by ID should return full test detail."""
-        from agent_diff.models import CreateTestSuiteRequest, TestItem
-
-        # Create suite with test
-        suite_req = CreateTestSuiteRequest(
-            name="Get Test Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Get Test 1",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
+        suite = module_suites["get_test"]
 
-        # Get suite with tests to find test ID
-        detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = detail.tests[0].id
+        test_id = suite.tests[0].id
 
         # Get individual test
         test = sdk_client.get_test(test_id)
@@ -560,8 +503,6 @@ class TestOperations:
 
     def test_get_test_not_found(self, sdk_client):
         """Get test with invalid ID should raise 404."""
-        from uuid import uuid4
-        import requests
 
         with pytest.raises(requests.HTTPError) as exc_info:
             sdk_client.get_test(uuid4())
@@ -569,133 +510,69 @@ class TestOperations:
         assert exc_info.value.response.status_code == 404
 
 
+class StartedRun(NamedTuple):
+    env: Any
+    suite: Any
+    test_id: UUID
+    run: Any
+
+
+def _start_run(sdk_client, suite, impersonate_user_id: str) -> StartedRun:
+    """Create an env and start a run of the suite's first test against it."""
+    env_resp = sdk_client.init_env(_init_slack(impersonate_user_id))
+    test_id = suite.tests[0].id
+    run_resp = sdk_client.start_run(
+        StartRunRequest.model_construct(
+            envId=env_resp.environmentId, testId=test_id, testSuiteId=suite.id
+        )
+    )
+    return StartedRun(env=env_resp, suite=suite, test_id=test_id, run=run_resp)
+
+
+@pytest.fixture(scope="module")
+def started_run_shared(sdk_client, shared_suite, module_env_ids):
+    """Started run shared by tests that only read it (start/diff checks)."""
+    started = _start_run(sdk_client, shared_suite, "U01RUN1234")
+    module_env_ids.append(started.env.environmentId)
+    return started
+
+
+@pytest.fixture
+def started_run_fresh(sdk_client, shared_suite, cleanup_test_environments):
+    """Started run for tests that evaluate (and so finish) the run."""
+    return _start_run(sdk_client, shared_suite, "U01END1234")
+
+
 class TestRunLifecycle:
     """Test SDK run creation, evaluation, and result retrieval."""
 
     def test_start_test_run_creates_run_and_snapshot(
-        self, sdk_client, session_manager, cleanup_test_environments
+        self, started_run_shared, meta_session
     ):
         """Start test run should create TestRun row and before snapshot."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTestSuiteRequest,
-            TestItem,
-            StartRunRequest,
-        )
-
-        # Setup: create env, suite, and test
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01RUN1234",
-                ttlSeconds=600,
-            )
-        )
-        suite_req = CreateTestSuiteRequest(
-            name="Run Test Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Run Test 1",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = suite_detail.tests[0].id
-
-        # Start run
-        start_req = StartRunRequest(
-            envId=env_resp.environmentId,
-            testId=test_id,
-            testSuiteId=suite.id,
-        )
-        run_resp = sdk_client.start_run(start_req)
+        env_resp, _, test_id, run_resp = started_run_shared
 
         assert run_resp.runId is not None
         assert run_resp.status == "running"
         assert run_resp.beforeSnapshot is not None
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            run = s.query(TestRun).filter(TestRun.id == run_resp.runId).one()
-            assert run.status == "running"
-            assert run.test_id == test_id
-            assert run.environment_id == UUID(env_resp.environmentId)
-            assert run.before_snapshot_suffix == run_resp.beforeSnapshot
-            assert run.after_snapshot_suffix is None  # Not taken yet
+        run = meta_session.get(TestRun, UUID(run_resp.runId))
+        assert run.status == "running"
+        assert run.test_id == test_id
+        assert run.environment_id == UUID(env_resp.environmentId)
+        assert run.before_snapshot_suffix == run_resp.beforeSnapshot
+        assert run.after_snapshot_suffix is None  # Not taken yet
 
     def test_end_test_run_evaluates_and_stores_result(
-        self, sdk_client, session_manager, cleanup_test_environments
+        self, sdk_client, meta_session, started_run_fresh
     ):
         """End test run should evaluate, compute diff, and store result."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTestSuiteRequest,
-            TestItem,
-            StartRunRequest,
-            EndRunRequest,
-        )
-
-        # Setup
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01END1234",
-                ttlSeconds=600,
-            )
-        )
-        suite_req = CreateTestSuiteRequest(
-            name="End Run Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="End Run Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = suite_detail.tests[0].id
 
-        # Start run
-        start_req = StartRunRequest(
-            envId=env_resp.environmentId, testId=test_id, testSuiteId=suite.id
-        )
-        run_resp = sdk_client.start_run(start_req)
+        run_resp = started_run_fresh.run
 
         # End run (no actions taken, so diff should be minimal/empty)
-        end_req = EndRunRequest(runId=run_resp.runId)
+        end_req = EndRunRequest.model_construct(runId=run_resp.runId)
         end_resp = sdk_client.evaluate_run(end_req)
 
         assert end_resp.runId == run_resp.runId
@@ -704,68 +581,18 @@ class TestRunLifecycle:
         assert end_resp.score is not None
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            run = s.query(TestRun).filter(TestRun.id == run_resp.runId).one()
-            assert run.status in ["passed", "failed", "error"]
-            assert run.after_snapshot_suffix is not None
-            assert run.result is not None
-            assert "passed" in run.result
-            assert "score" in run.result
-
-    def test_get_run_result_returns_full_detail(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
+        run = meta_session.get(TestRun, UUID(run_resp.runId))
+        assert run.status in ["passed", "failed", "error"]
+        assert run.after_snapshot_suffix is not None
+        assert run.result is not None
+        assert "passed" in run.result
+        assert "score" in run.result
+
+    def test_get_run_result_returns_full_detail(self, sdk_client, started_run_fresh):
         """Get run result should return full evaluation with diff."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTestSuiteRequest,
-            TestItem,
-            StartRunRequest,
-            EndRunRequest,
-        )
-
-        # Setup and run
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01RESULT99",
-                ttlSeconds=600,
-            )
-        )
-        suite_req = CreateTestSuiteRequest(
-            name="Result Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Result Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = suite_detail.tests[0].id
 
-        start_resp = sdk_client.start_run(
-            StartRunRequest(
-                envId=env_resp.environmentId, testId=test_id, testSuiteId=suite.id
-            )
-        )
-        sdk_client.evaluate_run(EndRunRequest(runId=start_resp.runId))
+        start_resp = started_run_fresh.run
+        sdk_client.evaluate_run(EndRunRequest.model_construct(runId=start_resp.runId))
 
         # Get result
         result = sdk_client.get_results_for_run(start_resp.runId)
@@ -782,161 +609,33 @@ class TestRunLifecycle:
 class TestDiffOperations:
     """Test SDK diff-only operations (no evaluation)."""
 
-    def test_diff_run_by_run_id(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Diff run by runId should use stored before snapshot."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTestSuiteRequest,
-            TestItem,
-            StartRunRequest,
-            DiffRunRequest,
-        )
-
-        # Setup
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01DIFF1234",
-                ttlSeconds=600,
-            )
-        )
-        suite_req = CreateTestSuiteRequest(
-            name="Diff Run Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Diff Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = suite_detail.tests[0].id
+    @pytest.mark.parametrize("mode", ["by_run_id", "by_before_suffix"])
+    def test_diff_run(self, sdk_client, started_run_shared, mode):
+        """Diff run by runId, or by envId + beforeSuffix, should compute diff."""
+        env_resp, _, _, start_resp = started_run_shared
 
-        # Start run to get before snapshot
-        start_resp = sdk_client.start_run(
-            StartRunRequest(
-                envId=env_resp.environmentId, testId=test_id, testSuiteId=suite.id
+        if mode == "by_run_id":
+            diff_req = DiffRunRequest.model_construct(runId=start_resp.runId)
+        else:
+            diff_req = DiffRunRequest.model_construct(
+                envId=env_resp.environmentId, beforeSuffix=start_resp.beforeSnapshot
             )
-        )
-
-        # Compute diff by runId
-        diff_req = DiffRunRequest(runId=start_resp.runId)
         diff_resp = sdk_client.diff_run(diff_req)
 
         assert diff_resp.beforeSnapshot == start_resp.beforeSnapshot
         assert diff_resp.afterSnapshot is not None
         assert diff_resp.diff is not None
 
-    def test_diff_run_by_before_suffix(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Diff run by envId + beforeSuffix should compute diff."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTestSuiteRequest,
-            TestItem,
-            StartRunRequest,
-            DiffRunRequest,
-        )
-
-        # Setup
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01DIFF5678",
-                ttlSeconds=600,
-            )
-        )
-        suite_req = CreateTestSuiteRequest(
-            name="Diff Before Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Diff Before Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        test_id = suite_detail.tests[0].id
-
-        # Start run to capture before
-        start_resp = sdk_client.start_run(
-            StartRunRequest(
-                envId=env_resp.environmentId, testId=test_id, testSuiteId=suite.id
-            )
-        )
-        before_suffix = start_resp.beforeSnapshot
-
-        # Compute diff using explicit before
-        diff_req = DiffRunRequest(
-            envId=env_resp.environmentId, beforeSuffix=before_suffix
-        )
-        diff_resp = sdk_client.diff_run(diff_req)
-
-        assert diff_resp.beforeSnapshot == before_suffix
-        assert diff_resp.afterSnapshot is not None
-        assert diff_resp.diff is not None
-
 
 class TestTemplateCreation:
     """Test SDK template creation from environments."""
 
     def test_create_template_from_environment_success(
-        self, sdk_client, session_manager, test_user_id, cleanup_test_environments
+        self, sdk_client, slack_env, meta_session, test_user_id
     ):
         """Create template from environment should register new template."""
-        from agent_diff.models import (
-            InitEnvRequestBody,
-            CreateTemplateFromEnvRequest,
-        )
-
-        # Create environment
-        env_resp = sdk_client.init_env(
-            InitEnvRequestBody(
-                templateService="slack",
-                templateName="slack_default",
-                impersonateUserId="U01TMPL1234",
-                ttlSeconds=600,
-            )
-        )
-
-        # Create template from environment
         tmpl_req = CreateTemplateFromEnvRequest(
-            environmentId=env_resp.environmentId,
+            environmentId=slack_env.environmentId,
             service="slack",
             name="my_custom_template",
             description="Custom template from test",
@@ -950,127 +649,55 @@ class TestTemplateCreation:
         assert tmpl_resp.service == "slack"
 
         # Verify in DB
-        with session_manager.with_meta_session() as s:
-            tmpl = (
-                s.query(TemplateEnvironment)
-                .filter(TemplateEnvironment.id == tmpl_resp.templateId)
-                .one()
-            )
-            assert tmpl.name == "my_custom_template"
-            assert tmpl.service == "slack"
-            assert tmpl.visibility == "private"
-            assert tmpl.owner_id == test_user_id
-            assert tmpl.description == "Custom template from test"
-            assert tmpl.kind == "schema"
-            assert tmpl.location is not None
+        tmpl = meta_session.get(TemplateEnvironment, UUID(tmpl_resp.templateId))
+        assert tmpl.name == "my_custom_template"
+        assert tmpl.service == "slack"
+        assert tmpl.visibility == "private"
+        assert tmpl.owner_id == test_user_id
+        assert tmpl.description == "Custom template from test"
+        assert tmpl.kind == "schema"
+        assert tmpl.location is not None
 
 
 class TestNameResolution:
     """Test resolution of resources by name (not just UUID)."""
 
     def test_init_env_by_service_name_resolves_correctly(
-        self, sdk_client, session_manager, cleanup_test_environments
+        self, meta_session, test_user_id, slack_template_id
     ):
         """Init environment by service:name should resolve to correct template."""
-        from agent_diff.models import InitEnvRequestBody
-
-        req = InitEnvRequestBody(
-            templateService="slack",
-            templateName="slack_default",
-            impersonateUserId="U01NAME1234",
-            ttlSeconds=600,
+        # Resolution only reads the meta DB, so exercise it in-process; the
+        # initEnv HTTP contract is covered by TestEnvironmentOperations.
+        body = APIInitEnvRequestBody(
+            templateService="slack", templateName="slack_default"
+        )
+        schema, service = TemplateManager().resolve_init_template(
+            meta_session, test_user_id, body
         )
-        resp = sdk_client.init_env(req)
 
-        assert resp.service == "slack"
-        assert "slack" in resp.templateSchema.lower()
-
-        # Verify correct template was used
-        with session_manager.with_meta_session() as s:
-            env = (
-                s.query(RunTimeEnvironment)
-                .filter(RunTimeEnvironment.id == resp.environmentId)
-                .one()
-            )
-            # Schema should be derived from slack_default template
-            assert env.schema.startswith("state_")
+        assert service == "slack"
+        tmpl = meta_session.get(TemplateEnvironment, slack_template_id)
+        assert schema == tmpl.location
 
-    def test_create_test_with_template_by_name(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
+    def test_create_test_with_template_by_name(self, shared_suite, meta_session):
         """Create test using template name (service:name) should resolve."""
-        from agent_diff.models import CreateTestSuiteRequest, TestItem
-
-        suite_req = CreateTestSuiteRequest(
-            name="Name Resolution Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Name Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    environmentTemplate="slack:slack_default",  # Using service:name
-                )
-            ],
-        )
-        suite = sdk_client.create_test_suite(suite_req)
+        suite = shared_suite
 
         # Verify test was created with resolved template
-        suite_detail = sdk_client.get_test_suite(suite.id, expand=True)
-        assert len(suite_detail.tests) == 1
-
-        with session_manager.with_meta_session() as s:
-            test = s.query(DBTest).filter(DBTest.id == suite_detail.tests[0].id).one()
-            # template_schema should be the resolved location
-            assert test.template_schema is not None
-            assert "slack" in test.template_schema.lower()
-
-    def test_create_test_with_template_ambiguous_name_fails(
-        self, sdk_client, session_manager, cleanup_test_environments
-    ):
-        """Create test with ambiguous template name should fail."""
-        from agent_diff.models import CreateTestSuiteRequest, TestItem
-        import requests
-
-        # Create suite with test using only name (if multiple exist)
-        suite_req = CreateTestSuiteRequest(
-            name="Ambiguous Suite",
-            description="Test",
-            visibility="private",
-            tests=[
-                TestItem(
-                    name="Ambiguous Test",
-                    prompt="Prompt",
-                    type="actionEval",
-                    expected_output={
-                        "assertions": [
-                            {
-                                "diff_type": "added",
-                                "entity": "messages",
-                                "where": {"channel_id": {"eq": "nonexistent"}},
-                                "expected_count": 0,
-                            }
-                        ],
-                    },
-                    # Using just name without service prefix - will fail if multiple templates share name
-                    environmentTemplate="nonexistent_template",
-                )
-            ],
-        )
-
-        with pytest.raises(requests.HTTPError) as exc_info:
-            sdk_client.create_test_suite(suite_req)
-
-        # Should be 400 (template not found)
-        assert exc_info.value.response.status_code == 400
+        assert len(suite.tests) == 1
+        test, tmpl = _load_test_with_template(meta_session, suite.tests[0].id)
+        # template_schema should be the resolved template's location
+        assert test.template_schema is not None
+        assert "slack" in test.template_schema.lower()
+        assert tmpl is not None
+        assert tmpl.service == "slack"
+        assert tmpl.name == "slack_default"
+
+    def test_resolve_template_unknown_name_fails(self, meta_session, test_user_id):
+        """Resolving a template name that matches nothing should fail."""
+        # createTestSuite turns this ValueError into a 400; exercise the
+        # resolver directly instead of round-tripping a rejected request.
+        with pytest.raises(ValueError, match="template not found"):
+            TemplateManager().resolve_template_schema(
+                meta_session, test_user_id, "nonexistent_template"
+            )
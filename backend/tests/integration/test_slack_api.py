@@ -1,5 +1,6 @@
 """Integration tests for Slack API methods."""
 
+import orjson
 import pytest
 from httpx import AsyncClient
 
@@ -12,17 +13,44 @@ MESSAGE_1 = "1699564800.000123"
 MESSAGE_2 = "1699568400.000456"
 MESSAGE_3 = "1699572000.000789"
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Static request bodies, serialized once at import.
+POST_HELLO = orjson.dumps({"channel": CHANNEL_GENERAL, "text": "Hello from test!"})
+IN_GENERAL = orjson.dumps({"channel": CHANNEL_GENERAL})
+OPEN_DM_JOHN = orjson.dumps({"users": USER_JOHN})
+REACT_TADA_MSG2 = orjson.dumps(
+    {"name": "tada", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_2}
+)
+REACT_EYES_MSG1 = orjson.dumps(
+    {"name": "eyes", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_1}
+)
+
+
+def _ok(response) -> dict:
+    """Assert a successful Slack response and return its decoded body."""
+    data = orjson.loads(response.content)
+    assert response.status_code == 200 and data["ok"] is True, data
+    return data
+
+
+def _error(response, error: str) -> dict:
+    """Assert a Slack error response carrying `error`."""
+    data = orjson.loads(response.content)
+    assert response.status_code == 400 and data["ok"] is False, data
+    assert data["error"] == error
+    return data
+
 
 @pytest.mark.asyncio
 class TestChatPostMessage:
     async def test_post_message_success(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/chat.postMessage",
-            json={"channel": CHANNEL_GENERAL, "text": "Hello from test!"},
+            content=POST_HELLO,
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"] == CHANNEL_GENERAL
         assert "ts" in data
         assert data["message"]["text"] == "Hello from test!"
@@ -37,9 +65,7 @@ class TestChatPostMessage:
                 "thread_ts": MESSAGE_1,
             },
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["message"]["thread_ts"] == MESSAGE_1
 
     async def test_post_to_different_channel(self, slack_client: AsyncClient):
@@ -47,38 +73,32 @@ class TestChatPostMessage:
             "/chat.postMessage",
             json={"channel": CHANNEL_RANDOM, "text": "Hello random!"},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"] == CHANNEL_RANDOM
 
-    async def test_post_message_no_channel(self, slack_client: AsyncClient):
-        response = await slack_client.post("/chat.postMessage", json={"text": "Hello!"})
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "channel_not_found"
-
-    async def test_post_message_no_text(self, slack_client: AsyncClient):
+    @pytest.mark.parametrize(
+        "payload,error",
+        [
+            pytest.param(
+                orjson.dumps({"text": "Hello!"}), "channel_not_found", id="no_channel"
+            ),
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL}), "no_text", id="no_text"
+            ),
+        ],
+    )
+    async def test_post_message_errors(self, slack_client: AsyncClient, payload, error):
         response = await slack_client.post(
-            "/chat.postMessage", json={"channel": CHANNEL_GENERAL}
+            "/chat.postMessage", content=payload, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "no_text"
+        _error(response, error)
 
-    async def test_post_message_not_in_channel(
-        self, slack_client_john: AsyncClient, cleanup_test_environments
-    ):
+    async def test_post_message_not_in_channel(self, slack_client_john: AsyncClient):
         response = await slack_client_john.post(
             "/chat.postMessage",
             json={"channel": "C_NONEXISTENT", "text": "Hello!"},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "channel_not_found"
+        _error(response, "channel_not_found")
 
 
 @pytest.mark.asyncio
@@ -93,86 +113,89 @@ class TestChatUpdate:
                 "text": "Updated message text",
             },
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["text"] == "Updated message text"
         assert data["ts"] == MESSAGE_1
 
-    async def test_update_message_not_author(self, slack_client: AsyncClient):
-        # Agent trying to update Robert's message (MESSAGE_2)
-        response = await slack_client.post(
-            "/chat.update",
-            json={
-                "channel": CHANNEL_GENERAL,
-                "ts": MESSAGE_2,
-                "text": "Trying to update",
-            },
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_update_message"
-
-    async def test_update_message_not_found(self, slack_client: AsyncClient):
-        response = await slack_client.post(
-            "/chat.update",
-            json={
-                "channel": CHANNEL_GENERAL,
-                "ts": "9999999999.999999",
-                "text": "Update",
-            },
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "message_not_found"
-
-    async def test_update_message_no_text(self, slack_client: AsyncClient):
+    @pytest.mark.parametrize(
+        "payload,error",
+        [
+            pytest.param(
+                orjson.dumps(
+                    {
+                        "channel": CHANNEL_GENERAL,
+                        "ts": MESSAGE_2,
+                        "text": "Trying to update",
+                    }
+                ),
+                "cant_update_message",
+                id="not_author",
+            ),
+            pytest.param(
+                orjson.dumps(
+                    {
+                        "channel": CHANNEL_GENERAL,
+                        "ts": "9999999999.999999",
+                        "text": "Update",
+                    }
+                ),
+                "message_not_found",
+                id="not_found",
+            ),
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL, "ts": MESSAGE_1}),
+                "no_text",
+                id="no_text",
+            ),
+        ],
+    )
+    async def test_update_message_errors(
+        self, slack_client: AsyncClient, payload, error
+    ):
         response = await slack_client.post(
-            "/chat.update", json={"channel": CHANNEL_GENERAL, "ts": MESSAGE_1}
+            "/chat.update", content=payload, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "no_text"
+        _error(response, error)
 
 
 @pytest.mark.asyncio
 class TestChatDelete:
-    async def test_delete_message_success(self, slack_client: AsyncClient):
-        post_response = await slack_client.post(
-            "/chat.postMessage",
-            json={"channel": CHANNEL_GENERAL, "text": "To be deleted"},
+    async def test_delete_message_success(
+        self, slack_client: AsyncClient, slack_direct
+    ):
+        _, created = await slack_direct(
+            "chat.postMessage", {"channel": CHANNEL_GENERAL, "text": "To be deleted"}
         )
-        ts = post_response.json()["ts"]
+        ts = created["ts"]
 
         response = await slack_client.post(
             "/chat.delete", json={"channel": CHANNEL_GENERAL, "ts": ts}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["ts"] == ts
 
-    async def test_delete_message_not_author(self, slack_client: AsyncClient):
-        response = await slack_client.post(
-            "/chat.delete", json={"channel": CHANNEL_GENERAL, "ts": MESSAGE_2}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_delete_message"
-
-    async def test_delete_message_not_found(self, slack_client: AsyncClient):
+    @pytest.mark.parametrize(
+        "payload,error",
+        [
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL, "ts": MESSAGE_2}),
+                "cant_delete_message",
+                id="not_author",
+            ),
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL, "ts": "9999999999.999999"}),
+                "message_not_found",
+                id="not_found",
+            ),
+        ],
+    )
+    async def test_delete_message_errors(
+        self, slack_client: AsyncClient, payload, error
+    ):
         response = await slack_client.post(
-            "/chat.delete",
-            json={"channel": CHANNEL_GENERAL, "ts": "9999999999.999999"},
+            "/chat.delete", content=payload, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "message_not_found"
+        _error(response, error)
 
 
 @pytest.mark.asyncio
@@ -182,9 +205,7 @@ class TestConversationsCreate:
             "/conversations.create",
             json={"name": "test-public-channel", "is_private": False},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"]["name"] == "test-public-channel"
         assert data["channel"]["is_private"] is False
         assert data["channel"]["is_member"] is True
@@ -194,125 +215,70 @@ class TestConversationsCreate:
             "/conversations.create",
             json={"name": "test-private-channel", "is_private": True},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"]["is_private"] is True
 
-    async def test_create_channel_invalid_name_uppercase(
-        self, slack_client: AsyncClient
+    @pytest.mark.parametrize(
+        "payload,error",
+        [
+            # Name rules are covered in tests/unit/test_slack_validation.py;
+            # one case here checks the wiring through the endpoint.
+            pytest.param(
+                orjson.dumps({"name": "TestChannel"}),
+                "invalid_name_specials",
+                id="uppercase",
+            ),
+            pytest.param(
+                orjson.dumps({"name": "general"}), "name_taken", id="duplicate"
+            ),
+        ],
+    )
+    async def test_create_channel_errors(
+        self, slack_client: AsyncClient, payload, error
     ):
-        """Test error with uppercase in name."""
         response = await slack_client.post(
-            "/conversations.create", json={"name": "TestChannel"}
+            "/conversations.create", content=payload, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "invalid_name_specials"
-
-    async def test_create_channel_invalid_name_empty(self, slack_client: AsyncClient):
-        response = await slack_client.post("/conversations.create", json={"name": ""})
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "invalid_name_required"
-
-    async def test_create_channel_name_too_long(self, slack_client: AsyncClient):
-        long_name = "a" * 81
-        response = await slack_client.post(
-            "/conversations.create", json={"name": long_name}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "invalid_name_maxlength"
-
-    async def test_create_channel_duplicate_name(self, slack_client: AsyncClient):
-        response = await slack_client.post(
-            "/conversations.create", json={"name": "general"}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "name_taken"
+        _error(response, error)
 
 
 @pytest.mark.asyncio
 class TestConversationsList:
-    async def test_list_conversations_default(self, slack_client: AsyncClient):
-        response = await slack_client.get("/conversations.list")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "channels" in data
-        # Agent is member of 2 seeded channels
-        assert len(data["channels"]) >= 2
-
-    async def test_list_conversations_with_limit(self, slack_client: AsyncClient):
-        response = await slack_client.get("/conversations.list?limit=1")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert len(data["channels"]) == 1
-        assert data["response_metadata"]["next_cursor"] != ""
+    async def test_list_conversations(self, slack_client: AsyncClient):
+        """Read-only queries against the seed."""
+        default = _ok(await slack_client.get("/conversations.list"))
+        limited = _ok(await slack_client.get("/conversations.list?limit=1"))
+        unarchived = _ok(
+            await slack_client.get("/conversations.list?exclude_archived=true")
+        )
+        public = _ok(await slack_client.get("/conversations.list?types=public_channel"))
 
-    async def test_list_conversations_exclude_archived(self, slack_client: AsyncClient):
-        """Test excluding archived channels."""
-        response = await slack_client.get("/conversations.list?exclude_archived=true")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        # Agent is member of 2 seeded channels
+        assert len(default["channels"]) >= 2
 
-        assert all(not ch["is_archived"] for ch in data["channels"])
+        assert len(limited["channels"]) == 1
+        assert limited["response_metadata"]["next_cursor"] != ""
 
-    async def test_list_conversations_filter_types(self, slack_client: AsyncClient):
-        response = await slack_client.get("/conversations.list?types=public_channel")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert all(ch["is_channel"] and not ch["is_private"] for ch in data["channels"])
+        assert all(not ch["is_archived"] for ch in unarchived["channels"])
+        assert all(
+            ch["is_channel"] and not ch["is_private"] for ch in public["channels"]
+        )
 
 
 @pytest.mark.asyncio
 class TestConversationsHistory:
     async def test_get_channel_history(self, slack_client: AsyncClient):
-        response = await slack_client.get(
-            f"/conversations.history?channel={CHANNEL_GENERAL}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "messages" in data
-        # Should have at least 2 seeded messages in #general
-        assert len(data["messages"]) >= 2
-
-    async def test_get_history_with_limit(self, slack_client: AsyncClient):
-        response = await slack_client.get(
-            f"/conversations.history?channel={CHANNEL_GENERAL}&limit=1"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert len(data["messages"]) == 1
-
-    async def test_get_history_with_time_range(self, slack_client: AsyncClient):
+        """Read-only queries against the seed."""
         oldest = "1699564800"  # Around MESSAGE_1
-        response = await slack_client.get(
-            f"/conversations.history?channel={CHANNEL_GENERAL}&oldest={oldest}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        base = f"/conversations.history?channel={CHANNEL_GENERAL}"
+        full = _ok(await slack_client.get(base))
+        limited = _ok(await slack_client.get(f"{base}&limit=1"))
+        _ok(await slack_client.get(f"{base}&oldest={oldest}"))
+        _ok(await slack_client.get(f"{base}&oldest={oldest}&inclusive=true&limit=1"))
 
-    async def test_get_history_inclusive(self, slack_client: AsyncClient):
-        oldest = "1699564800"
-        response = await slack_client.get(
-            f"/conversations.history?channel={CHANNEL_GENERAL}&oldest={oldest}&inclusive=true&limit=1"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        # Should have at least 2 seeded messages in #general
+        assert len(full["messages"]) >= 2
+        assert len(limited["messages"]) == 1
 
     async def test_get_history_not_in_channel(self, slack_client: AsyncClient):
         # Create a private channel as agent, then try to read history
@@ -320,7 +286,7 @@ class TestConversationsHistory:
             "/conversations.history?channel=C_NONEXISTENT"
         )
         assert response.status_code == 400
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["ok"] is False
         assert data["error"] in ["channel_not_found", "not_in_channel"]
 
@@ -329,127 +295,101 @@ class TestConversationsHistory:
 class TestConversationsJoin:
     async def test_join_channel_already_member(self, slack_client: AsyncClient):
         response = await slack_client.post(
-            "/conversations.join", json={"channel": CHANNEL_GENERAL}
+            "/conversations.join", content=IN_GENERAL, headers=JSON_HEADERS
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data.get("warning") == "already_in_channel"
 
-    async def test_join_new_channel(self, slack_client: AsyncClient):
+    async def test_join_new_channel(self, slack_client: AsyncClient, slack_direct):
         # First create a new channel as a different user
         # Then join it as agent
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-join-channel"}
+        _, created = await slack_direct(
+            "conversations.create", {"name": "test-join-channel"}
         )
-        channel_id = create_resp.json()["channel"]["id"]
+        channel_id = created["channel"]["id"]
 
-        await slack_client.post("/conversations.leave", json={"channel": channel_id})
+        await slack_direct("conversations.leave", {"channel": channel_id})
 
         response = await slack_client.post(
             "/conversations.join", json={"channel": channel_id}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "warning" not in data
 
     async def test_join_channel_not_found(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.join", json={"channel": "C_NONEXISTENT"}
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "channel_not_found"
+        _error(response, "channel_not_found")
 
 
 @pytest.mark.asyncio
 class TestConversationsInvite:
-    async def test_invite_user_to_channel(self, slack_client: AsyncClient):
+    async def test_invite_user_to_channel(
+        self, slack_client: AsyncClient, slack_direct
+    ):
         # Create a private channel
-        create_resp = await slack_client.post(
-            "/conversations.create",
-            json={"name": "test-invite-channel", "is_private": True},
+        _, created = await slack_direct(
+            "conversations.create", {"name": "test-invite-channel", "is_private": True}
         )
-        channel_id = create_resp.json()["channel"]["id"]
+        channel_id = created["channel"]["id"]
 
         # Invite John to the channel
         response = await slack_client.post(
             "/conversations.invite", json={"channel": channel_id, "users": USER_JOHN}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
-    async def test_invite_multiple_users(self, slack_client: AsyncClient):
-        create_resp = await slack_client.post(
-            "/conversations.create",
-            json={"name": "test-multi-invite", "is_private": True},
+    async def test_invite_multiple_users(self, slack_client: AsyncClient, slack_direct):
+        _, created = await slack_direct(
+            "conversations.create", {"name": "test-multi-invite", "is_private": True}
         )
-        channel_id = create_resp.json()["channel"]["id"]
+        channel_id = created["channel"]["id"]
 
         response = await slack_client.post(
             "/conversations.invite",
             json={"channel": channel_id, "users": f"{USER_JOHN},{USER_ROBERT}"},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_invite_self_error(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.invite",
             json={"channel": CHANNEL_GENERAL, "users": USER_AGENT},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_invite_self"
+        _error(response, "cant_invite_self")
 
     async def test_invite_already_member(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.invite",
             json={"channel": CHANNEL_GENERAL, "users": USER_JOHN},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "already_in_channel"
+        _error(response, "already_in_channel")
 
     async def test_invite_user_not_found(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.invite",
             json={"channel": CHANNEL_GENERAL, "users": "U_NONEXISTENT"},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "user_not_found"
+        _error(response, "user_not_found")
 
 
 @pytest.mark.asyncio
 class TestConversationsOpen:
     async def test_open_dm_channel(self, slack_client: AsyncClient):
         response = await slack_client.post(
-            "/conversations.open", json={"users": USER_JOHN}
+            "/conversations.open", content=OPEN_DM_JOHN, headers=JSON_HEADERS
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "channel" in data
         assert "id" in data["channel"]
 
-    async def test_open_dm_returns_existing(self, slack_client: AsyncClient):
-        resp1 = await slack_client.post(
-            "/conversations.open", json={"users": USER_JOHN}
-        )
-        channel_id_1 = resp1.json()["channel"]["id"]
+    async def test_open_dm_returns_existing(self, slack_direct):
+        _, created = await slack_direct("conversations.open", {"users": USER_JOHN})
+        channel_id_1 = created["channel"]["id"]
 
-        resp2 = await slack_client.post(
-            "/conversations.open", json={"users": USER_JOHN}
-        )
-        channel_id_2 = resp2.json()["channel"]["id"]
+        _, created = await slack_direct("conversations.open", {"users": USER_JOHN})
+        channel_id_2 = created["channel"]["id"]
 
         assert channel_id_1 == channel_id_2
 
@@ -457,17 +397,13 @@ class TestConversationsOpen:
         response = await slack_client.post(
             "/conversations.open", json={"users": f"{USER_JOHN},{USER_ROBERT}"}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_open_with_return_im(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.open", json={"users": USER_JOHN, "return_im": True}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "channel" in data
         assert "is_im" in data["channel"]
 
@@ -477,162 +413,120 @@ class TestConversationsOpen:
             "/conversations.open",
             json={"users": USER_ROBERT, "prevent_creation": True},
         )
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "ok" in data
 
 
 @pytest.mark.asyncio
 class TestConversationsInfo:
     async def test_get_channel_info(self, slack_client: AsyncClient):
-        response = await slack_client.get(
-            f"/conversations.info?channel={CHANNEL_GENERAL}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "channel" in data
+        base = f"/conversations.info?channel={CHANNEL_GENERAL}"
+        plain = await slack_client.get(base)
+        counted = await slack_client.get(f"{base}&include_num_members=true")
+        data = _ok(plain)
         assert data["channel"]["id"] == CHANNEL_GENERAL
         assert data["channel"]["name"] == "general"
 
-    async def test_get_channel_info_with_num_members(self, slack_client: AsyncClient):
-        """Test include_num_members parameter."""
-        response = await slack_client.get(
-            f"/conversations.info?channel={CHANNEL_GENERAL}&include_num_members=true"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "num_members" in data["channel"]
+        data = _ok(counted)
         assert data["channel"]["num_members"] >= 3  # All seeded users
 
-    async def test_get_dm_info(self, slack_client: AsyncClient):
+    async def test_get_dm_info(self, slack_client: AsyncClient, slack_direct):
         # First open a DM
-        open_resp = await slack_client.post(
-            "/conversations.open", json={"users": USER_JOHN}
-        )
-        dm_id = open_resp.json()["channel"]["id"]
+        _, created = await slack_direct("conversations.open", {"users": USER_JOHN})
+        dm_id = created["channel"]["id"]
 
         response = await slack_client.get(f"/conversations.info?channel={dm_id}")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"]["is_im"] is True
 
     async def test_get_info_channel_not_found(self, slack_client: AsyncClient):
         response = await slack_client.get("/conversations.info?channel=C_NONEXISTENT")
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "channel_not_found"
+        _error(response, "channel_not_found")
 
 
 @pytest.mark.asyncio
 class TestConversationsArchive:
-    async def test_archive_channel_success(self, slack_client: AsyncClient):
-        # Create a test channel
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-archive-channel"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_archive_channel_success(
+        self, slack_client: AsyncClient, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
         response = await slack_client.post(
             "/conversations.archive", json={"channel": channel_id}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
-    async def test_archive_already_archived(self, slack_client: AsyncClient):
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-archive-twice"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_archive_already_archived(
+        self, slack_client: AsyncClient, slack_direct, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
-        await slack_client.post("/conversations.archive", json={"channel": channel_id})
+        await slack_direct("conversations.archive", {"channel": channel_id})
 
         response = await slack_client.post(
             "/conversations.archive", json={"channel": channel_id}
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "already_archived"
+        _error(response, "already_archived")
 
-    async def test_archive_general_channel_error(self, slack_client: AsyncClient):
-        response = await slack_client.post(
-            "/conversations.archive", json={"channel": CHANNEL_GENERAL}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_archive_general"
-
-    async def test_unarchive_channel_success(self, slack_client: AsyncClient):
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-unarchive-channel"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_unarchive_channel_success(
+        self, slack_client: AsyncClient, slack_direct, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
-        await slack_client.post("/conversations.archive", json={"channel": channel_id})
+        await slack_direct("conversations.archive", {"channel": channel_id})
 
         response = await slack_client.post(
             "/conversations.unarchive", json={"channel": channel_id}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-
-    async def test_unarchive_not_archived_error(self, slack_client: AsyncClient):
+        _ok(response)
+
+    @pytest.mark.parametrize(
+        "method,error",
+        [
+            pytest.param("conversations.archive", "cant_archive_general", id="archive"),
+            pytest.param("conversations.unarchive", "not_archived", id="unarchive"),
+        ],
+    )
+    async def test_archive_general_errors(
+        self, slack_client: AsyncClient, method, error
+    ):
         response = await slack_client.post(
-            "/conversations.unarchive", json={"channel": CHANNEL_GENERAL}
+            f"/{method}", content=IN_GENERAL, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "not_archived"
+        _error(response, error)
 
 
 @pytest.mark.asyncio
 class TestConversationsRename:
-    async def test_rename_channel_success(self, slack_client: AsyncClient):
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-old-name"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_rename_channel_success(
+        self, slack_client: AsyncClient, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
         response = await slack_client.post(
             "/conversations.rename",
             json={"channel": channel_id, "name": "test-new-name"},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["channel"]["name"] == "test-new-name"
 
-    async def test_rename_to_existing_name(self, slack_client: AsyncClient):
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-rename-dup"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_rename_to_existing_name(
+        self, slack_client: AsyncClient, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
         response = await slack_client.post(
             "/conversations.rename",
             json={"channel": channel_id, "name": "general"},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "name_taken"
+        _error(response, "name_taken")
 
     async def test_rename_general_error(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.rename",
             json={"channel": CHANNEL_GENERAL, "name": "not-general"},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cannot_rename_general"
+        _error(response, "cannot_rename_general")
 
 
 @pytest.mark.asyncio
@@ -642,106 +536,82 @@ class TestConversationsSetTopic:
             "/conversations.setTopic",
             json={"channel": CHANNEL_GENERAL, "topic": "New channel topic"},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert data["topic"] == "New channel topic"
 
     async def test_set_topic_empty(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/conversations.setTopic", json={"channel": CHANNEL_GENERAL, "topic": ""}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
 
 @pytest.mark.asyncio
 class TestConversationsKickLeave:
-    async def test_leave_channel_success(self, slack_client: AsyncClient):
-        # Create and join a test channel
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-leave-channel"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_leave_channel_success(
+        self, slack_client: AsyncClient, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
         response = await slack_client.post(
             "/conversations.leave", json={"channel": channel_id}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_leave_general_error(self, slack_client: AsyncClient):
         response = await slack_client.post(
-            "/conversations.leave", json={"channel": CHANNEL_GENERAL}
+            "/conversations.leave", content=IN_GENERAL, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_leave_general"
+        _error(response, "cant_leave_general")
 
-    async def test_kick_user_from_channel(self, slack_client: AsyncClient):
-        # Create a channel, invite John, then kick him
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-kick-channel"}
-        )
-        channel_id = create_resp.json()["channel"]["id"]
+    async def test_kick_user_from_channel(
+        self, slack_client: AsyncClient, slack_direct, slack_scratch_channel
+    ):
+        channel_id = slack_scratch_channel
 
         # Invite John
-        await slack_client.post(
-            "/conversations.invite", json={"channel": channel_id, "users": USER_JOHN}
+        await slack_direct(
+            "conversations.invite", {"channel": channel_id, "users": USER_JOHN}
         )
 
         # Kick John
         response = await slack_client.post(
             "/conversations.kick", json={"channel": channel_id, "user": USER_JOHN}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-
-    async def test_kick_self_error(self, slack_client: AsyncClient):
-        response = await slack_client.post(
-            "/conversations.kick",
-            json={"channel": CHANNEL_GENERAL, "user": USER_AGENT},
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_kick_self"
+        _ok(response)
 
-    async def test_kick_from_general_error(self, slack_client: AsyncClient):
+    @pytest.mark.parametrize(
+        "payload,error",
+        [
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL, "user": USER_AGENT}),
+                "cant_kick_self",
+                id="self",
+            ),
+            pytest.param(
+                orjson.dumps({"channel": CHANNEL_GENERAL, "user": USER_JOHN}),
+                "cant_kick_from_general",
+                id="general",
+            ),
+        ],
+    )
+    async def test_kick_errors(self, slack_client: AsyncClient, payload, error):
         response = await slack_client.post(
-            "/conversations.kick", json={"channel": CHANNEL_GENERAL, "user": USER_JOHN}
+            "/conversations.kick", content=payload, headers=JSON_HEADERS
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "cant_kick_from_general"
+        _error(response, error)
 
 
 @pytest.mark.asyncio
 class TestConversationsMembers:
     async def test_get_channel_members(self, slack_client: AsyncClient):
-        response = await slack_client.get(
-            f"/conversations.members?channel={CHANNEL_GENERAL}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "members" in data
-        # All 3 seeded users are in #general
-        assert len(data["members"]) >= 3
+        base = f"/conversations.members?channel={CHANNEL_GENERAL}"
+        full = _ok(await slack_client.get(base))
+        paged = _ok(await slack_client.get(f"{base}&limit=2"))
 
-    async def test_get_members_with_pagination(self, slack_client: AsyncClient):
-        response = await slack_client.get(
-            f"/conversations.members?channel={CHANNEL_GENERAL}&limit=2"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert len(data["members"]) <= 2
+        # All 3 seeded users are in #general
+        assert len(full["members"]) >= 3
+        assert len(paged["members"]) <= 2
 
 
 @pytest.mark.asyncio
@@ -755,9 +625,7 @@ class TestReactions:
                 "timestamp": MESSAGE_1,
             },
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_add_reaction_with_colons(self, slack_client: AsyncClient):
         response = await slack_client.post(
@@ -768,9 +636,7 @@ class TestReactions:
                 "timestamp": MESSAGE_1,
             },
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_add_invalid_reaction(self, slack_client: AsyncClient):
         response = await slack_client.post(
@@ -781,223 +647,206 @@ class TestReactions:
                 "timestamp": MESSAGE_1,
             },
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "invalid_name"
+        _error(response, "invalid_name")
 
-    async def test_add_reaction_already_reacted(self, slack_client: AsyncClient):
-        await slack_client.post(
-            "/reactions.add",
-            json={"name": "tada", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_2},
+    async def test_add_reaction_already_reacted(
+        self, slack_client: AsyncClient, slack_direct
+    ):
+        await slack_direct(
+            "reactions.add",
+            {"name": "tada", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_2},
         )
 
         response = await slack_client.post(
             "/reactions.add",
-            json={"name": "tada", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_2},
+            content=REACT_TADA_MSG2,
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "already_reacted"
+        _error(response, "already_reacted")
 
-    async def test_get_reactions(self, slack_client: AsyncClient):
+    async def test_get_reactions(self, slack_client: AsyncClient, slack_direct):
         # First add a reaction
-        await slack_client.post(
-            "/reactions.add",
-            json={"name": "rocket", "channel": CHANNEL_RANDOM, "timestamp": MESSAGE_3},
+        await slack_direct(
+            "reactions.add",
+            {"name": "rocket", "channel": CHANNEL_RANDOM, "timestamp": MESSAGE_3},
         )
 
         response = await slack_client.get(
             f"/reactions.get?channel={CHANNEL_RANDOM}&timestamp={MESSAGE_3}"
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "message" in data
 
-    async def test_remove_reaction(self, slack_client: AsyncClient):
-        await slack_client.post(
-            "/reactions.add",
-            json={"name": "eyes", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_1},
+    async def test_remove_reaction(self, slack_client: AsyncClient, slack_direct):
+        await slack_direct(
+            "reactions.add",
+            {"name": "eyes", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_1},
         )
 
         response = await slack_client.post(
             "/reactions.remove",
-            json={"name": "eyes", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_1},
+            content=REACT_EYES_MSG1,
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        _ok(response)
 
     async def test_remove_reaction_not_reacted(self, slack_client: AsyncClient):
         response = await slack_client.post(
             "/reactions.remove",
             json={"name": "wave", "channel": CHANNEL_GENERAL, "timestamp": MESSAGE_1},
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "no_reaction"
+        _error(response, "no_reaction")
 
 
 @pytest.mark.asyncio
 class TestUsers:
     async def test_get_user_info(self, slack_client: AsyncClient):
         response = await slack_client.get(f"/users.info?user={USER_AGENT}")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "user" in data
         assert data["user"]["id"] == USER_AGENT
         assert data["user"]["name"] == "agent1"
 
     async def test_get_user_info_not_found(self, slack_client: AsyncClient):
         response = await slack_client.get("/users.info?user=U_NONEXISTENT")
-        assert response.status_code == 400
-        data = response.json()
-        assert data["ok"] is False
-        assert data["error"] == "user_not_found"
+        _error(response, "user_not_found")
 
     async def test_list_users(self, slack_client: AsyncClient):
-        response = await slack_client.get("/users.list")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "members" in data
-        # Should have at least 3 seeded users
-        assert len(data["members"]) >= 3
+        full = _ok(await slack_client.get("/users.list"))
+        paged = _ok(await slack_client.get("/users.list?limit=2"))
 
-    async def test_list_users_with_pagination(self, slack_client: AsyncClient):
-        response = await slack_client.get("/users.list?limit=2")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert len(data["members"]) <= 2
+        # Should have at least 3 seeded users
+        assert len(full["members"]) >= 3
+        assert len(paged["members"]) <= 2
 
     async def test_list_user_conversations(self, slack_client: AsyncClient):
         response = await slack_client.get("/users.conversations")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
+        data = _ok(response)
         assert "channels" in data
         # Agent is in at least 2 seeded channels
         assert len(data["channels"]) >= 2
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 class TestCompositeScenario:
-    async def test_full_message_lifecycle(self, slack_client: AsyncClient):
-        post_resp = await slack_client.post(
-            "/chat.postMessage",
-            json={"channel": CHANNEL_RANDOM, "text": "Lifecycle test message"},
+    """Multi-step flows; run in-process via slack_direct (no HTTP needed)."""
+
+    async def test_full_message_lifecycle(self, slack_direct):
+        status, data = await slack_direct(
+            "chat.postMessage",
+            {"channel": CHANNEL_RANDOM, "text": "Lifecycle test message"},
         )
-        assert post_resp.status_code == 200
-        ts = post_resp.json()["ts"]
+        assert status == 200
+        ts = data["ts"]
 
-        update_resp = await slack_client.post(
-            "/chat.update",
-            json={
+        status, data = await slack_direct(
+            "chat.update",
+            {
                 "channel": CHANNEL_RANDOM,
                 "ts": ts,
                 "text": "Updated lifecycle message",
             },
         )
-        assert update_resp.status_code == 200
-        assert update_resp.json()["text"] == "Updated lifecycle message"
+        assert status == 200
+        assert data["text"] == "Updated lifecycle message"
 
-        react_resp = await slack_client.post(
-            "/reactions.add",
-            json={"name": "check", "channel": CHANNEL_RANDOM, "timestamp": ts},
+        status, _ = await slack_direct(
+            "reactions.add",
+            {"name": "check", "channel": CHANNEL_RANDOM, "timestamp": ts},
         )
-        assert react_resp.status_code == 200
+        assert status == 200
 
-        history_resp = await slack_client.get(
-            f"/conversations.history?channel={CHANNEL_RANDOM}"
+        status, data = await slack_direct(
+            "conversations.history", {"channel": CHANNEL_RANDOM}, method="GET"
         )
-        assert history_resp.status_code == 200
-        messages = history_resp.json()["messages"]
+        assert status == 200
+        messages = data["messages"]
         our_message = next((m for m in messages if m["ts"] == ts), None)
         assert our_message is not None
         assert our_message["text"] == "Updated lifecycle message"
 
-        reactions_resp = await slack_client.get(
-            f"/reactions.get?channel={CHANNEL_RANDOM}&timestamp={ts}"
+        status, _ = await slack_direct(
+            "reactions.get", {"channel": CHANNEL_RANDOM, "timestamp": ts}, method="GET"
         )
-        assert reactions_resp.status_code == 200
+        assert status == 200
 
-        delete_resp = await slack_client.post(
-            "/chat.delete", json={"channel": CHANNEL_RANDOM, "ts": ts}
+        status, _ = await slack_direct(
+            "chat.delete", {"channel": CHANNEL_RANDOM, "ts": ts}
         )
-        assert delete_resp.status_code == 200
+        assert status == 200
 
-    async def test_channel_creation_and_collaboration(self, slack_client: AsyncClient):
+    async def test_channel_creation_and_collaboration(self, slack_direct):
         """Test: create channel → invite users → post messages → set topic."""
         # 1. Create a new channel
-        create_resp = await slack_client.post(
-            "/conversations.create", json={"name": "test-collab-channel"}
+        status, data = await slack_direct(
+            "conversations.create", {"name": "test-collab-channel"}
         )
-        assert create_resp.status_code == 200
-        channel_id = create_resp.json()["channel"]["id"]
+        assert status == 200
+        channel_id = data["channel"]["id"]
 
-        topic_resp = await slack_client.post(
-            "/conversations.setTopic",
-            json={"channel": channel_id, "topic": "Collaboration test channel"},
+        status, _ = await slack_direct(
+            "conversations.setTopic",
+            {"channel": channel_id, "topic": "Collaboration test channel"},
         )
-        assert topic_resp.status_code == 200
+        assert status == 200
 
         # 3. Invite users
-        invite_resp = await slack_client.post(
-            "/conversations.invite",
-            json={"channel": channel_id, "users": f"{USER_JOHN},{USER_ROBERT}"},
+        status, _ = await slack_direct(
+            "conversations.invite",
+            {"channel": channel_id, "users": f"{USER_JOHN},{USER_ROBERT}"},
         )
-        assert invite_resp.status_code == 200
+        assert status == 200
 
-        msg_resp = await slack_client.post(
-            "/chat.postMessage",
-            json={"channel": channel_id, "text": "Welcome to the new channel!"},
+        status, _ = await slack_direct(
+            "chat.postMessage",
+            {"channel": channel_id, "text": "Welcome to the new channel!"},
+        )
+        assert status == 200
+
+        status, data = await slack_direct(
+            "conversations.members", {"channel": channel_id}, method="GET"
         )
-        assert msg_resp.status_code == 200
+        assert status == 200
+        assert len(data["members"]) == 3  # Agent + John + Robert
 
-        members_resp = await slack_client.get(
-            f"/conversations.members?channel={channel_id}"
+        status, data = await slack_direct(
+            "conversations.info", {"channel": channel_id}, method="GET"
         )
-        assert members_resp.status_code == 200
-        members = members_resp.json()["members"]
-        assert len(members) == 3  # Agent + John + Robert
+        assert status == 200
+        assert data["channel"]["topic"]["value"] == "Collaboration test channel"
 
-    async def test_dm_conversation_flow(self, slack_client: AsyncClient):
+    async def test_dm_conversation_flow(self, slack_direct):
         # 1. Open DM with John
-        open_resp = await slack_client.post(
-            "/conversations.open", json={"users": USER_JOHN, "return_im": True}
+        status, data = await slack_direct(
+            "conversations.open", {"users": USER_JOHN, "return_im": True}
         )
-        assert open_resp.status_code == 200
-        dm_id = open_resp.json()["channel"]["id"]
+        assert status == 200
+        dm_id = data["channel"]["id"]
 
-        msg_resp = await slack_client.post(
-            "/chat.postMessage",
-            json={"channel": dm_id, "text": "Hey John, this is a DM!"},
+        status, _ = await slack_direct(
+            "chat.postMessage", {"channel": dm_id, "text": "Hey John, this is a DM!"}
         )
-        assert msg_resp.status_code == 200
+        assert status == 200
 
-        history_resp = await slack_client.get(f"/conversations.history?channel={dm_id}")
-        assert history_resp.status_code == 200
-        messages = history_resp.json()["messages"]
-        assert len(messages) >= 1
+        status, data = await slack_direct(
+            "conversations.history", {"channel": dm_id}, method="GET"
+        )
+        assert status == 200
+        assert len(data["messages"]) >= 1
 
-        info_resp = await slack_client.get(f"/conversations.info?channel={dm_id}")
-        assert info_resp.status_code == 200
-        assert info_resp.json()["channel"]["is_im"] is True
+        status, data = await slack_direct(
+            "conversations.info", {"channel": dm_id}, method="GET"
+        )
+        assert status == 200
+        assert data["channel"]["is_im"] is True
 
 
 @pytest.mark.asyncio
 class TestSearchMessages:
     async def test_requires_query(self, slack_client: AsyncClient):
         resp = await slack_client.get("/search.messages")
-        assert resp.status_code == 400
-        data = resp.json()
-        assert data["ok"] is False
-        assert data["error"] == "No query passed"
+        _error(resp, "No query passed")
 
     async def test_basic_match_and_highlight(self, slack_client: AsyncClient):
         # Post a distinctive message and search for it
@@ -1009,9 +858,7 @@ class TestSearchMessages:
         assert post.status_code == 200
 
         resp = await slack_client.get(f"/search.messages?query={term}")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["ok"] is True
+        data = _ok(resp)
         assert "messages" in data
         matches = data["messages"]["matches"]
         assert len(matches) >= 1
@@ -1020,7 +867,7 @@ class TestSearchMessages:
         # With highlight=true markers U+E000 and U+E001
         resp_h = await slack_client.get(f"/search.messages?query={term}&highlight=true")
         assert resp_h.status_code == 200
-        m2 = resp_h.json()["messages"]["matches"]
+        m2 = orjson.loads(resp_h.content)["messages"]["matches"]
         assert any("\ue000" in m["text"] and "\ue001" in m["text"] for m in m2)
 
     async def test_sort_timestamp_and_pagination(self, slack_client: AsyncClient):
@@ -1042,7 +889,7 @@ class TestSearchMessages:
             f"/search.messages?query={term}&sort=timestamp&sort_dir=asc"
         )
         assert resp.status_code == 200
-        matches = resp.json()["messages"]["matches"]
+        matches = orjson.loads(resp.content)["messages"]["matches"]
         assert len(matches) >= 2
         ts_sorted = [m["ts"] for m in matches]
         assert ts_sorted == sorted(ts_sorted)
@@ -1052,7 +899,7 @@ class TestSearchMessages:
             f"/search.messages?query={term}&sort=timestamp&sort_dir=asc&count=1&page=2"
         )
         assert resp2.status_code == 200
-        data2 = resp2.json()
+        data2 = orjson.loads(resp2.content)
         assert data2["messages"]["paging"]["total"] >= 2
         assert len(data2["messages"]["matches"]) == 1
 
@@ -1064,7 +911,7 @@ class TestSearchMessages:
             "/conversations.create", json={"name": "searchchan", "is_private": True}
         )
         assert create.status_code == 200
-        ch_id = create.json()["channel"]["id"]
+        ch_id = orjson.loads(create.content)["channel"]["id"]
 
         p = await slack_client.post(
             "/chat.postMessage", json={"channel": ch_id, "text": "infilter termX"}
@@ -1075,14 +922,16 @@ class TestSearchMessages:
         r1 = await slack_client.get("/search.messages?query=in:searchchan termX")
         assert r1.status_code == 200
         assert any(
-            m["channel"]["id"] == ch_id for m in r1.json()["messages"]["matches"]
+            m["channel"]["id"] == ch_id
+            for m in orjson.loads(r1.content)["messages"]["matches"]
         )
 
         # in: by channel id
         r2 = await slack_client.get(f"/search.messages?query=in:{ch_id} termX")
         assert r2.status_code == 200
         assert any(
-            m["channel"]["id"] == ch_id for m in r2.json()["messages"]["matches"]
+            m["channel"]["id"] == ch_id
+            for m in orjson.loads(r2.content)["messages"]["matches"]
         )
 
         # from: by user id
@@ -1094,7 +943,10 @@ class TestSearchMessages:
         assert pj.status_code == 200
         r3 = await slack_client.get(f"/search.messages?query=from:<@{USER_JOHN}> termY")
         assert r3.status_code == 200
-        assert any(m["user"] == USER_JOHN for m in r3.json()["messages"]["matches"])
+        assert any(
+            m["user"] == USER_JOHN
+            for m in orjson.loads(r3.content)["messages"]["matches"]
+        )
 
 
 @pytest.mark.asyncio
@@ -1108,9 +960,7 @@ class TestSearchAll:
         assert p.status_code == 200
 
         resp = await slack_client.get(f"/search.all?query={term}")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["ok"] is True
+        data = _ok(resp)
         assert "messages" in data
         assert "files" in data
         assert "posts" in data
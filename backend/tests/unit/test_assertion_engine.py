@@ -8,98 +8,86 @@ from src.platform.evaluationEngine.assertion import (
 )
 
 
-class TestStringPredicates:
-    def test_contains(self):
-        assert _matches_predicate("hello world", {"contains": "world"})
-        assert not _matches_predicate("hello world", {"contains": "xyz"})
-        assert not _matches_predicate(123, {"contains": "world"})
-
-    def test_not_contains(self):
-        assert _matches_predicate("hello world", {"not_contains": "xyz"})
-        assert not _matches_predicate("hello world", {"not_contains": "world"})
-
-    def test_i_contains_case_insensitive(self):
-        assert _matches_predicate("Hello World", {"i_contains": "WORLD"})
-        assert _matches_predicate("Hello World", {"i_contains": "hello"})
-        assert not _matches_predicate("Hello World", {"i_contains": "xyz"})
-
-    def test_starts_with(self):
-        assert _matches_predicate("hello world", {"starts_with": "hello"})
-        assert not _matches_predicate("hello world", {"starts_with": "world"})
-
-    def test_ends_with(self):
-        assert _matches_predicate("hello world", {"ends_with": "world"})
-        assert not _matches_predicate("hello world", {"ends_with": "hello"})
-
-    def test_i_starts_with_case_insensitive(self):
-        assert _matches_predicate("Hello World", {"i_starts_with": "HELLO"})
-        assert _matches_predicate("Hello World", {"i_starts_with": "hello"})
+def _diff(inserts=None, updates=None, deletes=None) -> dict:
+    """Build a diff payload, defaulting each section to empty."""
+    return {
+        "inserts": inserts or [],
+        "updates": updates or [],
+        "deletes": deletes or [],
+    }
 
-    def test_i_ends_with_case_insensitive(self):
-        assert _matches_predicate("Hello World", {"i_ends_with": "WORLD"})
-        assert _matches_predicate("Hello World", {"i_ends_with": "world"})
 
-    def test_regex(self):
-        assert _matches_predicate("test123", {"regex": r"\d+"})
-        assert _matches_predicate("abc@example.com", {"regex": r"^[\w\.-]+@[\w\.-]+\.\w+$"})
-        assert not _matches_predicate("test", {"regex": r"\d+"})
-        assert not _matches_predicate(123, {"regex": r"\d+"})
+class TestStringPredicates:
+    @pytest.mark.parametrize("value,predicate,expected", [
+        ("hello world", {"contains": "world"}, True),
+        ("hello world", {"contains": "xyz"}, False),
+        (123, {"contains": "world"}, False),
+        ("hello world", {"not_contains": "xyz"}, True),
+        ("hello world", {"not_contains": "world"}, False),
+        ("Hello World", {"i_contains": "WORLD"}, True),
+        ("Hello World", {"i_contains": "hello"}, True),
+        ("Hello World", {"i_contains": "xyz"}, False),
+        ("hello world", {"starts_with": "hello"}, True),
+        ("hello world", {"starts_with": "world"}, False),
+        ("hello world", {"ends_with": "world"}, True),
+        ("hello world", {"ends_with": "hello"}, False),
+        ("Hello World", {"i_starts_with": "HELLO"}, True),
+        ("Hello World", {"i_starts_with": "hello"}, True),
+        ("Hello World", {"i_ends_with": "WORLD"}, True),
+        ("Hello World", {"i_ends_with": "world"}, True),
+        ("test123", {"regex": r"\d+"}, True),
+        ("abc@example.com", {"regex": r"^[\w\.-]+@[\w\.-]+\.\w+$"}, True),
+        ("test", {"regex": r"\d+"}, False),
+        (123, {"regex": r"\d+"}, False),
+        ("test", {"regex": "("}, False),  # invalid pattern never matches
+    ])
+    def test_string_predicate(self, value, predicate, expected):
+        assert _matches_predicate(value, predicate) is expected
 
 
 class TestComparisonPredicates:
-    def test_eq(self):
-        assert _matches_predicate(5, {"eq": 5})
-        assert _matches_predicate("test", {"eq": "test"})
-        assert not _matches_predicate(5, {"eq": 6})
-
-    def test_ne(self):
-        assert _matches_predicate(5, {"ne": 6})
-        assert not _matches_predicate(5, {"ne": 5})
-
-    def test_gt_gte(self):
-        assert _matches_predicate(10, {"gt": 5})
-        assert not _matches_predicate(5, {"gt": 5})
-        assert _matches_predicate(5, {"gte": 5})
-        assert _matches_predicate(6, {"gte": 5})
-
-    def test_lt_lte(self):
-        assert _matches_predicate(5, {"lt": 10})
-        assert not _matches_predicate(10, {"lt": 10})
-        assert _matches_predicate(10, {"lte": 10})
-        assert _matches_predicate(9, {"lte": 10})
-
-    def test_comparison_with_null(self):
-        assert not _matches_predicate(None, {"gt": 5})
-        assert not _matches_predicate(None, {"lt": 5})
-
-    def test_comparison_with_non_numeric(self):
-        assert not _matches_predicate("text", {"gt": 5})
+    @pytest.mark.parametrize("value,predicate,expected", [
+        (5, {"eq": 5}, True),
+        ("test", {"eq": "test"}, True),
+        (5, {"eq": 6}, False),
+        (5, {"ne": 6}, True),
+        (5, {"ne": 5}, False),
+        (10, {"gt": 5}, True),
+        (5, {"gt": 5}, False),
+        (5, {"gte": 5}, True),
+        (6, {"gte": 5}, True),
+        (5, {"lt": 10}, True),
+        (10, {"lt": 10}, False),
+        (10, {"lte": 10}, True),
+        (9, {"lte": 10}, True),
+        # null and non-numeric values never satisfy an ordering
+        (None, {"gt": 5}, False),
+        (None, {"lt": 5}, False),
+        ("text", {"gt": 5}, False),
+    ])
+    def test_comparison_predicate(self, value, predicate, expected):
+        assert _matches_predicate(value, predicate) is expected
 
 
 class TestMembershipPredicates:
-    def test_in(self):
-        assert _matches_predicate("a", {"in": ["a", "b", "c"]})
-        assert not _matches_predicate("d", {"in": ["a", "b", "c"]})
-        assert _matches_predicate(1, {"in": [1, 2, 3]})
-
-    def test_not_in(self):
-        assert _matches_predicate("d", {"not_in": ["a", "b", "c"]})
-        assert not _matches_predicate("a", {"not_in": ["a", "b", "c"]})
-
-    def test_has_any(self):
-        assert _matches_predicate(["a", "b", "c"], {"has_any": ["a", "x"]})
-        assert not _matches_predicate(["a", "b", "c"], {"has_any": ["x", "y"]})
-        assert _matches_predicate("abc", {"has_any": ["a", "x"]})
-
-    def test_has_all(self):
-        assert _matches_predicate(["a", "b", "c"], {"has_all": ["a", "b"]})
-        assert not _matches_predicate(["a", "b"], {"has_all": ["a", "b", "c"]})
-
-    def test_exists(self):
-        assert _matches_predicate("value", {"exists": True})
-        assert _matches_predicate(0, {"exists": True})
-        assert _matches_predicate(None, {"exists": False})
-        assert not _matches_predicate("value", {"exists": False})
+    @pytest.mark.parametrize("value,predicate,expected", [
+        ("a", {"in": ["a", "b", "c"]}, True),
+        ("d", {"in": ["a", "b", "c"]}, False),
+        (1, {"in": [1, 2, 3]}, True),
+        ("d", {"not_in": ["a", "b", "c"]}, True),
+        ("a", {"not_in": ["a", "b", "c"]}, False),
+        (["a", "b", "c"], {"has_any": ["a", "x"]}, True),
+        (["a", "b", "c"], {"has_any": ["x", "y"]}, False),
+        ("abc", {"has_any": ["a", "x"]}, True),
+        (["a", "b", "c"], {"has_all": ["a", "b"]}, True),
+        (["a", "b"], {"has_all": ["a", "b", "c"]}, False),
+        ("value", {"exists": True}, True),
+        (0, {"exists": True}, True),
+        (None, {"exists": False}, True),
+        ("value", {"exists": False}, False),
+    ])
+    def test_membership_predicate(self, value, predicate, expected):
+        assert _matches_predicate(value, predicate) is expected
 
 
 class TestRowMatching:
@@ -198,32 +186,37 @@ class TestChangedKeys:
         changed = _changed_keys(before, after, set())
         assert changed == {"b"}
 
+    def test_changed_keys_missing_field_equals_null(self):
+        before = {"a": 1, "b": None}
+        after = {"a": 1}
+        changed = _changed_keys(before, after, set())
+        assert changed == set()
+
 
 class TestCountMatching:
+    # _count_matches is stateless, so one engine serves the whole class.
+    engine = AssertionEngine({"version": "0.1", "assertions": []})
+
     def test_exact_count_match(self):
-        engine = AssertionEngine({"version": "0.1", "assertions": []})
-        assert engine._count_matches(5, 5)
-        assert not engine._count_matches(5, 3)
+        assert self.engine._count_matches(5, 5)
+        assert not self.engine._count_matches(5, 3)
 
     def test_range_min_only(self):
-        engine = AssertionEngine({"version": "0.1", "assertions": []})
-        assert engine._count_matches({"min": 3}, 5)
-        assert engine._count_matches({"min": 3}, 3)
-        assert not engine._count_matches({"min": 3}, 2)
+        assert self.engine._count_matches({"min": 3}, 5)
+        assert self.engine._count_matches({"min": 3}, 3)
+        assert not self.engine._count_matches({"min": 3}, 2)
 
     def test_range_max_only(self):
-        engine = AssertionEngine({"version": "0.1", "assertions": []})
-        assert engine._count_matches({"max": 10}, 5)
-        assert engine._count_matches({"max": 10}, 10)
-        assert not engine._count_matches({"max": 10}, 11)
+        assert self.engine._count_matches({"max": 10}, 5)
+        assert self.engine._count_matches({"max": 10}, 10)
+        assert not self.engine._count_matches({"max": 10}, 11)
 
     def test_range_min_and_max(self):
-        engine = AssertionEngine({"version": "0.1", "assertions": []})
-        assert engine._count_matches({"min": 3, "max": 10}, 5)
-        assert engine._count_matches({"min": 3, "max": 10}, 3)
-        assert engine._count_matches({"min": 3, "max": 10}, 10)
-        assert not engine._count_matches({"min": 3, "max": 10}, 2)
-        assert not engine._count_matches({"min": 3, "max": 10}, 11)
+        assert self.engine._count_matches({"min": 3, "max": 10}, 5)
+        assert self.engine._count_matches({"min": 3, "max": 10}, 3)
+        assert self.engine._count_matches({"min": 3, "max": 10}, 10)
+        assert not self.engine._count_matches({"min": 3, "max": 10}, 2)
+        assert not self.engine._count_matches({"min": 3, "max": 10}, 11)
 
 
 class TestAssertionEngineEvaluate:
@@ -239,13 +232,7 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [
-                {"__table__": "messages", "text": "hello world"}
-            ],
-            "updates": [],
-            "deletes": []
-        }
+        diff = _diff(inserts=[{"__table__": "messages", "text": "hello world"}])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -264,13 +251,7 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [
-                {"__table__": "messages", "text": "hello"}
-            ],
-            "updates": [],
-            "deletes": []
-        }
+        diff = _diff(inserts=[{"__table__": "messages", "text": "hello"}])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -290,13 +271,7 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [],
-            "updates": [],
-            "deletes": [
-                {"__table__": "messages", "message_id": "M123"}
-            ]
-        }
+        diff = _diff(deletes=[{"__table__": "messages", "message_id": "M123"}])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -318,17 +293,13 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [],
-            "updates": [
-                {
-                    "__table__": "channels",
-                    "before": {"channel_id": "C123", "topic": "old topic"},
-                    "after": {"channel_id": "C123", "topic": "new topic"}
-                }
-            ],
-            "deletes": []
-        }
+        diff = _diff(updates=[
+            {
+                "__table__": "channels",
+                "before": {"channel_id": "C123", "topic": "old topic"},
+                "after": {"channel_id": "C123", "topic": "new topic"}
+            }
+        ])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -348,17 +319,13 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [],
-            "updates": [
-                {
-                    "__table__": "channels",
-                    "before": {"channel_id": "C123", "topic": "old", "name": "old name"},
-                    "after": {"channel_id": "C123", "topic": "new", "name": "new name"}
-                }
-            ],
-            "deletes": []
-        }
+        diff = _diff(updates=[
+            {
+                "__table__": "channels",
+                "before": {"channel_id": "C123", "topic": "old", "name": "old name"},
+                "after": {"channel_id": "C123", "topic": "new", "name": "new name"}
+            }
+        ])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -375,11 +342,7 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [],
-            "updates": [],
-            "deletes": []
-        }
+        diff = _diff()
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
@@ -395,14 +358,28 @@ class TestAssertionEngineEvaluate:
                 }
             ]
         }
-        diff = {
-            "inserts": [
-                {"__table__": "messages", "text": "new"}
-            ],
-            "updates": [],
-            "deletes": []
-        }
+        diff = _diff(inserts=[{"__table__": "messages", "text": "new"}])
         engine = AssertionEngine(spec)
         result = engine.evaluate(diff)
 
         assert result["passed"] is False
+
+    def test_assertions_only_see_their_entity_rows(self):
+        spec = {
+            "version": "0.1",
+            "assertions": [
+                {"diff_type": "added", "entity": "messages", "expected_count": 2},
+                {"diff_type": "added", "entity": "channels", "expected_count": 1},
+                {"diff_type": "unchanged", "entity": "users"}
+            ]
+        }
+        diff = _diff(inserts=[
+            {"__table__": "messages", "text": "one"},
+            {"__table__": "channels", "name": "new"},
+            {"__table__": "messages", "text": "two"},
+        ])
+        engine = AssertionEngine(spec)
+        result = engine.evaluate(diff)
+
+        assert result["passed"] is True
+        assert result["score"]["passed"] == 3
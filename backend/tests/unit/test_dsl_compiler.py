@@ -3,17 +3,20 @@ from jsonschema.exceptions import ValidationError
 from src.platform.evaluationEngine.compiler import DSLCompiler
 
 
+@pytest.fixture(scope="module")
+def compiler():
+    return DSLCompiler()
+
+
 class TestDSLSchemaValidation:
-    def test_valid_minimal_spec(self):
-        compiler = DSLCompiler()
+    def test_valid_minimal_spec(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [{"diff_type": "added", "entity": "messages"}],
         }
         compiler.validate(spec)
 
-    def test_invalid_version_rejected(self):
-        compiler = DSLCompiler()
+    def test_invalid_version_rejected(self, compiler):
         spec = {
             "version": "999.0",
             "assertions": [{"diff_type": "added", "entity": "messages"}],
@@ -21,23 +24,20 @@ class TestDSLSchemaValidation:
         with pytest.raises(ValidationError):
             compiler.validate(spec)
 
-    def test_missing_version_allowed(self):
+    def test_missing_version_allowed(self, compiler):
         """Version field is optional - validation should pass without it."""
-        compiler = DSLCompiler()
         spec = {"assertions": [{"diff_type": "added", "entity": "messages"}]}
         # Should not raise - version is optional
         compiler.validate(spec)
         compiled = compiler.compile(spec)
         assert compiled is not None
 
-    def test_missing_assertions_rejected(self):
-        compiler = DSLCompiler()
+    def test_missing_assertions_rejected(self, compiler):
         spec = {"version": "0.1"}
         with pytest.raises(ValidationError):
             compiler.validate(spec)
 
-    def test_invalid_diff_type_rejected(self):
-        compiler = DSLCompiler()
+    def test_invalid_diff_type_rejected(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [{"diff_type": "modified", "entity": "messages"}],
@@ -45,8 +45,7 @@ class TestDSLSchemaValidation:
         with pytest.raises(ValidationError):
             compiler.validate(spec)
 
-    def test_invalid_predicate_operator_rejected(self):
-        compiler = DSLCompiler()
+    def test_invalid_predicate_operator_rejected(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -60,8 +59,7 @@ class TestDSLSchemaValidation:
         with pytest.raises(ValidationError):
             compiler.validate(spec)
 
-    def test_changed_requires_expected_changes(self):
-        compiler = DSLCompiler()
+    def test_changed_requires_expected_changes(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -74,8 +72,7 @@ class TestDSLSchemaValidation:
         }
         compiler.validate(spec)
 
-    def test_extra_properties_rejected(self):
-        compiler = DSLCompiler()
+    def test_extra_properties_rejected(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [{"diff_type": "added", "entity": "messages"}],
@@ -86,8 +83,7 @@ class TestDSLSchemaValidation:
 
 
 class TestDSLNormalization:
-    def test_shorthand_values_to_eq_predicate(self):
-        compiler = DSLCompiler()
+    def test_shorthand_values_to_eq_predicate(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -104,8 +100,7 @@ class TestDSLNormalization:
         assert assertion["where"]["channel_id"] == {"eq": "C123"}
         assert assertion["where"]["user_id"] == {"eq": "U456"}
 
-    def test_where_clause_normalization(self):
-        compiler = DSLCompiler()
+    def test_where_clause_normalization(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -122,8 +117,27 @@ class TestDSLNormalization:
         assert assertion["where"]["text"] == {"contains": "hello"}
         assert assertion["where"]["count"] == {"eq": 5}
 
-    def test_expected_changes_normalization_with_from_to(self):
-        compiler = DSLCompiler()
+    def test_where_fields_ordered_cheapest_first(self, compiler):
+        spec = {
+            "version": "0.1",
+            "assertions": [
+                {
+                    "diff_type": "added",
+                    "entity": "messages",
+                    "where": {
+                        "text": {"regex": "^hi"},
+                        "user_id": {"contains": "U0"},
+                        "channel_id": "C123",
+                    },
+                }
+            ],
+        }
+        normalized = compiler.normalize(spec)
+        where = normalized["assertions"][0]["where"]
+
+        assert list(where) == ["channel_id", "user_id", "text"]
+
+    def test_expected_changes_normalization_with_from_to(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -142,8 +156,7 @@ class TestDSLNormalization:
         assert assertion["expected_changes"]["topic"]["from"] == {"eq": "old topic"}
         assert assertion["expected_changes"]["topic"]["to"] == {"contains": "new"}
 
-    def test_expected_changes_shorthand_to_only(self):
-        compiler = DSLCompiler()
+    def test_expected_changes_shorthand_to_only(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -159,8 +172,7 @@ class TestDSLNormalization:
 
         assert assertion["expected_changes"]["text"] == {"to": {"eq": "Updated text"}}
 
-    def test_ignore_fields_preserved(self):
-        compiler = DSLCompiler()
+    def test_ignore_fields_preserved(self, compiler):
         spec = {
             "version": "0.1",
             "ignore_fields": {
@@ -179,8 +191,7 @@ class TestDSLNormalization:
 
 
 class TestDSLCompile:
-    def test_compile_validates_and_normalizes(self):
-        compiler = DSLCompiler()
+    def test_compile_validates_and_normalizes(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [
@@ -196,8 +207,7 @@ class TestDSLCompile:
         assert compiled["version"] == "0.1"
         assert compiled["assertions"][0]["where"]["channel_id"] == {"eq": "C123"}
 
-    def test_compile_rejects_invalid_spec(self):
-        compiler = DSLCompiler()
+    def test_compile_rejects_invalid_spec(self, compiler):
         spec = {
             "version": "0.1",
             "assertions": [{"diff_type": "invalid_type", "entity": "messages"}],
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.services.linear.api import graphql_linear
+from src.services.linear.api.graphql_linear import LinearGraphQLHTTPHandler
+
+VIEWER = {"query": "query { viewer { id } }"}
+MUTATION = {"query": "mutation { issueCreate(input: {}) { success } }"}
+
+
+def _request(env_id="env-1", session=None):
+    return SimpleNamespace(
+        state=SimpleNamespace(
+            environment_id=env_id, impersonate_user_id=None, db_session=session
+        )
+    )
+
+
+@pytest.fixture
+def executions(monkeypatch):
+    """Count executions that reach the real GraphQL handler."""
+    calls = []
+
+    async def execute(self, request, data, *, context_value=None, query_document=None):
+        calls.append(data["query"])
+        return True, {"data": {"n": len(calls)}}
+
+    monkeypatch.setattr(GraphQLHTTPHandler, "execute_graphql_query", execute)
+    return calls
+
+
+@pytest.mark.asyncio
+class TestLinearResponseCache:
+    async def test_replays_viewer_until_mutation_commits(self, executions):
+        handler = LinearGraphQLHTTPHandler()
+        session = Session(create_engine("sqlite://"))
+
+        first = await handler.execute_graphql_query(_request(), VIEWER)
+        assert await handler.execute_graphql_query(_request(), VIEWER) == first
+        assert len(executions) == 1
+
+        await handler.execute_graphql_query(_request(session=session), MUTATION)
+        # A read racing the uncommitted write is cached under the in-flight
+        # version, then orphaned when the mutation's session commits.
+        await handler.execute_graphql_query(_request(), VIEWER)
+        session.execute(text("select 1"))
+        session.commit()
+
+        await handler.execute_graphql_query(_request(), VIEWER)
+        assert len(executions) == 4
+
+    async def test_does_not_store_reads_overlapping_a_mutation(self, monkeypatch):
+        handler = LinearGraphQLHTTPHandler()
+
+        async def execute_with_write(self, request, data, **kwargs):
+            handler._bump_version("env-1")
+            return True, {"data": {}}
+
+        monkeypatch.setattr(
+            GraphQLHTTPHandler, "execute_graphql_query", execute_with_write
+        )
+        await handler.execute_graphql_query(_request(), VIEWER)
+        assert not handler._responses
+
+    async def test_evicted_environment_drops_its_cached_replies(
+        self, executions, monkeypatch
+    ):
+        monkeypatch.setattr(graphql_linear, "VERSION_TABLE_SIZE", 1)
+        handler = LinearGraphQLHTTPHandler()
+
+        await handler.execute_graphql_query(_request("env-1"), MUTATION)
+        await handler.execute_graphql_query(_request("env-1"), VIEWER)
+        assert handler._responses
+
+        await handler.execute_graphql_query(_request("env-2"), MUTATION)
+        assert list(handler._versions) == ["env-2"]
+        assert not handler._responses
+
+    async def test_dashed_and_hex_environment_ids_share_a_version(self, executions):
+        env = uuid4()
+        handler = LinearGraphQLHTTPHandler()
+
+        await handler.execute_graphql_query(_request(env.hex), VIEWER)
+        await handler.execute_graphql_query(_request(str(env)), MUTATION)
+        await handler.execute_graphql_query(_request(env.hex), VIEWER)
+        assert executions.count(VIEWER["query"]) == 2
@@ -0,0 +1,25 @@
+import pytest
+from src.services.slack.api.methods import SlackAPIError, _validate_channel_name
+
+
+class TestChannelNameValidation:
+    @pytest.mark.parametrize(
+        "name,error",
+        [
+            (None, "invalid_name_required"),
+            ("", "invalid_name_required"),
+            ("a" * 81, "invalid_name_maxlength"),
+            ("TestChannel", "invalid_name_specials"),
+            ("has space", "invalid_name_specials"),
+            ("dot.name", "invalid_name_specials"),
+        ],
+    )
+    def test_rejects_invalid_names(self, name, error):
+        with pytest.raises(SlackAPIError) as exc:
+            _validate_channel_name(name)
+        assert exc.value.detail == error
+        assert exc.value.status_code == 400
+
+    @pytest.mark.parametrize("name", ["general", "team-2024", "snake_case", "a" * 80])
+    def test_accepts_valid_names(self, name):
+        _validate_channel_name(name)
@@ -8,8 +8,9 @@ This module validates:
 4. Assertion smoke tests (engine evaluation)
 """
 
-import json
+import orjson
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from jsonschema import validate as jsonschema_validate, ValidationError
 
@@ -22,6 +23,65 @@ from httpx import AsyncClient
 # Project root for discovering examples
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 EXAMPLES_DIR = PROJECT_ROOT / "examples"
+SLACK_BENCH = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
+
+# One compiler for the module: it only holds the cached schema validator.
+_COMPILER = DSLCompiler()
+
+
+@lru_cache(maxsize=None)
+def _example_files(kind: str) -> tuple[Path, ...]:
+    """Every examples/<service>/<kind>/*.json file, e.g. kind="seeds"."""
+    return tuple(sorted(EXAMPLES_DIR.glob(f"*/{kind}/*.json")))
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: Path) -> dict:
+    """Parse a suite or seed file once per session. Callers must not mutate it."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+# ID columns that suite assertions may pin with an exact eq predicate.
+SEED_ID_FIELDS = {
+    "messages": ["message_id", "channel_id", "user_id"],
+    "channels": ["channel_id", "team_id"],
+    "users": ["user_id"],
+    "channel_members": ["channel_id", "user_id"],
+    "message_reactions": ["message_id", "user_id"],
+}
+
+# Owning table for FK columns, checked when the id is not on the row itself.
+SEED_PARENT_TABLES = {
+    "channel_id": "channels",
+    "user_id": "users",
+    "message_id": "messages",
+}
+
+
+@lru_cache(maxsize=None)
+def _seed_index(seed_file: Path) -> dict[tuple[str, str], frozenset]:
+    """Map (entity, field) to the set of values present in a seed file."""
+    seed_data = _load_json(seed_file)
+    return {
+        (entity, field): frozenset(r.get(field) for r in seed_data.get(entity, []))
+        for entity, fields in SEED_ID_FIELDS.items()
+        for field in fields
+    }
+
+
+def _bench_spec(test_id: str) -> dict:
+    suite = _load_json(SLACK_BENCH)
+    return next(t for t in suite["tests"] if t["id"] == test_id)
+
+
+def _compile_engine(assertions: list[dict]) -> AssertionEngine:
+    """Compile `assertions` with slack_bench's ignore_fields into an engine."""
+    suite = _load_json(SLACK_BENCH)
+    spec = {"version": "0.1", "assertions": assertions}
+    if "ignore_fields" in suite:
+        spec["ignore_fields"] = suite["ignore_fields"]
+    return AssertionEngine(_COMPILER.compile(spec))
 
 
 # ============================================================================
@@ -35,13 +95,12 @@ class TestStaticSchemaValidation:
     def test_all_test_suites_validate_against_dsl_schema(self):
         """Ensure all testsuites/*.json files are valid DSL."""
         compiler = DSLCompiler()
-        test_suite_files = list(EXAMPLES_DIR.glob("*/testsuites/*.json"))
+        test_suite_files = _example_files("testsuites")
 
         assert len(test_suite_files) > 0, "No test suite files found"
 
         for suite_file in test_suite_files:
-            with open(suite_file) as f:
-                data = json.load(f)
+            data = _load_json(suite_file)
 
             # Each test in the suite should have assertions that validate
             for test in data.get("tests", []):
@@ -66,13 +125,12 @@ class TestStaticSchemaValidation:
 
     def test_all_seed_files_have_valid_structure(self):
         """Ensure all seeds/*.json files have required top-level keys."""
-        seed_files = list(EXAMPLES_DIR.glob("*/seeds/*.json"))
+        seed_files = _example_files("seeds")
 
         assert len(seed_files) > 0, "No seed files found"
 
         for seed_file in seed_files:
-            with open(seed_file) as f:
-                data = json.load(f)
+            data = _load_json(seed_file)
 
             # All seeds should be dicts
             assert isinstance(data, dict), f"{seed_file.name} is not a JSON object"
@@ -110,11 +168,10 @@ class TestReferentialIntegrity:
 
     def test_all_seed_templates_exist(self):
         """Verify every seed_template referenced in tests has a matching seed file."""
-        test_suite_files = list(EXAMPLES_DIR.glob("*/testsuites/*.json"))
+        test_suite_files = _example_files("testsuites")
 
         for suite_file in test_suite_files:
-            with open(suite_file) as f:
-                data = json.load(f)
+            data = _load_json(suite_file)
 
             service = data.get("service")
             if not service:
@@ -134,11 +191,10 @@ class TestReferentialIntegrity:
 
     def test_assertion_ids_exist_in_seed_data(self):
         """Cross-check hardcoded IDs in assertions exist in corresponding seeds."""
-        test_suite_files = list(EXAMPLES_DIR.glob("*/testsuites/*.json"))
+        test_suite_files = _example_files("testsuites")
 
         for suite_file in test_suite_files:
-            with open(suite_file) as f:
-                suite_data = json.load(f)
+            suite_data = _load_json(suite_file)
 
             service = suite_data.get("service")
             if not service:
@@ -154,8 +210,7 @@ class TestReferentialIntegrity:
                 if not seed_file.exists():
                     continue
 
-                with open(seed_file) as f:
-                    seed_data = json.load(f)
+                index = _seed_index(seed_file)
 
                 # Extract hardcoded IDs from assertions
                 for assertion in test.get("assertions", []):
@@ -164,26 +219,15 @@ class TestReferentialIntegrity:
 
                     # Check specific ID fields
                     self._check_id_in_seed(
-                        where, entity, seed_data, test["id"], suite_file.name
+                        where, entity, index, test["id"], suite_file.name
                     )
 
-    def _check_id_in_seed(self, where, entity, seed_data, test_id, suite_name):
+    def _check_id_in_seed(self, where, entity, index, test_id, suite_name):
         """Helper to validate IDs in where clauses exist in seed data."""
-        # Only check exact eq predicates for known ID fields
-        id_fields = {
-            "messages": ["message_id", "channel_id", "user_id"],
-            "channels": ["channel_id", "team_id"],
-            "users": ["user_id"],
-            "channel_members": ["channel_id", "user_id"],
-            "message_reactions": ["message_id", "user_id"],
-        }
-
-        if entity not in id_fields:
+        if entity not in SEED_ID_FIELDS:
             return
 
-        entity_records = seed_data.get(entity, [])
-
-        for field in id_fields[entity]:
+        for field in SEED_ID_FIELDS[entity]:
             if field in where:
                 predicate = where[field]
 
@@ -191,28 +235,11 @@ class TestReferentialIntegrity:
                 if isinstance(predicate, dict) and "eq" in predicate:
                     expected_id = predicate["eq"]
 
-                    # Check if this ID exists in seed data
-                    found = any(
-                        record.get(field) == expected_id for record in entity_records
-                    )
-
-                    if not found:
-                        # For FK fields, check parent entity
-                        if field == "channel_id":
-                            found = any(
-                                ch.get("channel_id") == expected_id
-                                for ch in seed_data.get("channels", [])
-                            )
-                        elif field == "user_id":
-                            found = any(
-                                u.get("user_id") == expected_id
-                                for u in seed_data.get("users", [])
-                            )
-                        elif field == "message_id":
-                            found = any(
-                                m.get("message_id") == expected_id
-                                for m in seed_data.get("messages", [])
-                            )
+                    # Check the row itself, then the FK's parent table
+                    found = expected_id in index[(entity, field)]
+                    if not found and field in SEED_PARENT_TABLES:
+                        parent = SEED_PARENT_TABLES[field]
+                        found = expected_id in index[(parent, field)]
 
                     assert found, (
                         f"{suite_name} test '{test_id}': assertion references "
@@ -221,11 +248,10 @@ class TestReferentialIntegrity:
 
     def test_seed_foreign_key_integrity(self):
         """Validate FK relationships in seed data."""
-        seed_files = list(EXAMPLES_DIR.glob("*/seeds/*.json"))
+        seed_files = _example_files("seeds")
 
         for seed_file in seed_files:
-            with open(seed_file) as f:
-                data = json.load(f)
+            data = _load_json(seed_file)
 
             # Determine schema type based on keys (Slack vs Linear)
             is_slack_schema = "teams" in data and any(
@@ -242,61 +268,30 @@ class TestReferentialIntegrity:
             channel_ids = {c["channel_id"] for c in data.get("channels", [])}
             message_ids = {m["message_id"] for m in data.get("messages", [])}
 
-            # Validate channels reference valid teams
-            for ch in data.get("channels", []):
-                if "team_id" in ch and ch["team_id"]:
-                    assert ch["team_id"] in team_ids, (
-                        f"{seed_file.name}: channel {ch['channel_id']} references "
-                        f"non-existent team {ch['team_id']}"
-                    )
-
-            # Validate user_teams references
-            for ut in data.get("user_teams", []):
-                assert ut["user_id"] in user_ids, (
-                    f"{seed_file.name}: user_teams references non-existent user {ut['user_id']}"
-                )
-                assert ut["team_id"] in team_ids, (
-                    f"{seed_file.name}: user_teams references non-existent team {ut['team_id']}"
-                )
-
-            # Validate channel_members references
-            for cm in data.get("channel_members", []):
-                assert cm["channel_id"] in channel_ids, (
-                    f"{seed_file.name}: channel_members references "
-                    f"non-existent channel {cm['channel_id']}"
-                )
-                assert cm["user_id"] in user_ids, (
-                    f"{seed_file.name}: channel_members references "
-                    f"non-existent user {cm['user_id']}"
-                )
-
-            # Validate messages references
-            for msg in data.get("messages", []):
-                assert msg["channel_id"] in channel_ids, (
-                    f"{seed_file.name}: message {msg['message_id']} references "
-                    f"non-existent channel {msg['channel_id']}"
-                )
-                assert msg["user_id"] in user_ids, (
-                    f"{seed_file.name}: message {msg['message_id']} references "
-                    f"non-existent user {msg['user_id']}"
-                )
-
-                # Validate parent_id if present
-                if "parent_id" in msg and msg["parent_id"]:
-                    assert msg["parent_id"] in message_ids, (
-                        f"{seed_file.name}: message {msg['message_id']} references "
-                        f"non-existent parent {msg['parent_id']}"
-                    )
-
-            # Validate message_reactions
-            for react in data.get("message_reactions", []):
-                assert react["message_id"] in message_ids, (
-                    f"{seed_file.name}: reaction references "
-                    f"non-existent message {react['message_id']}"
-                )
-                assert react["user_id"] in user_ids, (
-                    f"{seed_file.name}: reaction references "
-                    f"non-existent user {react['user_id']}"
+            # (table, FK column, valid ids, nullable): one pass and one assert
+            # per relationship instead of an assert per row.
+            fk_checks = [
+                ("channels", "team_id", team_ids, True),
+                ("user_teams", "user_id", user_ids, False),
+                ("user_teams", "team_id", team_ids, False),
+                ("channel_members", "channel_id", channel_ids, False),
+                ("channel_members", "user_id", user_ids, False),
+                ("messages", "channel_id", channel_ids, False),
+                ("messages", "user_id", user_ids, False),
+                ("messages", "parent_id", message_ids, True),
+                ("message_reactions", "message_id", message_ids, False),
+                ("message_reactions", "user_id", user_ids, False),
+            ]
+            for table, field, valid_ids, nullable in fk_checks:
+                rows = data.get(table, [])
+                if nullable:
+                    values = [row[field] for row in rows if row.get(field)]
+                else:
+                    values = [row[field] for row in rows]
+                orphans = [v for v in values if v not in valid_ids]
+                assert not orphans, (
+                    f"{seed_file.name}: {len(orphans)} {table}.{field} value(s) "
+                    f"reference non-existent rows, e.g. {orphans[:5]}"
                 )
 
 
@@ -305,60 +300,115 @@ class TestReferentialIntegrity:
 # ============================================================================
 
 
+def _assert_diff_passes(differ, assertions: list[dict]) -> None:
+    """Diff the before/after snapshots and require every assertion to pass."""
+    diff = differ.get_diff("before", "after")
+    result = _compile_engine(assertions).evaluate(diff.model_dump())
+
+    assert result["passed"] is True, f"Assertions failed: {result['failures']}"
+    assert result["score"]["passed"] == result["score"]["total"]
+
+
+# test_12 impersonates U02JOHNDOE1, but slack_client uses U01AGENBOT9, so the
+# edit targets the agent's own message (1699564800.000123) instead.
+TEST_12_ASSERTIONS = [
+    {
+        "diff_type": "changed",
+        "entity": "messages",
+        "where": {
+            "channel_id": {"eq": "C01ABCD1234"},
+            "message_id": {"eq": "1699564800.000123"},
+        },
+        "expected_changes": {"message_text": {"to": {"contains": "Hello everyone"}}},
+    }
+]
+
+# test_15 deletes the agent's deployment message from the seed.
+TEST_15_ASSERTIONS = [
+    {
+        "diff_type": "removed",
+        "entity": "messages",
+        "where": {
+            "channel_id": {"eq": "C01ABCD1234"},
+            "message_id": {"eq": "1699564800.000123"},
+        },
+        "expected_count": 1,
+    }
+]
+
+# (test id, endpoint, payload, assertions override) for single-request
+# slack_bench tests.
+SINGLE_CALL_CASES = [
+    pytest.param(
+        "test_1",
+        "/chat.postMessage",
+        {"channel": "C01ABCD1234", "text": "hello everyone"},
+        None,
+        id="test_1",
+    ),
+    pytest.param(
+        "test_9",
+        "/reactions.add",
+        {
+            "name": "thumbsup",
+            "channel": "C02EFGH5678",
+            "timestamp": "1699572000.000789",
+        },
+        None,
+        id="test_9",
+    ),
+    pytest.param(
+        "test_11",
+        "/conversations.setTopic",
+        {"channel": "C01ABCD1234", "topic": "Weekly standup discussions"},
+        None,
+        id="test_11",
+    ),
+    pytest.param(
+        "test_12",
+        "/chat.update",
+        {"channel": "C01ABCD1234", "ts": "1699564800.000123", "text": "Hello everyone"},
+        TEST_12_ASSERTIONS,
+        id="test_12",
+    ),
+    pytest.param(
+        "test_15",
+        "/chat.delete",
+        {"channel": "C01ABCD1234", "ts": "1699564800.000123"},
+        TEST_15_ASSERTIONS,
+        id="test_15",
+    ),
+]
+
+
 @pytest.mark.asyncio
 class TestLiveAPIExecution:
     """Execute real API calls and validate against test suite assertions."""
 
-    async def test_slack_bench_test_1_via_api(self, slack_client_with_differ):
-        """test_1: Send message to #general via chat.postMessage API."""
+    @pytest.mark.parametrize(
+        "test_id, endpoint, payload, assertions", SINGLE_CALL_CASES
+    )
+    async def test_slack_bench_single_call_via_api(
+        self, slack_client_with_differ, test_id, endpoint, payload, assertions
+    ):
+        """Replay a one-request slack_bench test and check its assertions."""
         client = slack_client_with_differ["client"]
         differ = slack_client_with_differ["differ"]
+        if assertions is None:
+            assertions = _bench_spec(test_id)["assertions"]
 
-        # Load test spec
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_1")
-
-        # Create before snapshot
         differ.create_snapshot("before")
-
-        # Execute API action
-        response = await client.post(
-            "/chat.postMessage",
-            json={"channel": "C01ABCD1234", "text": "hello everyone"},
-        )
+        response = await client.post(endpoint, json=payload)
         assert response.status_code == 200
-
-        # Create after snapshot
         differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
 
-        # Build spec and evaluate
-        spec = {"version": "0.1", "assertions": test_spec["assertions"]}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
-        assert result["score"]["passed"] == result["score"]["total"]
+        _assert_diff_passes(differ, assertions)
 
     async def test_slack_bench_test_2_via_api(self, slack_client_with_differ):
         """test_2: Open DM + send message via API."""
         client = slack_client_with_differ["client"]
         differ = slack_client_with_differ["differ"]
 
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_2")
-
         differ.create_snapshot("before")
 
         # Open DM with John
@@ -375,30 +425,13 @@ class TestLiveAPIExecution:
         assert msg_resp.status_code == 200
 
         differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        spec = {"version": "0.1", "assertions": test_spec["assertions"]}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
+        _assert_diff_passes(differ, _bench_spec("test_2")["assertions"])
 
     async def test_slack_bench_test_7_via_api(self, slack_bench_client_with_differ):
-        """test_7: Threaded reply via API."""
+        """test_7: Threaded reply via API (needs the slack_bench_default seed)."""
         client = slack_bench_client_with_differ["client"]
         differ = slack_bench_client_with_differ["differ"]
 
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_7")
-
         differ.create_snapshot("before")
 
         # Reply to MCP deployment question (1700173200.000456)
@@ -413,192 +446,7 @@ class TestLiveAPIExecution:
         assert response.status_code == 200
 
         differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        spec = {"version": "0.1", "assertions": test_spec["assertions"]}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
-
-    async def test_slack_bench_test_9_via_api(self, slack_client_with_differ):
-        """test_9: Add reaction via API."""
-        client = slack_client_with_differ["client"]
-        differ = slack_client_with_differ["differ"]
-
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_9")
-
-        differ.create_snapshot("before")
-
-        # Add reaction to message in #random
-        response = await client.post(
-            "/reactions.add",
-            json={
-                "name": "thumbsup",
-                "channel": "C02EFGH5678",
-                "timestamp": "1699572000.000789",
-            },
-        )
-        assert response.status_code == 200
-
-        differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        spec = {"version": "0.1", "assertions": test_spec["assertions"]}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
-
-    async def test_slack_bench_test_11_via_api(self, slack_client_with_differ):
-        """test_11: Update channel topic via API."""
-        client = slack_client_with_differ["client"]
-        differ = slack_client_with_differ["differ"]
-
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_11")
-
-        differ.create_snapshot("before")
-
-        # Set topic
-        response = await client.post(
-            "/conversations.setTopic",
-            json={"channel": "C01ABCD1234", "topic": "Weekly standup discussions"},
-        )
-        assert response.status_code == 200
-
-        differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        spec = {"version": "0.1", "assertions": test_spec["assertions"]}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
-
-    async def test_slack_bench_test_12_via_api(self, slack_client_with_differ):
-        """test_12: Edit message via API."""
-        client = slack_client_with_differ["client"]
-        differ = slack_client_with_differ["differ"]
-
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        # Note: test_12 impersonates U02JOHNDOE1, but slack_client uses U01AGENBOT9
-        # We need to use the AGENT's message for this test
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_12")
-
-        differ.create_snapshot("before")
-
-        # Update the agent's message (1699564800.000123)
-        response = await client.post(
-            "/chat.update",
-            json={
-                "channel": "C01ABCD1234",
-                "ts": "1699564800.000123",
-                "text": "Hello everyone",
-            },
-        )
-        assert response.status_code == 200
-
-        differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        # Adjust assertion to match agent's message
-        adjusted_assertions = [
-            {
-                "diff_type": "changed",
-                "entity": "messages",
-                "where": {
-                    "channel_id": {"eq": "C01ABCD1234"},
-                    "message_id": {"eq": "1699564800.000123"},
-                },
-                "expected_changes": {
-                    "message_text": {"to": {"contains": "Hello everyone"}}
-                },
-            }
-        ]
-
-        spec = {"version": "0.1", "assertions": adjusted_assertions}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
-
-    async def test_slack_bench_test_15_via_api(self, slack_client_with_differ):
-        """test_15: Delete message via API."""
-        client = slack_client_with_differ["client"]
-        differ = slack_client_with_differ["differ"]
-
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        test_spec = next(t for t in suite["tests"] if t["id"] == "test_15")
-
-        differ.create_snapshot("before")
-
-        # Delete agent's message about deployment
-        # First, let's find it - it should be 1699564800.000123 based on seed
-        response = await client.post(
-            "/chat.delete", json={"channel": "C01ABCD1234", "ts": "1699564800.000123"}
-        )
-        assert response.status_code == 200
-
-        differ.create_snapshot("after")
-        diff = differ.get_diff("before", "after")
-
-        # Adjust assertion to use correct message
-        adjusted_assertions = [
-            {
-                "diff_type": "removed",
-                "entity": "messages",
-                "where": {
-                    "channel_id": {"eq": "C01ABCD1234"},
-                    "message_id": {"eq": "1699564800.000123"},
-                },
-                "expected_count": 1,
-            }
-        ]
-
-        spec = {"version": "0.1", "assertions": adjusted_assertions}
-        if "ignore_fields" in suite:
-            spec["ignore_fields"] = suite["ignore_fields"]
-
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
-        result = engine.evaluate(diff.model_dump())
-
-        assert result["passed"] is True, f"Assertions failed: {result['failures']}"
+        _assert_diff_passes(differ, _bench_spec("test_7")["assertions"])
 
 
 # ============================================================================
@@ -611,21 +459,12 @@ class TestAssertionEngineSmoke:
 
     def test_slack_bench_assertions_compile(self):
         """Ensure all Slack bench assertions compile without errors."""
-        suite_file = EXAMPLES_DIR / "slack" / "testsuites" / "slack_bench.json"
-        with open(suite_file) as f:
-            suite = json.load(f)
-
-        compiler = DSLCompiler()
+        suite = _load_json(SLACK_BENCH)
 
         for test in suite["tests"]:
-            spec = {"version": "0.1", "assertions": test["assertions"]}
-            if "ignore_fields" in suite:
-                spec["ignore_fields"] = suite["ignore_fields"]
-
             try:
-                compiled = compiler.compile(spec)
                 # Ensure engine can be instantiated
-                engine = AssertionEngine(compiled)
+                engine = _compile_engine(test["assertions"])
                 assert engine is not None
             except Exception as e:
                 pytest.fail(
@@ -665,9 +504,7 @@ class TestAssertionEngineSmoke:
             ],
         }
 
-        compiler = DSLCompiler()
-        compiled = compiler.compile(spec)
-        engine = AssertionEngine(compiled)
+        engine = AssertionEngine(_COMPILER.compile(spec))
         result = engine.evaluate(diff)
 
         assert result["passed"] is True
@@ -11,6 +11,7 @@ from .models import (
     CreateTemplateFromEnvRequest,
     CreateTemplateFromEnvResponse,
     DeleteEnvResponse,
+    DeleteEnvsResponse,
     TestResultResponse,
 )
 from .code_executor import (
@@ -39,6 +40,7 @@ __all__ = [
     "CreateTemplateFromEnvRequest",
     "CreateTemplateFromEnvResponse",
     "DeleteEnvResponse",
+    "DeleteEnvsResponse",
     "TestResultResponse",
     # Executors
     "BaseExecutorProxy",
@@ -1,6 +1,9 @@
 import os
+from typing import Self
 from uuid import UUID
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .models import (
     InitEnvRequestBody,
     InitEnvResponse,
@@ -9,6 +12,8 @@ from .models import (
     TemplateEnvironmentDetail,
     CreateTestSuiteRequest,
     CreateTestSuiteResponse,
+    CreateTestSuitesRequest,
+    CreateTestSuitesResponse,
     TestSuiteDetail,
     Test,
     CreateTemplateFromEnvRequest,
@@ -24,17 +29,43 @@ from .models import (
     DiffRunRequest,
     DiffRunResponse,
     DeleteEnvResponse,
+    DeleteEnvsResponse,
 )
 
 
 class AgentDiff:
-    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        session: requests.Session | None = None,
+    ):
         self.api_key = api_key or os.getenv("AGENT_DIFF_API_KEY")
         self.base_url = (
             base_url
             if base_url is not None
             else (os.getenv("AGENT_DIFF_BASE_URL") or "http://localhost:8000")
         )
+        # One pooled session so consecutive calls reuse keep-alive connections.
+        # Callers may pass their own, e.g. to size the pool differently.
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=2, pool_maxsize=8, max_retries=Retry(total=0)
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _headers(self) -> dict[str, str]:
         """Build request headers, including API key if provided."""
@@ -49,7 +80,7 @@ class AgentDiff:
         """Initialize an isolated environment. Pass InitEnvRequestBody."""
         if request is None:
             request = InitEnvRequestBody(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/initEnv",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -64,7 +95,7 @@ class AgentDiff:
         """Create template from environment. Pass CreateTemplateFromEnvRequest."""
         if request is None:
             request = CreateTemplateFromEnvRequest(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/templates/from-environment",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -73,9 +104,18 @@ class AgentDiff:
         response.raise_for_status()
         return CreateTemplateFromEnvResponse.model_validate(response.json())
 
-    def list_templates(self) -> TemplateEnvironmentListResponse:
-        response = requests.get(
+    def list_templates(
+        self, service: str | None = None, name: str | None = None
+    ) -> TemplateEnvironmentListResponse:
+        """List visible templates, optionally filtered by service and/or name."""
+        params = {}
+        if service:
+            params["service"] = service
+        if name:
+            params["name"] = name
+        response = self._session.get(
             f"{self.base_url}/api/platform/templates",
+            params=params,
             headers=self._headers(),
             timeout=5,
         )
@@ -83,7 +123,7 @@ class AgentDiff:
         return TemplateEnvironmentListResponse.model_validate(response.json())
 
     def get_template(self, template_id: UUID) -> TemplateEnvironmentDetail:
-        response = requests.get(
+        response = self._session.get(
             f"{self.base_url}/api/platform/templates/{template_id}",
             headers=self._headers(),
             timeout=5,
@@ -92,7 +132,7 @@ class AgentDiff:
         return TemplateEnvironmentDetail.model_validate(response.json())
 
     def list_test_suites(self) -> TestSuiteListResponse:
-        response = requests.get(
+        response = self._session.get(
             f"{self.base_url}/api/platform/testSuites",
             headers=self._headers(),
             timeout=5,
@@ -116,7 +156,7 @@ class AgentDiff:
             TestSuiteDetail: Full suite details when expand=True
         """
         query = "?expand=tests" if expand else ""
-        response = requests.get(
+        response = self._session.get(
             f"{self.base_url}/api/platform/testSuites/{suite_id}{query}",
             headers=self._headers(),
             timeout=5,
@@ -133,7 +173,7 @@ class AgentDiff:
         tid = test_id or kwargs.get("testId")
         if not tid:
             raise ValueError("test_id or testId required")
-        response = requests.get(
+        response = self._session.get(
             f"{self.base_url}/api/platform/tests/{tid}",
             headers=self._headers(),
             timeout=5,
@@ -144,7 +184,7 @@ class AgentDiff:
     def create_tests(
         self, suite_id: UUID, request: CreateTestsRequest
     ) -> CreateTestsResponse:
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/testSuites/{suite_id}/tests",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -164,7 +204,7 @@ class AgentDiff:
         """Create test suite. Pass CreateTestSuiteRequest."""
         if request is None:
             request = CreateTestSuiteRequest(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/testSuites",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -173,6 +213,20 @@ class AgentDiff:
         response.raise_for_status()
         return CreateTestSuiteResponse.model_validate(response.json())
 
+    def create_test_suites(
+        self, suites: list[CreateTestSuiteRequest]
+    ) -> CreateTestSuitesResponse:
+        """Create several test suites (and their tests) in one request."""
+        request = CreateTestSuitesRequest(testSuites=suites)
+        response = self._session.post(
+            f"{self.base_url}/api/platform/testSuites/bulk",
+            json=request.model_dump(mode="json"),
+            headers=self._headers(),
+            timeout=30,
+        )
+        response.raise_for_status()
+        return CreateTestSuitesResponse.model_validate(response.json())
+
     def get_results_for_run(
         self, run_id: str | None = None, **kwargs
     ) -> TestResultResponse:
@@ -180,7 +234,7 @@ class AgentDiff:
         rid = run_id or kwargs.get("runId")
         if not rid:
             raise ValueError("run_id or runId required")
-        response = requests.get(
+        response = self._session.get(
             f"{self.base_url}/api/platform/results/{rid}",
             headers=self._headers(),
             timeout=10,
@@ -193,7 +247,7 @@ class AgentDiff:
         eid = env_id or kwargs.get("envId")
         if not eid:
             raise ValueError("env_id or envId required")
-        response = requests.delete(
+        response = self._session.delete(
             f"{self.base_url}/api/platform/env/{eid}",
             headers=self._headers(),
             timeout=10,
@@ -201,13 +255,24 @@ class AgentDiff:
         response.raise_for_status()
         return DeleteEnvResponse.model_validate(response.json())
 
+    def delete_envs(self, env_ids: list[str]) -> DeleteEnvsResponse:
+        """Delete several environments in one request."""
+        response = self._session.post(
+            f"{self.base_url}/api/platform/deleteEnvs",
+            json={"environmentIds": [str(env_id) for env_id in env_ids]},
+            headers=self._headers(),
+            timeout=30,
+        )
+        response.raise_for_status()
+        return DeleteEnvsResponse.model_validate(response.json())
+
     def start_run(
         self, request: StartRunRequest | None = None, **kwargs
     ) -> StartRunResponse:
         """Start a test run (takes initial environment snapshot). Pass StartRunRequest (envID or testID)."""
         if request is None:
             request = StartRunRequest(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/startRun",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -222,7 +287,7 @@ class AgentDiff:
         """Evaluate a test run (computes diff and compares to expected output in test suite). Pass EndRunRequest or runId."""
         if request is None:
             request = EndRunRequest(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/evaluateRun",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -237,7 +302,7 @@ class AgentDiff:
         """Compute diff. Pass DiffRunRequest or kwargs (env_id, run_id, before_suffix)."""
         if request is None:
             request = DiffRunRequest(**kwargs)
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/platform/diffRun",
             json=request.model_dump(mode="json"),
             headers=self._headers(),
@@ -48,6 +48,15 @@ class CreateTestSuiteResponse(BaseModel):
     name: str
     description: str
     visibility: Literal["public", "private"]
+    tests: List[Test] = []
+
+
+class CreateTestSuitesRequest(BaseModel):
+    testSuites: List[CreateTestSuiteRequest]
+
+
+class CreateTestSuitesResponse(BaseModel):
+    testSuites: List[CreateTestSuiteResponse]
 
 
 class TestItem(BaseModel):
@@ -133,6 +142,8 @@ class InitEnvResponse(BaseModel):
     service: str
     environmentUrl: str
     expiresAt: Optional[datetime]
+    status: Optional[str] = None
+    impersonateUserId: Optional[str] = None
 
 
 class DeleteEnvRequest(BaseModel):
@@ -189,6 +200,10 @@ class DeleteEnvResponse(BaseModel):
     status: str
 
 
+class DeleteEnvsResponse(BaseModel):
+    environments: List[DeleteEnvResponse]
+
+
 class CreateTemplateFromEnvRequest(BaseModel):
     environmentId: str
     service: Literal["slack", "linear"]
@@ -26,6 +26,8 @@ export interface InitEnvResponse {
   expiresAt: Date;
   schemaName: string;
   service: Service;
+  status?: string;
+  impersonateUserId?: string;
   token?: string;
 }
 